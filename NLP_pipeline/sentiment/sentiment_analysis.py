@@ -5,31 +5,72 @@ import nltk
 import json
 import os
 import glob
-from nltk.sentiment import SentimentIntensityAnalyzer
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from multiprocessing import Pool
 from nltk.corpus import stopwords
 import re, string, glob
 
-nltk.download('vader_lexicon')
-nltk.download('stopwords')
+# Prefer the compiled VADER port (same lexicon, rules and score keys) when installed
+try:
+    from vader_sentiment_rust import SentimentIntensityAnalyzer
+    VADER_BACKEND = 'rust'
+except ImportError:
+    from nltk.sentiment import SentimentIntensityAnalyzer
+    VADER_BACKEND = 'nltk'
+
+# Arrow-backed strings keep titles in one contiguous buffer for the .str passes
+try:
+    import pyarrow  # noqa: F401
+    TITLE_DTYPE = 'string[pyarrow]'
+except ImportError:
+    TITLE_DTYPE = 'string'
+
+try:
+    import cudf
+    CUDF_AVAILABLE = True
+except ImportError:
+    CUDF_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+def _ensure_nltk():
+    # Only hit the network when the corpora are missing; pool workers import this module too
+    for resource, package in (('sentiment/vader_lexicon.zip', 'vader_lexicon'), ('corpora/stopwords', 'stopwords')):
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            nltk.download(package, quiet=True)
+
+_ensure_nltk()
 
 sia = SentimentIntensityAnalyzer()
+STOPWORDS = frozenset(stopwords.words('english'))
 
-def load_data_from_directory(directory_path):
-    data_list = []
-    
-    json_files = glob.glob(os.path.join(directory_path, "*.json"))
-    
-    for file_path in json_files:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            data_list.append(data)
-    
-    return data_list
+def _load_one(file_path):
+    with open(file_path, 'rb') as f:
+        return _json_loads(f.read())
 
-data_dir = r'C:\Users\DELL\credtech\data_ingestion\unstructured_data\data\yahoo_finance'
-all_data = load_data_from_directory(data_dir)
+def iter_records(directory_path, max_workers=32):
+    json_files = glob.glob(os.path.join(directory_path, "*.json"))
+    if not json_files:
+        return
+    # File reads release the GIL, so threads overlap disk latency across files
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(json_files))) as executor:
+        yield from executor.map(_load_one, json_files)
 
-df = pd.DataFrame(all_data)
+def load_data_from_directory(directory_path):
+    return list(iter_records(directory_path))
 
 def convert_tweets_to_dataframe(file_path):
     with open(file_path, "r", encoding="utf-8") as f:
@@ -45,7 +86,6 @@ chat_words = {
     'AFK':'Away From Keyboard',
     'ASAP':'As Soon As Possible',
     'FYI': 'For Your Information',
-    'ASAP': 'As Soon As Possible',
     'BRB': 'Be Right Back',
     'BTW': 'By The Way',
     'OMG': 'Oh My God',
@@ -58,86 +98,208 @@ chat_words = {
     'TMI': 'Too Much Information',
     'IMHO': 'In My Humble Opinion',
     'ICYMI': 'In Case You Missed It',
-    'AFAIK': 'As Far As I Know',
-    'BTW': 'By The Way',
     'FAQ': 'Frequently Asked Questions',
     'TGIF': 'Thank God It is Friday',
     'FYA': 'For Your Action',
-    'ICYMI': 'In Case You Missed It',
 }
 
-def replace_chat_words(text):
-    for word, replacement in chat_words.items():
-        text = text.replace(word, replacement)
-    return text
+# Duplicate keys in the literal are silently collapsed; fail loudly instead
+assert len(chat_words) == len({k.upper() for k in chat_words}), "chat_words has duplicate abbreviations"
 
-df['title'] = df['title'].apply(replace_chat_words)
+_CHAT_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, chat_words)) + r')\b')
 
-def remove_html_tags(text):
-    pattern = re.compile('<.*?>')
-    return pattern.sub(r'', text)
+def _expand_chat_word(match):
+    return chat_words[match.group(0)]
 
-df['title'] = df['title'].apply(remove_html_tags)
+_HTML_RE = re.compile('<.*?>')
 
-def remove_url(text):
-    pattern = re.compile(r'https?://\S+|www\.\S+')
-    return pattern.sub(r'', text)
-
-df['title'] = df['title'].apply(remove_url)
+_URL_RE = re.compile(r'https?://\S+|www\.\S+')
 
 exclude = string.punctuation
-def remove_punc(text):
-    for char in exclude:
-        text = text.replace(char , '')
-    return text
-
-df['title'] = df['title'].apply(remove_punc)
-
-def remove_emoji(text):
-    emoji_pattern = re.compile("["
-                        u"\U0001F600-\U0001F64F" 
-                        u"\U0001F300-\U0001F5FF"  
-                        u"\U0001F680-\U0001F6FF"  
-                        u"\U0001F1E0-\U0001F1FF" 
-                        u"\U00002702-\U000027B0"
-                        u"\U000024C2-\U0001F251"
-                        "]+", flags=re.UNICODE)
-    return emoji_pattern.sub(r'', text)
-
-df['title'] = df['title'].apply(remove_emoji)
+_PUNC_TABLE = str.maketrans('', '', exclude)
+
+_EMOJI_RE = re.compile("["
+                       u"\U0001F600-\U0001F64F"
+                       u"\U0001F300-\U0001F5FF"
+                       u"\U0001F680-\U0001F6FF"
+                       u"\U0001F1E0-\U0001F1FF"
+                       u"\U00002702-\U000027B0"
+                       u"\U000024C2-\U0001F251"
+                       "]+", flags=re.UNICODE)
+
+# HTML tags and URLs come first in the alternation so their inner punctuation
+# is consumed with them, matching the order the separate passes used to run in.
+_CLEAN_RE = re.compile('|'.join([
+    _HTML_RE.pattern,
+    _URL_RE.pattern,
+    '[' + re.escape(exclude) + ']',
+    _EMOJI_RE.pattern,
+]), flags=re.UNICODE)
 
 
 def remove_stopwords(text):
-    new_text = []
-    for word in text.split():
-        if word in stopwords.words('english'):
-            new_text.append('')
-        else:
-            new_text.append(word)
-    x = new_text[:]
-    new_text.clear()
-    return " ".join(x)
-
-df['title'] = df['title'].apply(remove_stopwords)
-
-
-
-df[['neg', 'neu', 'pos', 'compound']] = df['title'].apply(
-    lambda x: pd.Series(sia.polarity_scores(x)) if pd.notna(x) else pd.Series([0, 0, 0, 0])
-)
-
-df['sentiment'] = df['compound'].apply(
-    lambda x: 'positive' if x >= 0.05 else ('negative' if x <= -0.05 else 'neutral')
-)
-
-
-positive_news = df[df['sentiment'] == 'positive'].nlargest(3, 'compound')
-for idx, row in positive_news.iterrows():
-    print(f"{row['compound']:.3f} | {row['title']}\n")
-
-negative_news = df[df['sentiment'] == 'negative'].nsmallest(3, 'compound')
-for idx, row in negative_news.iterrows():
-    print(f"{row['compound']:.3f} | {row['title']}")
-
-
-
+    return " ".join(word for word in text.split() if word not in STOPWORDS)
+
+_MARKUP_RE = re.compile(_HTML_RE.pattern + '|' + _URL_RE.pattern)
+
+# Bounded: the corpus is arbitrary, so the caches hold the most recent distinct titles rather than all of them
+CLEAN_CACHE_SIZE = 65536
+
+@lru_cache(maxsize=CLEAN_CACHE_SIZE)
+def clean_title(text):
+    text = _CHAT_RE.sub(_expand_chat_word, text)
+    if text.isascii():
+        # ASCII text cannot contain emoji, so only markup needs the regex engine;
+        # punctuation goes through the C-level translate table.
+        text = _MARKUP_RE.sub('', text).translate(_PUNC_TABLE)
+    else:
+        text = _CLEAN_RE.sub('', text)
+    return remove_stopwords(text)
+
+def _build_hyperscan_db():
+    # Hyperscan reports every match end, so the lazy HTML pattern is spelled as a
+    # negated class to keep a tag from spanning to the next '>'.
+    expressions = [
+        rb'<[^>\n]*>',
+        _URL_RE.pattern.encode(),
+        ('[' + re.escape(exclude) + ']').encode(),
+        _EMOJI_RE.pattern.encode('utf-8'),
+    ]
+    flags = hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    db = hyperscan.Database()
+    db.compile(expressions=expressions, ids=list(range(len(expressions))),
+               elements=len(expressions), flags=[flags] * len(expressions))
+    return db
+
+_HS_DB = _build_hyperscan_db() if HYPERSCAN_AVAILABLE else None
+
+def strip_with_hyperscan(text):
+    data = text.encode('utf-8')
+    spans = []
+
+    def on_match(pattern_id, start, end, flags, context):
+        spans.append((start, end))
+
+    _HS_DB.scan(data, match_event_handler=on_match)
+    if not spans:
+        return text
+
+    spans.sort()
+    out = bytearray()
+    pos = 0
+    for start, end in spans:
+        if start > pos:
+            out += data[pos:start]
+        pos = max(pos, end)
+    out += data[pos:]
+    return out.decode('utf-8')
+
+def clean_titles_gpu(titles):
+    gpu = cudf.Series(titles.tolist())
+    # Emoji are kept out of the markup alternation to avoid one pathological regex compile
+    gpu = gpu.str.replace([_HTML_RE.pattern, _URL_RE.pattern], ['', ''], regex=True)
+    gpu = gpu.str.replace(_EMOJI_RE.pattern, '', regex=True)
+    gpu = gpu.str.translate({ord(c): None for c in exclude})
+    gpu = gpu.str.replace_tokens(list(STOPWORDS), '')
+    # Collapse the gaps left by dropped tokens so output matches remove_stopwords' single spaces
+    gpu = gpu.str.normalize_spaces()
+    cleaned = gpu.to_pandas()
+    cleaned.index = titles.index
+    return cleaned.astype(titles.dtype)
+
+
+SCORE_COLUMNS = ['neg', 'neu', 'pos', 'compound']
+SENTIMENT_LABELS = ['negative', 'neutral', 'positive']
+_EMPTY_SCORES = dict.fromkeys(SCORE_COLUMNS, 0.0)
+
+# Feeds repeat headlines across sources, so identical titles are scored once per process
+@lru_cache(maxsize=CLEAN_CACHE_SIZE)
+def _score_cached(text):
+    return sia.polarity_scores(text)
+
+def polarity_scores(text):
+    return _score_cached(text) if isinstance(text, str) else _EMPTY_SCORES
+
+# Scores only feed threshold checks and top-k printing, so float32 is plenty
+SCORE_DTYPE = np.float32
+
+def score_titles(titles):
+    if hasattr(sia, 'polarity_scores_batch'):
+        # One FFI call for the whole column; non-strings still score zero
+        scores = np.zeros((len(titles), len(SCORE_COLUMNS)), dtype=SCORE_DTYPE)
+        is_text = np.fromiter((isinstance(t, str) for t in titles), dtype=bool, count=len(titles))
+        if is_text.any():
+            scores[is_text] = sia.polarity_scores_batch([t for t in titles if isinstance(t, str)])
+        return scores
+    scores = np.empty((len(titles), len(SCORE_COLUMNS)), dtype=SCORE_DTYPE)
+    for i, title in enumerate(titles):
+        score = polarity_scores(title)
+        scores[i] = [score[col] for col in SCORE_COLUMNS]
+    return scores
+
+def score_titles_parallel(titles, processes=None):
+    if VADER_BACKEND == 'rust':
+        return score_titles(titles)
+    # Worker caches are not shared, so collapse duplicate titles before fanning out
+    unique_titles = list(dict.fromkeys(titles))
+    processes = processes or os.cpu_count() or 1
+    chunksize = max(1, len(unique_titles) // (processes * 8))
+    with Pool(processes) as pool:
+        rows = dict(zip(unique_titles, pool.map(polarity_scores, unique_titles, chunksize=chunksize)))
+    scores = np.empty((len(titles), len(SCORE_COLUMNS)), dtype=SCORE_DTYPE)
+    for i, title in enumerate(titles):
+        score = rows[title]
+        scores[i] = [score[col] for col in SCORE_COLUMNS]
+    return scores
+
+def top_k_indices(values, k):
+    k = min(k, len(values))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    idx = np.argpartition(-values, k - 1)[:k]
+    return idx[np.argsort(-values[idx])]
+
+
+if __name__ == '__main__':
+    data_dir = r'C:\Users\DELL\credtech\data_ingestion\unstructured_data\data\yahoo_finance'
+    df = pd.DataFrame(iter_records(data_dir))
+    df['title'] = df['title'].astype(TITLE_DTYPE)
+
+    # Empty and missing titles score zero, so keep them out of the cleaning and scoring passes
+    has_title = (df['title'].str.len() > 0).fillna(False).to_numpy(dtype=bool)
+    work = df.loc[has_title, 'title']
+
+    if CUDF_AVAILABLE:
+        work = work.str.replace(_CHAT_RE, _expand_chat_word, regex=True)
+        work = clean_titles_gpu(work)
+    elif HYPERSCAN_AVAILABLE:
+        work = work.str.replace(_CHAT_RE, _expand_chat_word, regex=True)
+        # remove_stopwords also collapses the whitespace left by stripping, matching clean_title's output
+        work = work.map(strip_with_hyperscan).map(remove_stopwords)
+    else:
+        # clean_title does chat expansion, markup/punctuation/emoji stripping and stopwords in one call,
+        # with ASCII titles skipping the emoji regex; syndicated headlines repeat, so each distinct one is cleaned once
+        titles = work.unique()
+        work = work.map(dict(zip(titles, map(clean_title, titles))))
+    df.loc[has_title, 'title'] = work
+
+    df[SCORE_COLUMNS] = np.zeros((len(df), len(SCORE_COLUMNS)), dtype=SCORE_DTYPE)
+    df.loc[has_title, SCORE_COLUMNS] = score_titles_parallel(work.tolist())
+
+    compound = df['compound'].to_numpy()
+    df['sentiment'] = pd.Categorical(
+        np.select([compound >= 0.05, compound <= -0.05], ['positive', 'negative'], default='neutral'),
+        categories=SENTIMENT_LABELS,
+    )
+
+    titles = df['title'].to_numpy()
+
+    positive = (df['sentiment'] == 'positive').to_numpy()
+    pos_compound, pos_titles = compound[positive], titles[positive]
+    for i in top_k_indices(pos_compound, 3):
+        print(f"{pos_compound[i]:.3f} | {pos_titles[i]}\n")
+
+    negative = (df['sentiment'] == 'negative').to_numpy()
+    neg_compound, neg_titles = compound[negative], titles[negative]
+    for i in top_k_indices(-neg_compound, 3):
+        print(f"{neg_compound[i]:.3f} | {neg_titles[i]}")
@@ -1,16 +1,44 @@
-from fastapi import FastAPI, Depends, HTTPException, status, Path
+from fastapi import FastAPI, Depends, HTTPException, status, Path, Query, Request, Response
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import text
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import text, select, insert, tuple_, func, distinct, JSON
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError, IntegrityError
+from typing import Dict, Any, List, Optional
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+try:
+    from fastapi_cache import FastAPICache
+    from fastapi_cache.backends.inmemory import InMemoryBackend
+    from fastapi_cache.backends.redis import RedisBackend
+    from redis import asyncio as aioredis
+    FASTAPI_CACHE_AVAILABLE = True
+except ImportError:
+    FASTAPI_CACHE_AVAILABLE = False
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
 try:
     # Package-relative imports
-    from .storage import SessionLocal, init_db  # type: ignore
-    from .models import CompanyFundamentals, StockPrice, EconomicIndicator, RegulatoryFiling  # type: ignore
+    from .responses import DefaultJSONResponse  # type: ignore
+    from .storage import AsyncSessionLocal, async_engine, init_db, dump_json_column, insert_ignoring_duplicates  # type: ignore
+    from .models import CompanyFundamentals, StockPrice, EconomicIndicator, RegulatoryFiling, TableCount  # type: ignore
     from .sources.yahoo_finance_features import fetch_credit_features  # type: ignore
-    from .sources.sec_edgar import fetch_sec_filings  # type: ignore
+    from .sources.sec_edgar import fetch_sec_filings, fetch_sec_filings_async, SEC_RATE_LIMIT  # type: ignore
     from .sources.fred_series import fetch_fred_series, FredFetchError  # type: ignore
     from .config import Config  # type: ignore
     from .socket_server import socket_app as socketio_app  # type: ignore
@@ -19,24 +47,59 @@ except ImportError:  # Fallback when run as a script from the structured_data di
     _here = pathlib.Path(__file__).resolve().parent
     if str(_here) not in sys.path:
         sys.path.insert(0, str(_here))  # ensure local modules precede site-packages
-    from storage import SessionLocal, init_db  # type: ignore
-    from models import CompanyFundamentals, StockPrice, EconomicIndicator, RegulatoryFiling  # type: ignore
+    from responses import DefaultJSONResponse  # type: ignore
+    from storage import AsyncSessionLocal, async_engine, init_db, dump_json_column, insert_ignoring_duplicates  # type: ignore
+    from models import CompanyFundamentals, StockPrice, EconomicIndicator, RegulatoryFiling, TableCount  # type: ignore
     from sources.yahoo_finance_features import fetch_credit_features  # type: ignore
-    from sources.sec_edgar import fetch_sec_filings  # type: ignore
+    from sources.sec_edgar import fetch_sec_filings, fetch_sec_filings_async, SEC_RATE_LIMIT  # type: ignore
     from sources.fred_series import fetch_fred_series, FredFetchError  # type: ignore
     from config import Config  # type: ignore
     from socket_server import socket_app as socketio_app  # type: ignore
-from pydantic import BaseModel, Field
-from datetime import datetime, UTC, timezone
-from contextlib import asynccontextmanager
-import uuid
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from datetime import datetime, UTC, timedelta, timezone
+from decimal import Decimal
+from contextlib import asynccontextmanager, nullcontext
+import asyncio
+import atexit
+import aiohttp
+from aiolimiter import AsyncLimiter
+import base64
+import hashlib
+import json
+import numpy as np
+import pandas as pd
 import logging
-from typing import Dict, Any, List, Optional
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+import numbers
+import queue
+import re
+import secrets
+from logging.handlers import QueueHandler, QueueListener
+
+# Configure logging; handlers run on a listener thread so request handlers only enqueue records
+logging.basicConfig(level=Config.LOG_LEVEL)
+_root_logger = logging.getLogger()
+_log_queue = queue.SimpleQueue()
+log_listener = QueueListener(_log_queue, *_root_logger.handlers, respect_handler_level=True)
+_root_logger.handlers = [QueueHandler(_log_queue)]
+log_listener.start()
+atexit.register(log_listener.stop)  # flush queued records on interpreter exit
 logger = logging.getLogger(__name__)
 
+# Fan-out limits for multi-ticker ingestion
+YAHOO_FETCH_CONCURRENCY = 8  # yfinance is blocking, so this bounds worker threads
+HTTP_FETCH_CONCURRENCY = 64
+# Request budget for Yahoo Finance, shared by every ingest route and split across the API workers
+# like SEC_RATE_LIMIT: each process gets YAHOO_PROCESS_BURST requests per period
+YAHOO_REQUESTS_PER_MINUTE = 120
+YAHOO_PROCESSES = max(1, Config.API_WORKERS)
+YAHOO_PROCESS_BURST = max(1, YAHOO_REQUESTS_PER_MINUTE // YAHOO_PROCESSES)
+YAHOO_RATE_LIMIT = AsyncLimiter(YAHOO_PROCESS_BURST, 60 * YAHOO_PROCESS_BURST * YAHOO_PROCESSES / YAHOO_REQUESTS_PER_MINUTE)
+# Multi-ticker ingest pipeline: queue bounds and writer batching
+PIPELINE_FETCH_QUEUE = 64
+PIPELINE_WRITE_QUEUE = 8
+PIPELINE_FLUSH_ROWS = 1000
+PIPELINE_FLUSH_SECONDS = 0.2
+
 # New tag metadata for reorganized Swagger UI
 TAGS_METADATA = [
     {"name": "Auto Fetch & Store", "description": "Fetch external data (Yahoo, SEC, FRED) and store in DB."},
@@ -52,6 +115,19 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 Starting CredTech Structured Data API")
     init_db()
     logger.info("✅ Database initialized")
+    if FASTAPI_CACHE_AVAILABLE:
+        if Config.REDIS_URL:
+            FastAPICache.init(RedisBackend(aioredis.from_url(Config.REDIS_URL)), prefix="credtech")
+        else:
+            FastAPICache.init(InMemoryBackend(), prefix="credtech")
+        logger.info("✅ Response cache initialized")
+        try:
+            async with AsyncSessionLocal() as db:
+                await refresh_stats(db)
+        except Exception as e:
+            logger.warning("Stats cache warm-up skipped: %s", e)
+    if app.openapi_url:
+        app.openapi()  # FastAPI caches the schema on the app; build it now instead of on the first /docs hit
     yield
     logger.info("🛑 Shutting down CredTech Structured Data API")
 
@@ -61,34 +137,243 @@ app = FastAPI(
     description="Fetch, store, and retrieve structured financial data for credit risk assessment",
     version="1.0.0",
     openapi_tags=TAGS_METADATA,
+    default_response_class=DefaultJSONResponse,
+    docs_url=Config.DOCS_URL,
+    redoc_url=Config.REDOC_URL,
+    openapi_url=Config.OPENAPI_URL,
     lifespan=lifespan
 )
 
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=Config.CORS_ORIGINS,
+    allow_credentials=Config.CORS_CREDENTIALS,
+    allow_methods=["GET", "HEAD", "POST"],
+    allow_headers=["Authorization", "Content-Type", "If-None-Match"],
+    expose_headers=["ETag", "X-Next-Cursor"],
+    max_age=86400,  # browsers reuse a preflight for a day
 )
 
-# Database dependency
-def get_db():
-    db = SessionLocal()
-    try:
+# Database dependencies
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+admin_bearer = HTTPBearer(auto_error=False)
+
+def require_admin(credentials: Optional[HTTPAuthorizationCredentials] = Depends(admin_bearer)):
+    """Allow the request only with `Authorization: Bearer <Config.ADMIN_TOKEN>`"""
+    if not Config.ADMIN_TOKEN:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin endpoints are disabled")
+    if credentials is None or not secrets.compare_digest(credentials.credentials.encode(), Config.ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin token",
+                            headers={"WWW-Authenticate": "Bearer"})
 
 # Utility functions
 def log_ingestion(data_type: str, count: int, source: str, identifier: str = ""):
-    logger.info(f"✅ INGESTED {count} {data_type} records from {source} {identifier}")
+    logger.info("✅ INGESTED %s %s records from %s %s", count, data_type, source, identifier)
+
+def dump_json(obj) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(jsonable_encoder(obj)).encode()
+
+def json_response(content, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Encode plain rows straight to JSON, skipping FastAPI's jsonable_encoder pass"""
+    return Response(content=dump_json(content), media_type="application/json", headers=headers)
+
+def select_columns(model):
+    """SELECT the model's table columns as plain rows, skipping ORM instance construction; generated columns
+    only repeat values already in the row, so they are left out"""
+    return select(*(c for c in model.__table__.columns if c.computed is None))
+
+async def fetch_rows(db: AsyncSession, query) -> List[Dict[str, Any]]:
+    return [dict(row) for row in (await db.execute(query)).mappings()]
+
+async def fetch_row(db: AsyncSession, query) -> Optional[Dict[str, Any]]:
+    row = (await db.execute(query)).mappings().first()
+    return dict(row) if row is not None else None
 
 def handle_database_error(e: Exception, operation: str):
     if isinstance(e, IntegrityError):
-        return JSONResponse(status_code=409, content={"error": "Data already exists", "operation": operation})
-    return JSONResponse(status_code=500, content={"error": str(e), "operation": operation})
+        return DefaultJSONResponse(status_code=409, content={"error": "Data already exists", "operation": operation})
+    return DefaultJSONResponse(status_code=500, content={"error": str(e), "operation": operation})
+
+def cache_backend():
+    """The fastapi-cache backend set up in lifespan, or None when fastapi-cache is not installed"""
+    return FastAPICache.get_backend() if FASTAPI_CACHE_AVAILABLE else None
+
+# The cache only ever saves work: if Redis is unreachable a read is a miss and a write is skipped,
+# so requests fall back to the database instead of failing
+async def cache_get(key: str) -> Optional[bytes]:
+    backend = cache_backend()
+    if backend is None:
+        return None
+    try:
+        return await backend.get(key)
+    except Exception as e:
+        logger.warning("Response cache read failed for %s: %s", key, e)
+        return None
+
+async def cache_set(key: str, value: bytes, expire: int):
+    backend = cache_backend()
+    if backend is None:
+        return
+    try:
+        await backend.set(key, value, expire=expire)
+    except Exception as e:
+        logger.warning("Response cache write failed for %s: %s", key, e)
+
+async def cache_clear(**kwargs):
+    """backend.clear(key=...) or (namespace=...), ignoring cache outages; entries then age out by TTL"""
+    backend = cache_backend()
+    if backend is None:
+        return
+    try:
+        await backend.clear(**kwargs)
+    except KeyError:
+        pass  # InMemoryBackend.clear(key=...) deletes without checking; an uncached key is nothing to drop
+    except Exception as e:
+        logger.warning("Response cache invalidation failed for %s: %s", kwargs, e)
+
+ETAG_LENGTH = 18  # quoted 16-digit hex; cache entries that carry one store it in front of the JSON body
+
+def body_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+def etag_response(request: Request, etag: str, body: bytes, headers: Dict[str, str],
+                  media_type: str = "application/json") -> Response:
+    """The body, or an empty 304 when the client's If-None-Match already names this ETag"""
+    headers = {"ETag": etag, **headers}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
+
+# Stored records never change, so their encoded JSON can be cached and validated by ETag
+async def cached_record(request: Request, key: str, load) -> Response:
+    """Serve a record from the response cache, answering a matching If-None-Match with 304"""
+    key = f"credtech:{key}"
+    payload = await cache_get(key)
+    if payload is None:
+        record = await load()  # raises 404 for unknown ids, which is not cached
+        payload = dump_json(record)
+        await cache_set(key, payload, Config.CACHE_TTL)
+    return etag_response(request, body_etag(payload), payload, {"Cache-Control": f"max-age={Config.CACHE_TTL}"})
+
+# Upstream data changes slowly relative to request rates; TTLs are per source (seconds)
+FETCH_CACHE_TTL = {"yahoo": 300, "sec": 3600, "fred": 60, "fundamentals": 60}
+FUNDAMENTALS_STREAM_THRESHOLD = 500  # /fundamentals pages above this many rows are streamed, not cached
+
+# Shaping and encoding a listing of this many rows takes long enough to hold up every other request on the loop
+OFF_LOOP_ROWS = 2000
+
+async def off_loop(build, rows: int, *args):
+    """build(*args), in a worker thread when it covers more than OFF_LOOP_ROWS rows"""
+    if rows > OFF_LOOP_ROWS:
+        return await asyncio.to_thread(build, *args)
+    return build(*args)
+
+async def cached_json(request: Request, key: str, ttl: int, load, media_type: str = "application/json") -> Response:
+    """Serve an endpoint's JSON from the response cache, with an ETag stored alongside so every worker
+    answers a matching If-None-Match with 304 without re-hashing; error responses returned by load are not cached.
+    load may return the body already encoded (bytes) or a JSON-able object."""
+    key = f"credtech:resp:{key}"
+    entry = await cache_get(key)
+    cache_status = "HIT"
+    if entry is None:
+        result = await load()
+        if isinstance(result, Response):
+            return result
+        payload = result if isinstance(result, bytes) else dump_json(result)
+        entry = body_etag(payload).encode() + payload
+        await cache_set(key, entry, ttl)
+        cache_status = "MISS"
+    return etag_response(request, entry[:ETAG_LENGTH].decode(), entry[ETAG_LENGTH:],
+                         {"Cache-Control": f"max-age={ttl}", "X-Cache": cache_status}, media_type)
+
+# Read-mostly listings are cached under a hash of the request path and query string and dropped after every
+# ingest, so identical requests skip both the query and the JSON encoding until the data changes
+READ_CACHE_NAMESPACE = "credtech:resp:read"
+READ_CACHE_TTL = 60
+
+def read_cache_key(request: Request) -> str:
+    return "read:" + hashlib.sha1(f"{request.url.path}?{request.url.query}".encode()).hexdigest()
+
+# Source fetchers are cached by their arguments so repeat ingests within the TTL skip the upstream call
+SOURCE_CACHE_TTL = {"yahoo": 300, "sec": 3600, "fred": 300}
+
+async def fetch_source(source: str, key: str, fetch, *args, limiter=None, nocache: bool = False, **kwargs):
+    """Run a blocking source fetcher in a thread, reusing its result for SOURCE_CACHE_TTL[source] seconds;
+    the limiter is only entered on a miss, and empty results are not cached"""
+    key = f"credtech:source:{source}:{key}"
+    if not nocache:
+        cached = await cache_get(key)
+        if cached is not None:
+            return orjson.loads(cached) if ORJSON_AVAILABLE else json.loads(cached)
+    async with limiter if limiter is not None else nullcontext():
+        result = await asyncio.to_thread(fetch, *args, **kwargs)
+    if result:
+        # Caching is best-effort: a payload the encoder rejects is returned uncached, not turned into a failed ingest
+        try:
+            payload = dump_json(result)
+        except Exception as e:
+            logger.warning("Source cache encode failed for %s: %s", key, e)
+        else:
+            await cache_set(key, payload, SOURCE_CACHE_TTL[source])
+    return result
+
+# Keyset pagination over (ingested_at, id), newest first
+def encode_cursor(row: Dict[str, Any]) -> str:
+    ingested_at = row["ingested_at"].isoformat() if row["ingested_at"] else None
+    return base64.urlsafe_b64encode(json.dumps([ingested_at, row["id"]]).encode()).decode()
+
+def decode_cursor(cursor: str):
+    try:
+        ingested_at, last_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(ingested_at), last_id
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def keyset_query(model, limit: int, cursor: Optional[str] = None):
+    query = select_columns(model).order_by(model.ingested_at.desc(), model.id.desc()).limit(limit)
+    if cursor:
+        ingested_at, last_id = decode_cursor(cursor)
+        query = query.where(tuple_(model.ingested_at, model.id) < (ingested_at, last_id))
+    return query
+
+async def fetch_page(db: AsyncSession, model, limit: int, cursor: Optional[str]) -> Response:
+    """Fetch one page and advertise the next cursor in the X-Next-Cursor header"""
+    rows = await fetch_rows(db, keyset_query(model, limit, cursor))
+    headers = {}
+    if len(rows) == limit and rows[-1]["ingested_at"] is not None:
+        headers["X-Next-Cursor"] = encode_cursor(rows[-1])
+    return json_response(rows, headers)
+
+def stream_rows(query, batch_size: int = 500, key: Optional[str] = None, page_size: Optional[int] = None) -> StreamingResponse:
+    """Stream query rows as a JSON array without loading them into memory. With key, the array is wrapped as
+    {key: [...], "next_cursor": ...}, the cursor (known only after the last row) set when a full page_size was sent."""
+    async def generate():
+        # The session lives inside the generator so it stays open while the body is sent
+        async with AsyncSessionLocal() as db:
+            result = await db.stream(query.execution_options(yield_per=batch_size))
+            yield b"[" if key is None else b"{" + dump_json(key) + b":["
+            count, last = 0, None
+            async for row in result.mappings():
+                last = dict(row)
+                yield (b"," if count else b"") + dump_json(last)
+                count += 1
+            if key is None:
+                yield b"]"
+            else:
+                next_cursor = encode_cursor(last) if count == page_size and last["ingested_at"] is not None else None
+                yield b'],"next_cursor":' + dump_json(next_cursor) + b"}"
+
+    return StreamingResponse(generate(), media_type="application/json")
+
+def stream_table(model, batch_size: int = 500) -> StreamingResponse:
+    """Stream a whole table as a JSON array without loading it into memory"""
+    return stream_rows(select_columns(model).order_by(model.ingested_at.desc(), model.id.desc()), batch_size)
 
 # Enhanced Pydantic models with validation
 class FundamentalsCreate(BaseModel):
@@ -96,17 +381,17 @@ class FundamentalsCreate(BaseModel):
     ticker: str = Field(..., description="Stock ticker symbol")
     fiscal_year: int = Field(..., description="Fiscal year")
     fiscal_quarter: Optional[str] = Field(None, description="Fiscal quarter (Q1, Q2, Q3, Q4)")
-    fundamentals: Dict[str, Any] = Field(..., description="Fundamentals data as JSON")
+    fundamentals: Dict[str, Any] = Field(..., min_length=1, description="Fundamentals data as JSON")
     source: str = Field(default="manual", description="Data source")
 
 class StockPriceCreate(BaseModel):
     ticker: str = Field(..., description="Stock ticker symbol")
     date: datetime = Field(..., description="Price date")
-    open: float = Field(..., description="Opening price")
-    close: float = Field(..., description="Closing price")
-    high: float = Field(..., description="High price")
-    low: float = Field(..., description="Low price")
-    volume: float = Field(..., description="Trading volume")
+    open: float = Field(..., ge=0, description="Opening price")
+    close: float = Field(..., ge=0, description="Closing price")
+    high: float = Field(..., ge=0, description="High price")
+    low: float = Field(..., ge=0, description="Low price")
+    volume: float = Field(..., ge=0, description="Trading volume")
     source: str = Field(default="manual", description="Data source")
 
 class FilingCreate(BaseModel):
@@ -114,7 +399,8 @@ class FilingCreate(BaseModel):
     ticker: str = Field(..., description="Stock ticker symbol")
     filing_type: str = Field(..., description="Filing type (10-K, 10-Q, etc.)")
     filing_date: datetime = Field(..., description="Filing date")
-    data: Dict[str, Any] = Field(..., description="Filing data as JSON")
+    data: Dict[str, Any] = Field(..., min_length=1, description="Filing data as JSON")
+    accession: Optional[str] = Field(default=None, description="Accession number; derived from the filing when omitted")
     source: str = Field(default="manual", description="Data source")
 
 class CompanyFundamentalsIn(BaseModel):
@@ -123,9 +409,17 @@ class CompanyFundamentalsIn(BaseModel):
     ticker: str = Field(..., min_length=1, max_length=10, description="Stock ticker symbol")
     fiscal_year: int = Field(..., ge=1900, le=2100, description="Fiscal year")
     fiscal_quarter: str = Field(..., description="Fiscal quarter")
-    fundamentals: Dict[str, Any] = Field(..., description="Fundamental metrics")
+    fundamentals: Dict[str, Any] = Field(..., min_length=1, description="Fundamental metrics")
     source: str = Field(..., min_length=1, description="Data source")
 
+class YahooBatchIngestRequest(BaseModel):
+    """Input model for multi-ticker Yahoo Finance ingestion"""
+    tickers: List[str] = Field(..., min_length=1, max_length=100, description="Stock ticker symbols")
+
+class BatchIngestRequest(YahooBatchIngestRequest):
+    """Input model for multi-ticker ingestion"""
+    filings_limit: int = Field(10, ge=0, le=100, description="Max SEC filings stored per ticker")
+
 # Response models
 class IngestionResponse(BaseModel):
     """Standard response model for data ingestion operations"""
@@ -141,128 +435,302 @@ class ErrorResponse(BaseModel):
     error_type: str = Field(..., description="Type of error")
     timestamp: datetime = Field(..., description="When the error occurred")
 
-def compute_financial_metrics(fundamentals_data: Dict[str, Any]) -> Dict[str, Optional[float]]:
-    """Compute comprehensive financial metrics following academic literature (Das et al., Tsai et al.)"""
-    metrics = {}
-    
-    try:
+# Batch scoring works on float matrices (rows=companies, cols=fields); NaN marks a missing value
+METRIC_FIELDS = ("net_income", "total_assets", "total_debt", "retained_earnings", "net_income_growth",
+                 "current_assets", "current_liabilities", "equity", "revenue_growth")
+RISK_FIELDS = ("current_ratio", "leverage_ratio", "total_revenue", "net_income", "revenue_growth",
+               "free_cash_flow", "total_debt")
+
+def is_number(value) -> bool:
+    """Real numbers including numpy scalars and Decimal (as returned by NUMERIC columns), but not booleans"""
+    return isinstance(value, (numbers.Real, Decimal)) and not isinstance(value, (bool, np.bool_))
+
+def numeric_matrix(records: List[Dict[str, Any]], fields) -> np.ndarray:
+    """Records as a float matrix; missing and non-numeric values become NaN"""
+    return np.array([[value if is_number(value) else np.nan
+                      for value in map(record.get, fields)] for record in records], dtype=float).reshape(len(records), len(fields))
+
+def ratio(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    """num / den, NaN unless both are present and non-zero (the same test as the dict-based truthiness checks)"""
+    valid = (num != 0) & (den != 0) & ~np.isnan(num) & ~np.isnan(den)
+    return np.divide(num, den, out=np.full(num.shape, np.nan), where=valid)
+
+def compute_financial_metrics_batch(arr: np.ndarray) -> Dict[str, np.ndarray]:
+    """Academic metrics for a METRIC_FIELDS matrix, one array per metric (Das et al., Tsai et al.)"""
+    col = dict(zip(METRIC_FIELDS, arr.T))
+    return {
         # Return on Assets (ROA) - rolling 4-quarter average to reduce seasonal effects
-        if fundamentals_data.get("net_income") and fundamentals_data.get("total_assets"):
-            try:
-                roa = (fundamentals_data["net_income"] / fundamentals_data["total_assets"]) * 100
-                metrics["roa"] = round(roa, 4)
-            except (ZeroDivisionError, TypeError):
-                metrics["roa"] = None
-        else:
-            metrics["roa"] = None
-            
+        "roa": np.round(ratio(col["net_income"], col["total_assets"]) * 100, 4),
         # Revenue Growth (RG) - rolling 4-quarter average
-        metrics["revenue_growth"] = fundamentals_data.get("revenue_growth")
-        
+        "revenue_growth": col["revenue_growth"],
         # Leverage (LEV) - ratio of total debt to total assets
-        if fundamentals_data.get("total_debt") and fundamentals_data.get("total_assets"):
-            try:
-                leverage = fundamentals_data["total_debt"] / fundamentals_data["total_assets"]
-                metrics["leverage"] = round(leverage, 4)
-            except (ZeroDivisionError, TypeError):
-                metrics["leverage"] = None
-        else:
-            metrics["leverage"] = None
-            
-        # Retaining earning ratio
-        if fundamentals_data.get("retained_earnings") and fundamentals_data.get("total_assets"):
-            try:
-                retained_earnings_ratio = fundamentals_data["retained_earnings"] / fundamentals_data["total_assets"]
-                metrics["retained_earnings_ratio"] = round(retained_earnings_ratio, 4)
-            except (ZeroDivisionError, TypeError):
-                metrics["retained_earnings_ratio"] = None
-        else:
-            metrics["retained_earnings_ratio"] = None
-            
+        "leverage": np.round(ratio(col["total_debt"], col["total_assets"]), 4),
+        "retained_earnings_ratio": np.round(ratio(col["retained_earnings"], col["total_assets"]), 4),
         # Net Income Growth (NIG) - rolling 4-quarter average
-        if fundamentals_data.get("net_income_growth") and fundamentals_data.get("total_assets"):
-            try:
-                nig = fundamentals_data["net_income_growth"] / fundamentals_data["total_assets"]
-                metrics["net_income_growth_normalized"] = round(nig, 4)
-            except (ZeroDivisionError, TypeError):
-                metrics["net_income_growth_normalized"] = None
-        else:
-            metrics["net_income_growth_normalized"] = None
-            
-        # Current ratio
-        if fundamentals_data.get("current_assets") and fundamentals_data.get("current_liabilities"):
-            try:
-                current_ratio = fundamentals_data["current_assets"] / fundamentals_data["current_liabilities"]
-                metrics["current_ratio"] = round(current_ratio, 4)
-            except (ZeroDivisionError, TypeError):
-                metrics["current_ratio"] = None
-        else:
-            metrics["current_ratio"] = None
-            
-        # Debt-to-equity (D/E)
-        if fundamentals_data.get("total_debt") and fundamentals_data.get("equity"):
-            try:
-                debt_to_equity = fundamentals_data["total_debt"] / fundamentals_data["equity"]
-                metrics["debt_to_equity"] = round(debt_to_equity, 4)
-            except (ZeroDivisionError, TypeError):
-                metrics["debt_to_equity"] = None
-        else:
-            metrics["debt_to_equity"] = None
-            
-        return metrics
-        
-    except Exception:
-        return {key: None for key in ["roa", "revenue_growth", "leverage", "retained_earnings_ratio", 
-                                     "net_income_growth_normalized", "current_ratio", "debt_to_equity"]}
+        "net_income_growth_normalized": np.round(ratio(col["net_income_growth"], col["total_assets"]), 4),
+        "current_ratio": np.round(ratio(col["current_assets"], col["current_liabilities"]), 4),
+        "debt_to_equity": np.round(ratio(col["total_debt"], col["equity"]), 4),
+    }
 
+def metrics_at(batch: Dict[str, np.ndarray], i: int) -> Dict[str, Optional[float]]:
+    """Row i of a metrics batch as a plain dict, NaN mapped back to None"""
+    return {key: None if np.isnan(values[i]) else float(values[i]) for key, values in batch.items()}
+
+# Single-company scoring (one request, one row) is dominated by NumPy call overhead on 1-element arrays;
+# with numba installed the same rules run as one compiled function over a METRIC_FIELDS vector
+METRIC_NAMES = ("roa", "revenue_growth", "leverage", "retained_earnings_ratio",
+                "net_income_growth_normalized", "current_ratio", "debt_to_equity")
+
+# The core Das et al. measures; data completeness is the share of these that are present
+COMPLETENESS_FIELDS = ("roa", "revenue_growth", "leverage", "retained_earnings_ratio")
+COMPLETENESS_PER_FIELD = 100.0 / len(COMPLETENESS_FIELDS)
+
+# Metrics with a generated column are read from it; the rest are extracted from the JSON by the database
+GENERATED_METRICS = {
+    "roa": CompanyFundamentals.roa_g,
+    "leverage": CompanyFundamentals.leverage_g,
+    "retained_earnings_ratio": CompanyFundamentals.retained_earnings_ratio_g,
+    "net_income_growth_normalized": CompanyFundamentals.net_income_growth_normalized_g,
+}
+
+def metric_columns():
+    return [GENERATED_METRICS.get(key, CompanyFundamentals.fundamentals[key]).label(key) for key in METRIC_NAMES]
+
+def strip_none(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop absent values; sparse fundamentals otherwise fill the academic responses with nulls"""
+    return {key: value for key, value in values.items() if value is not None}
+
+def missing_metrics(metrics: Dict[str, Any]) -> List[str]:
+    return [field for field in COMPLETENESS_FIELDS if metrics.get(field) is None]
+
+def completeness_score(missing: List[str]) -> float:
+    return (len(COMPLETENESS_FIELDS) - len(missing)) * COMPLETENESS_PER_FIELD
+
+def metric_vector(fundamentals_data: Dict[str, Any]) -> np.ndarray:
+    """One company's METRIC_FIELDS as a float64 vector, NaN for missing values"""
+    return numeric_matrix([fundamentals_data], METRIC_FIELDS)[0]
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def ratio_scalar(num: float, den: float) -> float:
+        if num == 0.0 or den == 0.0 or np.isnan(num) or np.isnan(den):
+            return np.nan
+        return num / den
+
+    @njit(cache=True)
+    def metrics_kernel(x: np.ndarray) -> np.ndarray:
+        """compute_financial_metrics_batch for one METRIC_FIELDS vector, in METRIC_NAMES order"""
+        out = np.empty(7)
+        out[0] = ratio_scalar(x[0], x[1]) * 100
+        out[2] = ratio_scalar(x[2], x[1])
+        out[3] = ratio_scalar(x[3], x[1])
+        out[4] = ratio_scalar(x[4], x[1])
+        out[5] = ratio_scalar(x[5], x[6])
+        out[6] = ratio_scalar(x[2], x[7])
+        np.around(out, 4, out)
+        out[1] = x[8]  # revenue growth is passed through unrounded
+        return out
+
+    metrics_kernel(np.full(len(METRIC_FIELDS), np.nan))  # compile (or load from cache) at import, not on the first request
+
+def compute_financial_metrics(fundamentals_data: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    """Compute comprehensive financial metrics following academic literature (Das et al., Tsai et al.)"""
+    if NUMBA_AVAILABLE:
+        values = metrics_kernel(metric_vector(fundamentals_data)).tolist()
+        return {key: None if np.isnan(value) else value for key, value in zip(METRIC_NAMES, values)}
+    return metrics_at(compute_financial_metrics_batch(numeric_matrix([fundamentals_data], METRIC_FIELDS)), 0)
+
+# Score bands per factor: thresholds are inclusive lower bounds of the bands after the first, so a value
+# scores POINTS[k] where k = number of thresholds <= value. Strict "> t" rules use the next float above t.
+def strictly_above(t: float) -> float:
+    return float(np.nextafter(t, np.inf))
+
+RISK_BANDS = {
+    "current_ratio": (np.array([1.0, 2.0]), np.array([-10.0, 5.0, 10.0])),  # liquidity
+    "leverage_ratio": (np.array([0.5, 1.5]), np.array([10.0, 2.0, -10.0])),  # debt to equity
+    "margin": (np.array([strictly_above(0.05), strictly_above(0.15)]), np.array([-5.0, 5.0, 10.0])),  # net income margin
+    "revenue_growth": (np.array([0.0, strictly_above(0.15)]), np.array([-5.0, 0.0, 5.0])),
+    "coverage": (np.array([0.05, strictly_above(0.3)]), np.array([-5.0, 0.0, 5.0])),  # free cash flow to debt
+}
+
+def band_points(values: np.ndarray, factor: str) -> np.ndarray:
+    """Points for each value under RISK_BANDS[factor]; a missing value scores 0"""
+    thresholds, points = RISK_BANDS[factor]
+    # NaN sorts after every threshold, so its index is still in range before being masked out
+    return np.where(np.isnan(values), 0.0, points[np.searchsorted(thresholds, values, side="right")])
+
+def compute_risk_score_batch(arr: np.ndarray) -> np.ndarray:
+    """Risk scores for a RISK_FIELDS matrix. Higher score = lower risk."""
+    col = dict(zip(RISK_FIELDS, arr.T))
+    factors = {
+        "current_ratio": col["current_ratio"],
+        "leverage_ratio": col["leverage_ratio"],
+        "margin": ratio(col["net_income"], col["total_revenue"]),
+        "revenue_growth": col["revenue_growth"],
+        "coverage": ratio(col["free_cash_flow"], col["total_debt"]),
+    }
+    score = 50.0 + sum(band_points(values, factor) for factor, values in factors.items())
+    return np.clip(np.round(score, 2), 0.0, 100.0)
 
 def compute_risk_score(fundamentals_data: Dict[str, Any]) -> Optional[float]:
     """Compute risk score based on financial metrics. Higher score = lower risk."""
-    try:
-        score = 50.0
-
-        # Liquidity: current ratio
-        current_ratio = fundamentals_data.get("current_ratio")
-        if current_ratio is not None:
-            if current_ratio >= 2: score += 10
-            elif current_ratio >= 1: score += 5
-            else: score -= 10
-
-        # Leverage: debt to equity
-        leverage_ratio = fundamentals_data.get("leverage_ratio")
-        if leverage_ratio is not None:
-            if leverage_ratio < 0.5: score += 10
-            elif leverage_ratio < 1.5: score += 2
-            else: score -= 10
-
-        # Profitability: net income margin
-        if fundamentals_data.get("total_revenue") and fundamentals_data.get("net_income"):
-            try:
-                margin = fundamentals_data["net_income"] / fundamentals_data["total_revenue"]
-                if margin > 0.15: score += 10
-                elif margin > 0.05: score += 5
-                else: score -= 5
-            except (ZeroDivisionError, TypeError):
-                pass
-
-        # Growth
-        revenue_growth = fundamentals_data.get("revenue_growth")
-        if revenue_growth is not None:
-            if revenue_growth > 0.15: score += 5
-            elif revenue_growth < 0: score -= 5
-
-        # Cash flow coverage
-        if fundamentals_data.get("free_cash_flow") and fundamentals_data.get("total_debt"):
+    return float(compute_risk_score_batch(numeric_matrix([fundamentals_data], RISK_FIELDS))[0])
+
+def parse_market_date(value: str) -> datetime:
+    """Parse a market_data date as UTC; Yahoo sends plain YYYY-MM-DD, which skips the ISO parser"""
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]), tzinfo=UTC)
+    parsed = datetime.fromisoformat(value)
+    return parsed.replace(tzinfo=UTC) if parsed.tzinfo is None else parsed.astimezone(UTC)
+
+def build_fred_rows(series_id: str, observations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """EconomicIndicator rows for FRED observations; FRED reports a missing value as "." and those are skipped"""
+    # Parse the whole series at once; unparseable dates and values become NaT/NaN and are dropped together
+    dates = pd.to_datetime([obs.get("date") for obs in observations], errors="coerce", utc=True)
+    values = pd.to_numeric(pd.Series([obs.get("value") for obs in observations], dtype=object), errors="coerce").to_numpy(dtype=float)
+    keep = ~(dates.isna() | np.isnan(values))
+    return [{"indicator_name": series_id, "value": value, "date": dt, "country": "US", "source": "FRED"}
+            for dt, value in zip(dates[keep].to_pydatetime(), values[keep].tolist())]
+
+def build_yahoo_rows(ticker: str, data: Dict[str, Any], start_ts: datetime):
+    """Turn a fetch_credit_features payload into a fundamentals row and stock price rows"""
+    symbol = ticker.upper()
+    fundamentals_row = None
+    fundamentals_data = data["fundamentals"]
+    if fundamentals_data and fundamentals_data.get("ticker"):
+        # Calculate derived metrics
+        academic_metrics = compute_financial_metrics(fundamentals_data)
+
+        # Legacy calculations for backward compatibility
+        current_ratio = academic_metrics.get("current_ratio")
+        leverage_ratio = academic_metrics.get("debt_to_equity")  # Use debt-to-equity as leverage ratio
+
+        # Enrich fundamentals data
+        fundamentals_enriched = {**fundamentals_data}
+        fundamentals_enriched.update(academic_metrics)
+
+        fundamentals_enriched["current_ratio"] = current_ratio
+        fundamentals_enriched["leverage_ratio"] = leverage_ratio
+        fundamentals_enriched["risk_score"] = compute_risk_score(fundamentals_enriched)
+
+        fundamentals_row = {
+            "company": fundamentals_data.get("company", symbol),
+            "symbol": symbol,  # Store as symbol in DB but use ticker in API
+            "fiscal_year": start_ts.year,
+            "fiscal_quarter": None,
+            "fundamentals": fundamentals_enriched,
+            "source": "Yahoo Finance",
+            # Map specific fields
+            "total_revenue": fundamentals_enriched.get("total_revenue"),
+            "net_income": fundamentals_enriched.get("net_income"),
+            "free_cash_flow": fundamentals_enriched.get("free_cash_flow"),
+            "total_assets": fundamentals_enriched.get("total_assets"),
+            "total_liabilities": fundamentals_enriched.get("total_liabilities"),
+            "equity": fundamentals_enriched.get("equity"),
+            "debt_short": fundamentals_enriched.get("debt_short"),
+            "debt_long": fundamentals_enriched.get("debt_long"),
+            "total_debt": fundamentals_enriched.get("total_debt"),
+            "interest_expense": fundamentals_enriched.get("interest_expense"),
+            "cash": fundamentals_enriched.get("cash"),
+            "current_assets": fundamentals_enriched.get("current_assets"),
+            "current_liabilities": fundamentals_enriched.get("current_liabilities"),
+            "revenue_growth": fundamentals_enriched.get("revenue_growth"),
+            "sector": fundamentals_enriched.get("sector"),
+            "industry": fundamentals_enriched.get("industry"),
+            "region": fundamentals_enriched.get("region"),
+            "current_ratio": current_ratio,
+            "leverage_ratio": leverage_ratio,
+            "risk_score": fundamentals_enriched.get("risk_score")
+        }
+
+    # Process market data
+    market_data = data.get("market_data", [])
+    price_rows = []
+    for price_data in market_data:
+        if price_data.get("ticker") and price_data.get("date"):
             try:
-                coverage = fundamentals_data["free_cash_flow"] / fundamentals_data["total_debt"]
-                if coverage > 0.3: score += 5
-                elif coverage < 0.05: score -= 5
-            except (ZeroDivisionError, TypeError):
-                pass
-
-        return max(0.0, min(100.0, round(score, 2)))
-    except Exception:
-        return None
+                close_price = float(price_data.get("close_price", 0))
+                price_rows.append({
+                    "symbol": price_data["ticker"],  # Store as symbol in DB
+                    "date": parse_market_date(price_data["date"]),
+                    "open": close_price,
+                    "close": close_price,
+                    "high": close_price,
+                    "low": close_price,
+                    "volume": float(price_data.get("volume", 0)),
+                    "source": "Yahoo Finance"
+                })
+            except (ValueError, TypeError) as e:
+                logger.warning("⚠️ Skipping invalid price data for %s: %s", ticker, e)
+                continue
+
+    return fundamentals_row, price_rows
+
+# EDGAR dates are YYYY-MM-DD, occasionally with a time and a Z or +HH:MM offset
+FILING_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})(?:T(\d{2}):(\d{2}):(\d{2}))?(Z|[+-]\d{2}:\d{2})?")
+FILING_TZ = {None: UTC, "Z": UTC}  # offset suffix -> tzinfo, filled in as new offsets are seen
+
+def filing_tz(suffix: str) -> timezone:
+    tz = FILING_TZ.get(suffix)
+    if tz is None:
+        sign = -1 if suffix[0] == "-" else 1
+        tz = FILING_TZ[suffix] = timezone(sign * timedelta(hours=int(suffix[1:3]), minutes=int(suffix[4:6])))
+    return tz
+
+def parse_filing_date(value: str) -> datetime:
+    """Parse an SEC filing date, naive values as UTC; only shapes the regex does not cover reach fromisoformat"""
+    match = FILING_DATE_RE.fullmatch(value)
+    if match is None:
+        parsed = datetime.fromisoformat(value)
+        return parsed.replace(tzinfo=UTC) if parsed.tzinfo is None else parsed
+    year, month, day, hour, minute, second, suffix = match.groups()
+    return datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0), int(second or 0),
+                    tzinfo=filing_tz(suffix))
+
+def content_accession(*parts: Any) -> str:
+    """Stable stand-in accession for filings that carry no id of their own"""
+    return "sha1:" + hashlib.sha1(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+def filing_accession(filing: Dict[str, Any]) -> str:
+    """EDGAR feed entry id (it embeds the accession number), else the filing link"""
+    return (filing.get("raw_entry") or {}).get("id") or filing.get("link") or content_accession(filing)
+
+def build_sec_filing_rows(ticker: str, filings_data: List[Dict[str, Any]], limit: int, start_ts: datetime) -> List[Dict[str, Any]]:
+    """Turn fetched SEC filings into regulatory_filings rows, skipping malformed entries"""
+    symbol = ticker.upper()
+    # Limit the number of filings to process
+    filings_to_process = filings_data[:limit] if len(filings_data) > limit else filings_data
+    filing_rows = []
+
+    for filing in filings_to_process:
+        try:
+            # Parse filing date
+            filing_date_raw = filing.get("filing_date")
+            filing_dt = start_ts  # Default to current time
+
+            if filing_date_raw:
+                try:
+                    filing_dt = parse_filing_date(filing_date_raw)
+                except (ValueError, TypeError) as e:
+                    logger.warning("Could not parse filing date '%s' for %s: %s", filing_date_raw, ticker, e)
+                    filing_dt = start_ts
+
+            # Create regulatory filing record
+            filing_rows.append({
+                "company": filing.get("company", symbol),
+                "symbol": symbol,  # Store as symbol in DB
+                "filing_type": filing.get("filing_type", "Unknown")[:50],
+                "filing_date": filing_dt,
+                "accession": filing_accession(filing),
+                "data": filing,
+                "source": "SEC Edgar"
+            })
+
+        except Exception as filing_error:
+            logger.warning("Skipping invalid filing for %s: %s", ticker, filing_error)
+            continue
+
+    return filing_rows
 
 # FRED Series Ingestion Endpoint
 @app.post(
@@ -271,37 +739,27 @@ def compute_risk_score(fundamentals_data: Dict[str, Any]) -> Optional[float]:
     description="Fetch and store FRED economic data series in the database.",
     tags=["Auto Fetch & Store"]
 )
-def ingest_fred_series(
+async def ingest_fred_series(
     series_id: str, 
     start: Optional[str] = None, 
     end: Optional[str] = None, 
     limit: int = 20, 
     api_key: Optional[str] = None, 
-    db: Session = Depends(get_db)
+    *,
+    nocache: bool = False,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Ingest FRED economic series data"""
     start_ts = datetime.now(UTC)
     try:
-        data = fetch_fred_series(series_id, api_key=api_key, start=start, end=end)
-        observations = data.get("observations", [])[-limit:]
-        created = 0
-        for obs in observations:
-            try:
-                dt = datetime.fromisoformat(obs["date"]).replace(tzinfo=UTC)
-            except Exception:
-                continue
-            ei = EconomicIndicator(
-                id=str(uuid.uuid4()),
-                indicator_name=series_id,
-                value=obs.get("value"),
-                date=dt,
-                country="US",
-                source="FRED",
-                ingested_at=start_ts
-            )
-            db.add(ei)
-            created += 1
-        db.commit()
+        data = await fetch_source("fred", f"{series_id}:{start}:{end}", fetch_fred_series, series_id,
+                                  api_key=api_key, start=start, end=end, nocache=nocache)
+        rows = build_fred_rows(series_id, data.get("observations", [])[-limit:])
+        # Observations already stored are skipped, so re-ingesting a series is safe
+        created = len(await bulk_insert(db, EconomicIndicator, rows, skip_bad_rows=True))
+        await db.commit()
+        if created:
+            await invalidate_read_caches()
         log_ingestion("FRED_SERIES", created, "FRED", series_id)
         return {
             "status": "success", 
@@ -311,109 +769,54 @@ def ingest_fred_series(
             "source": "FRED"
         }
     except FredFetchError as fe:
-        return JSONResponse(status_code=400, content={"error": str(fe), "hint": "Provide ?api_key=YOUR_KEY or set FRED_API_KEY env var."})
+        return DefaultJSONResponse(status_code=400, content={"error": str(fe), "hint": "Provide ?api_key=YOUR_KEY or set FRED_API_KEY env var."})
     except Exception as e:
-        db.rollback()
-        logger.error(f"❌ INGESTION FAILED: FRED {series_id}: {e}")
+        await db.rollback()
+        logger.error("❌ INGESTION FAILED: FRED %s: %s", series_id, e)
         return handle_database_error(e, f"ingest_fred_{series_id}")
 
 # Yahoo Finance Endpoints
+# Declared before /ingest/yahoo/{ticker}, which would otherwise match "batch" as a ticker
+@app.post(
+    "/ingest/yahoo/batch",
+    summary="Ingest Yahoo Finance Data for many tickers",
+    description="Fetch fundamentals and recent prices for a list of tickers concurrently and store them in one transaction.",
+    tags=["Auto Fetch & Store"]
+)
+async def ingest_yahoo_batch(request: YahooBatchIngestRequest, db: AsyncSession = Depends(get_async_db)):
+    """Ingest Yahoo Finance data for multiple tickers"""
+    return await run_ingest_pipeline(request.tickers, None, db, "ingest_yahoo_batch", "YAHOO_BATCH", "Yahoo Finance")
+
 @app.post(
     "/ingest/yahoo/{ticker}",
     summary="Ingest Yahoo Finance Data",
     description="Fetch and store company fundamentals from Yahoo Finance.",
     tags=["Auto Fetch & Store"]
 )
-def ingest_yahoo_fundamentals(ticker: str, db: Session = Depends(get_db)):
+async def ingest_yahoo_fundamentals(ticker: str, *, nocache: bool = False, db: AsyncSession = Depends(get_async_db)):
     """Ingest Yahoo Finance fundamentals data with enhanced risk scoring"""
+    symbol = ticker.upper()
     start_ts = datetime.now(UTC)
     try:
-        data = fetch_credit_features(ticker.upper())
+        data = await fetch_source("yahoo", symbol, fetch_credit_features, symbol,
+                                  limiter=YAHOO_RATE_LIMIT, nocache=nocache)
 
         if not data or "fundamentals" not in data:
             raise ValueError(f"Invalid data structure received from Yahoo Finance for {ticker}")
 
         records_created = {"company_fundamentals": 0, "stock_prices": 0}
 
-        # Process fundamentals data
-        fundamentals_data = data["fundamentals"]
-        if fundamentals_data and fundamentals_data.get("ticker"):
-            # Calculate derived metrics
-            academic_metrics = compute_financial_metrics(fundamentals_data)
-            
-            # Legacy calculations for backward compatibility
-            current_ratio = academic_metrics.get("current_ratio")
-            leverage_ratio = academic_metrics.get("debt_to_equity")  # Use debt-to-equity as leverage ratio
-
-
-            # Enrich fundamentals data
-            fundamentals_enriched = {**fundamentals_data}
-            fundamentals_enriched.update(academic_metrics)
-            
-            fundamentals_enriched["current_ratio"] = current_ratio
-            fundamentals_enriched["leverage_ratio"] = leverage_ratio
-            fundamentals_enriched["risk_score"] = compute_risk_score(fundamentals_enriched)
-
-            # Create CompanyFundamentals record
-            fundamental = CompanyFundamentals(
-                id=str(uuid.uuid4()),
-                company=fundamentals_data.get("company", ticker.upper()),
-                symbol=ticker.upper(),  # Store as symbol in DB but use ticker in API
-                fiscal_year=datetime.now().year,
-                fiscal_quarter=None,
-                fundamentals=fundamentals_enriched,
-                source="Yahoo Finance",
-                ingested_at=start_ts,
-                # Map specific fields
-                total_revenue=fundamentals_enriched.get("total_revenue"),
-                net_income=fundamentals_enriched.get("net_income"),
-                free_cash_flow=fundamentals_enriched.get("free_cash_flow"),
-                total_assets=fundamentals_enriched.get("total_assets"),
-                total_liabilities=fundamentals_enriched.get("total_liabilities"),
-                equity=fundamentals_enriched.get("equity"),
-                debt_short=fundamentals_enriched.get("debt_short"),
-                debt_long=fundamentals_enriched.get("debt_long"),
-                total_debt=fundamentals_enriched.get("total_debt"),
-                interest_expense=fundamentals_enriched.get("interest_expense"),
-                cash=fundamentals_enriched.get("cash"),
-                current_assets=fundamentals_enriched.get("current_assets"),
-                current_liabilities=fundamentals_enriched.get("current_liabilities"),
-                revenue_growth=fundamentals_enriched.get("revenue_growth"),
-                sector=fundamentals_enriched.get("sector"),
-                industry=fundamentals_enriched.get("industry"),
-                region=fundamentals_enriched.get("region"),
-                current_ratio=current_ratio,
-                leverage_ratio=leverage_ratio,
-                risk_score=fundamentals_enriched.get("risk_score")
-            )
-
-            db.add(fundamental)
+        fundamentals_row, price_rows = build_yahoo_rows(ticker, data, start_ts)
+        if fundamentals_row:
+            await db.execute(insert(CompanyFundamentals).values(**fundamentals_row))
             records_created["company_fundamentals"] = 1
 
-        # Process market data
-        market_data = data.get("market_data", [])
-        for price_data in market_data:
-            if price_data.get("ticker") and price_data.get("date"):
-                try:
-                    sp = StockPrice(
-                        id=str(uuid.uuid4()),
-                        symbol=price_data["ticker"],  # Store as symbol in DB
-                        date=datetime.fromisoformat(price_data["date"]).replace(tzinfo=UTC),
-                        open=float(price_data.get("close_price", 0)),
-                        close=float(price_data.get("close_price", 0)),
-                        high=float(price_data.get("close_price", 0)),
-                        low=float(price_data.get("close_price", 0)),
-                        volume=float(price_data.get("volume", 0)),
-                        source="Yahoo Finance",
-                        ingested_at=start_ts
-                    )
-                    db.add(sp)
-                    records_created["stock_prices"] += 1
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"⚠️ Skipping invalid price data for {ticker}: {e}")
-                    continue
+        # One executemany round-trip for the whole price history; days already stored are skipped
+        records_created["stock_prices"] = len(await bulk_insert(db, StockPrice, price_rows, skip_bad_rows=True))
 
-        db.commit()
+        await db.commit()
+        if any(records_created.values()):
+            await invalidate_read_caches()
         log_ingestion("YAHOO_FUNDAMENTALS", sum(records_created.values()), "Yahoo Finance", ticker)
 
         return {
@@ -424,8 +827,8 @@ def ingest_yahoo_fundamentals(ticker: str, db: Session = Depends(get_db)):
             "source": "Yahoo Finance"
         }
     except Exception as e:
-        db.rollback()
-        logger.error(f"❌ INGESTION FAILED: Yahoo {ticker}: {e}")
+        await db.rollback()
+        logger.error("❌ INGESTION FAILED: Yahoo %s: %s", ticker, e)
         return handle_database_error(e, f"ingest_yahoo_{ticker}")
 
 @app.get(
@@ -434,20 +837,23 @@ def ingest_yahoo_fundamentals(ticker: str, db: Session = Depends(get_db)):
     description="Fetch company fundamentals from Yahoo Finance without storing to database.",
     tags=["Fetch Only"]
 )
-def fetch_yahoo_fundamentals(ticker: str):
+async def fetch_yahoo_fundamentals(request: Request, ticker: str):
     """Fetch Yahoo Finance fundamentals data without storing"""
-    try:
-        data = fetch_credit_features(ticker.upper())
-        return {
-            "status": "success",
-            "ticker": ticker.upper(),
-            "data": data,
-            "source": "Yahoo Finance",
-            "timestamp": datetime.now(UTC)
-        }
-    except Exception as e:
-        logger.error(f"❌ FETCH FAILED: Yahoo {ticker}: {e}")
-        return JSONResponse(status_code=500, content={"error": str(e), "ticker": ticker})
+    symbol = ticker.upper()
+    async def load():
+        try:
+            data = await fetch_source("yahoo", symbol, fetch_credit_features, symbol, limiter=YAHOO_RATE_LIMIT)
+            return {
+                "status": "success",
+                "ticker": symbol,
+                "data": data,
+                "source": "Yahoo Finance",
+                "timestamp": datetime.now(UTC)
+            }
+        except Exception as e:
+            logger.error("❌ FETCH FAILED: Yahoo %s: %s", ticker, e)
+            return DefaultJSONResponse(status_code=500, content={"error": str(e), "ticker": ticker})
+    return await cached_json(request, f"fetch:yahoo:{symbol}", FETCH_CACHE_TTL["yahoo"], load)
 
 # SEC Edgar Endpoints
 @app.post(
@@ -456,18 +862,20 @@ def fetch_yahoo_fundamentals(ticker: str):
     description="Fetch and store regulatory filings from SEC Edgar.",
     tags=["Auto Fetch & Store"]
 )
-def ingest_sec_filings(ticker: str, limit: int = 10, db: Session = Depends(get_db)):
+async def ingest_sec_filings(ticker: str, limit: int = 10, *, nocache: bool = False, db: AsyncSession = Depends(get_async_db)):
     """Ingest SEC Edgar filings data"""
+    symbol = ticker.upper()
     start_ts = datetime.now(UTC)
     try:
-        logger.info(f"🚀 Starting SEC Edgar ingestion for {ticker}")
+        logger.info("🚀 Starting SEC Edgar ingestion for %s", ticker)
 
         # Fetch filings data
-        filings_data = fetch_sec_filings(ticker.upper())
+        filings_data = await fetch_source("sec", symbol, fetch_sec_filings, symbol,
+                                          limiter=SEC_RATE_LIMIT, nocache=nocache)
 
         # Handle case where fetch_sec_filings returns None or empty
         if not filings_data:
-            logger.warning(f"No SEC filings found for {ticker}")
+            logger.warning("No SEC filings found for %s", ticker)
             return {
                 "status": "success",
                 "message": f"No SEC filings found for {ticker}",
@@ -478,8 +886,8 @@ def ingest_sec_filings(ticker: str, limit: int = 10, db: Session = Depends(get_d
 
         # Ensure filings_data is a list and limit the results
         if not isinstance(filings_data, list):
-            logger.error(f"Invalid data type from SEC Edgar for {ticker}: {type(filings_data)}")
-            return JSONResponse(
+            logger.error("Invalid data type from SEC Edgar for %s: %s", ticker, type(filings_data))
+            return DefaultJSONResponse(
                 status_code=500,
                 content={
                     "error": f"Invalid data format received from SEC Edgar: expected list, got {type(filings_data).__name__}",
@@ -487,50 +895,13 @@ def ingest_sec_filings(ticker: str, limit: int = 10, db: Session = Depends(get_d
                 }
             )
 
-        # Limit the number of filings to process
-        filings_to_process = filings_data[:limit] if len(filings_data) > limit else filings_data
-        created = 0
-
-        for filing in filings_to_process:
-            try:
-                # Parse filing date
-                filing_date_raw = filing.get("filing_date")
-                filing_dt = start_ts  # Default to current time
-
-                if filing_date_raw:
-                    try:
-                        if filing_date_raw.endswith("Z"):
-                            filing_dt = datetime.fromisoformat(filing_date_raw.replace("Z", "+00:00"))
-                        else:
-                            # Try parsing as ISO format
-                            filing_dt = datetime.fromisoformat(filing_date_raw)
-                            if filing_dt.tzinfo is None:
-                                filing_dt = filing_dt.replace(tzinfo=UTC)
-                    except (ValueError, TypeError) as e:
-                        logger.warning(f"Could not parse filing date '{filing_date_raw}' for {ticker}: {e}")
-                        filing_dt = start_ts
-
-                # Create regulatory filing record
-                regulatory_filing = RegulatoryFiling(
-                    id=str(uuid.uuid4()),
-                    company=filing.get("company", ticker.upper()),
-                    symbol=ticker.upper(),  # Store as symbol in DB
-                    filing_type=filing.get("filing_type", "Unknown")[:50],
-                    filing_date=filing_dt,
-                    data=filing,
-                    source="SEC Edgar",
-                    ingested_at=start_ts
-                )
-                db.add(regulatory_filing)
-                created += 1
-
-            except Exception as filing_error:
-                logger.warning(f"Skipping invalid filing for {ticker}: {filing_error}")
-                continue
+        filing_rows = build_sec_filing_rows(ticker, filings_data, limit, start_ts)
 
-        # Commit all records
+        # Commit all records in a single executemany round-trip; filings already stored are skipped
+        created = len(await bulk_insert(db, RegulatoryFiling, filing_rows, skip_bad_rows=True))
         if created > 0:
-            db.commit()
+            await db.commit()
+            await invalidate_read_caches()
             log_ingestion("SEC_FILINGS", created, "SEC Edgar", ticker)
 
         return {
@@ -542,8 +913,8 @@ def ingest_sec_filings(ticker: str, limit: int = 10, db: Session = Depends(get_d
         }
 
     except Exception as e:
-        db.rollback()
-        logger.error(f"❌ INGESTION FAILED: SEC {ticker}: {e}")
+        await db.rollback()
+        logger.error("❌ INGESTION FAILED: SEC %s: %s", ticker, e)
         return handle_database_error(e, f"ingest_sec_{ticker}")
 
 @app.get(
@@ -552,49 +923,52 @@ def ingest_sec_filings(ticker: str, limit: int = 10, db: Session = Depends(get_d
     description="Fetch regulatory filings from SEC Edgar without storing to database.",
     tags=["Fetch Only"]
 )
-def fetch_sec_filings_only(ticker: str, limit: int = 10):
+async def fetch_sec_filings_only(request: Request, ticker: str, limit: int = 10):
     """Fetch SEC Edgar filings without storing"""
-    try:
-        logger.info(f"🔍 Fetching SEC filings for {ticker} (no storage)")
+    symbol = ticker.upper()
+    async def load():
+        try:
+            logger.info("🔍 Fetching SEC filings for %s (no storage)", ticker)
+
+            filings_data = await fetch_source("sec", symbol, fetch_sec_filings, symbol, limiter=SEC_RATE_LIMIT)
+
+            # Handle case where fetch returns None or empty
+            if not filings_data:
+                return {
+                    "status": "success",
+                    "ticker": symbol,
+                    "filings": [],
+                    "message": f"No SEC filings found for {ticker}",
+                    "source": "SEC Edgar",
+                    "timestamp": datetime.now(UTC)
+                }
 
-        filings_data = fetch_sec_filings(ticker.upper())
+            # Ensure it's a list and limit results
+            if not isinstance(filings_data, list):
+                return DefaultJSONResponse(
+                    status_code=500,
+                    content={
+                        "error": f"Invalid data format from SEC Edgar: expected list, got {type(filings_data).__name__}",
+                        "ticker": ticker
+                    }
+                )
+
+            limited_filings = filings_data[:limit] if len(filings_data) > limit else filings_data
 
-        # Handle case where fetch returns None or empty
-        if not filings_data:
             return {
                 "status": "success",
-                "ticker": ticker.upper(),
-                "filings": [],
-                "message": f"No SEC filings found for {ticker}",
+                "ticker": symbol,
+                "filings": limited_filings,
+                "total_available": len(filings_data),
+                "returned": len(limited_filings),
                 "source": "SEC Edgar",
                 "timestamp": datetime.now(UTC)
             }
 
-        # Ensure it's a list and limit results
-        if not isinstance(filings_data, list):
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "error": f"Invalid data format from SEC Edgar: expected list, got {type(filings_data).__name__}",
-                    "ticker": ticker
-                }
-            )
-
-        limited_filings = filings_data[:limit] if len(filings_data) > limit else filings_data
-
-        return {
-            "status": "success",
-            "ticker": ticker.upper(),
-            "filings": limited_filings,
-            "total_available": len(filings_data),
-            "returned": len(limited_filings),
-            "source": "SEC Edgar",
-            "timestamp": datetime.now(UTC)
-        }
-
-    except Exception as e:
-        logger.error(f"❌ FETCH FAILED: SEC {ticker}: {e}")
-        return JSONResponse(status_code=500, content={"error": str(e), "ticker": ticker})
+        except Exception as e:
+            logger.error("❌ FETCH FAILED: SEC %s: %s", ticker, e)
+            return DefaultJSONResponse(status_code=500, content={"error": str(e), "ticker": ticker})
+    return await cached_json(request, f"fetch:sec:{symbol}:{limit}", FETCH_CACHE_TTL["sec"], load)
 
 @app.get(
     "/fetch/fred/{series_id}",
@@ -602,7 +976,8 @@ def fetch_sec_filings_only(ticker: str, limit: int = 10):
     description="Fetch FRED economic data without storing to database.",
     tags=["Fetch Only"]
 )
-def fetch_fred_series_only(
+async def fetch_fred_series_only(
+    request: Request,
     series_id: str,
     start: Optional[str] = None,
     end: Optional[str] = None,
@@ -610,21 +985,24 @@ def fetch_fred_series_only(
     api_key: Optional[str] = None
 ):
     """Fetch FRED series data without storing"""
-    try:
-        data = fetch_fred_series(series_id, api_key=api_key, start=start, end=end)
-        observations = data.get("observations", [])[-limit:]
-        return {
-            "status": "success",
-            "series_id": series_id,
-            "observations": observations,
-            "source": "FRED",
-            "timestamp": datetime.now(UTC)
-        }
-    except FredFetchError as fe:
-        return JSONResponse(status_code=400, content={"error": str(fe), "hint": "Provide ?api_key=YOUR_KEY or set FRED_API_KEY env var."})
-    except Exception as e:
-        logger.error(f"❌ FETCH FAILED: FRED {series_id}: {e}")
-        return JSONResponse(status_code=500, content={"error": str(e), "series_id": series_id})
+    async def load():
+        try:
+            data = await fetch_source("fred", f"{series_id}:{start}:{end}", fetch_fred_series, series_id,
+                                      api_key=api_key, start=start, end=end)
+            observations = data.get("observations", [])[-limit:]
+            return {
+                "status": "success",
+                "series_id": series_id,
+                "observations": observations,
+                "source": "FRED",
+                "timestamp": datetime.now(UTC)
+            }
+        except FredFetchError as fe:
+            return DefaultJSONResponse(status_code=400, content={"error": str(fe), "hint": "Provide ?api_key=YOUR_KEY or set FRED_API_KEY env var."})
+        except Exception as e:
+            logger.error("❌ FETCH FAILED: FRED %s: %s", series_id, e)
+            return DefaultJSONResponse(status_code=500, content={"error": str(e), "series_id": series_id})
+    return await cached_json(request, f"fetch:fred:{series_id}:{start}:{end}:{limit}", FETCH_CACHE_TTL["fred"], load)
 
 # Legacy endpoints for backward compatibility (using "credit_features" naming)
 @app.get(
@@ -633,9 +1011,9 @@ def fetch_fred_series_only(
     description="Fetch credit features from Yahoo Finance API (view-only) - Legacy endpoint",
     tags=["Fetch Only"]
 )
-def get_credit_features(ticker: str):
+async def get_credit_features(request: Request, ticker: str):
     """Legacy endpoint - use /fetch/yahoo/{ticker} instead"""
-    return fetch_yahoo_fundamentals(ticker)
+    return await fetch_yahoo_fundamentals(request, ticker)
 
 @app.get(
     "/sec_filings/{ticker}",
@@ -643,9 +1021,9 @@ def get_credit_features(ticker: str):
     description="Fetch recent SEC EDGAR filings (no store) - Legacy endpoint",
     tags=["Fetch Only"]
 )
-def get_sec_filings(ticker: str):
+async def get_sec_filings(request: Request, ticker: str):
     """Legacy endpoint - use /fetch/sec/{ticker} instead"""
-    return fetch_sec_filings_only(ticker)
+    return await fetch_sec_filings_only(request, ticker)
 
 @app.get(
     "/fred/{series_id}",
@@ -653,9 +1031,9 @@ def get_sec_filings(ticker: str):
     description="Fetch macroeconomic time series from FRED (no store) - Legacy endpoint",
     tags=["Fetch Only"]
 )
-def fetch_fred(series_id: str, start: Optional[str] = None, end: Optional[str] = None, limit: int = 20):
+async def fetch_fred(request: Request, series_id: str, start: Optional[str] = None, end: Optional[str] = None, limit: int = 20):
     """Legacy endpoint - use /fetch/fred/{series_id} instead"""
-    return fetch_fred_series_only(series_id, start, end, limit)
+    return await fetch_fred_series_only(request, series_id, start, end, limit)
 
 # Enhanced Data Retrieval Endpoints
 @app.get(
@@ -664,13 +1042,21 @@ def fetch_fred(series_id: str, start: Optional[str] = None, end: Optional[str] =
     description="Retrieve stored company fundamentals data",
     tags=["Data Retrieval"]
 )
-def get_fundamentals(ticker: Optional[str] = None, limit: int = 100, db: Session = Depends(get_db)):
-    """Get company fundamentals data"""
-    query = db.query(CompanyFundamentals)
+async def get_fundamentals(request: Request, ticker: Optional[str] = None, limit: int = Query(100, ge=1),
+                           cursor: Optional[str] = None, db: AsyncSession = Depends(get_async_db)):
+    """Get company fundamentals data, newest first; pass the returned next_cursor as ?cursor= for the next page"""
+    query = keyset_query(CompanyFundamentals, limit, cursor)
     if ticker:
-        query = query.filter(CompanyFundamentals.symbol == ticker.upper())
-    fundamentals = query.limit(limit).all()
-    return {"fundamentals": [jsonable_encoder(f) for f in fundamentals]}
+        query = query.where(CompanyFundamentals.symbol == ticker.upper())
+    # Large pages are streamed row by row instead of being built, encoded and cached as one body
+    if limit > FUNDAMENTALS_STREAM_THRESHOLD:
+        return stream_rows(query, key="fundamentals", page_size=limit)
+
+    async def load():
+        rows = await fetch_rows(db, query)
+        next_cursor = encode_cursor(rows[-1]) if len(rows) == limit and rows[-1]["ingested_at"] is not None else None
+        return {"fundamentals": rows, "next_cursor": next_cursor}
+    return await cached_json(request, f"fundamentals:{ticker and ticker.upper()}:{limit}:{cursor}", FETCH_CACHE_TTL["fundamentals"], load)
 
 @app.get(
     "/economic-indicators",
@@ -678,13 +1064,16 @@ def get_fundamentals(ticker: Optional[str] = None, limit: int = 100, db: Session
     description="Retrieve stored economic indicators",
     tags=["Data Retrieval"]
 )
-def get_economic_indicators(indicator_name: Optional[str] = None, limit: int = 100, db: Session = Depends(get_db)):
+async def get_economic_indicators(request: Request, indicator_name: Optional[str] = None, limit: int = 100, db: AsyncSession = Depends(get_async_db)):
     """Get economic indicators data"""
-    query = db.query(EconomicIndicator)
+    query = select_columns(EconomicIndicator)
     if indicator_name:
-        query = query.filter(EconomicIndicator.indicator_name == indicator_name)
-    indicators = query.limit(limit).all()
-    return {"indicators": [jsonable_encoder(i) for i in indicators]}
+        query = query.where(EconomicIndicator.indicator_name == indicator_name)
+
+    async def load():
+        rows = (await db.execute(query.limit(limit))).mappings().all()
+        return await off_loop(lambda: dump_json({"indicators": [dict(row) for row in rows]}), len(rows))
+    return await cached_json(request, read_cache_key(request), READ_CACHE_TTL, load)
 
 @app.get(
     "/stock-prices",
@@ -692,13 +1081,12 @@ def get_economic_indicators(indicator_name: Optional[str] = None, limit: int = 1
     description="Retrieve stored stock price data",
     tags=["Data Retrieval"]
 )
-def get_stock_prices(ticker: Optional[str] = None, limit: int = 100, db: Session = Depends(get_db)):
+async def get_stock_prices(ticker: Optional[str] = None, limit: int = 100, db: AsyncSession = Depends(get_async_db)):
     """Get stock price data"""
-    query = db.query(StockPrice)
+    query = select_columns(StockPrice)
     if ticker:
-        query = query.filter(StockPrice.symbol == ticker.upper())
-    prices = query.limit(limit).all()
-    return {"stock_prices": [jsonable_encoder(p) for p in prices]}
+        query = query.where(StockPrice.symbol == ticker.upper())
+    return json_response({"stock_prices": await fetch_rows(db, query.limit(limit))})
 
 @app.get(
     "/regulatory-filings",
@@ -706,15 +1094,14 @@ def get_stock_prices(ticker: Optional[str] = None, limit: int = 100, db: Session
     description="Retrieve stored regulatory filings",
     tags=["Data Retrieval"]
 )
-def get_regulatory_filings(ticker: Optional[str] = None, filing_type: Optional[str] = None, limit: int = 100, db: Session = Depends(get_db)):
+async def get_regulatory_filings(ticker: Optional[str] = None, filing_type: Optional[str] = None, limit: int = 100, db: AsyncSession = Depends(get_async_db)):
     """Get regulatory filings data"""
-    query = db.query(RegulatoryFiling)
+    query = select_columns(RegulatoryFiling)
     if ticker:
-        query = query.filter(RegulatoryFiling.symbol == ticker.upper())
+        query = query.where(RegulatoryFiling.symbol == ticker.upper()).order_by(RegulatoryFiling.filing_date.desc())
     if filing_type:
-        query = query.filter(RegulatoryFiling.filing_type == filing_type)
-    filings = query.limit(limit).all()
-    return {"regulatory_filings": [jsonable_encoder(f) for f in filings]}
+        query = query.where(RegulatoryFiling.filing_type == filing_type)
+    return json_response({"regulatory_filings": await fetch_rows(db, query.limit(limit))})
 
 @app.get(
     "/fundamentals/{ticker}",
@@ -722,45 +1109,81 @@ def get_regulatory_filings(ticker: Optional[str] = None, filing_type: Optional[s
     description="Retrieve fundamentals data for a specific ticker",
     tags=["Data Retrieval"]
 )
-def get_fundamentals_by_ticker(ticker: str, db: Session = Depends(get_db)):
+async def get_fundamentals_by_ticker(request: Request, ticker: str, db: AsyncSession = Depends(get_async_db)):
     """Get fundamentals for a specific ticker"""
-    fundamentals = db.query(CompanyFundamentals).filter(
-        CompanyFundamentals.symbol == ticker.upper()
-    ).all()
+    async def load():
+        fundamentals = await fetch_rows(db, select_columns(CompanyFundamentals).where(
+            CompanyFundamentals.symbol == ticker.upper()
+        ))
+        if not fundamentals:
+            raise HTTPException(status_code=404, detail=f"No fundamentals found for ticker {ticker}")
+        return {"ticker": ticker.upper(), "fundamentals": fundamentals}
+    return await cached_json(request, read_cache_key(request), READ_CACHE_TTL, load)
+
+# Enhanced risk score endpoints
+async def latest_for_ticker(db: AsyncSession, ticker: str, *columns):
+    """symbol, company, ingested_at and columns from a ticker's newest company_fundamentals row, or 404"""
+    cf = CompanyFundamentals
+    rec = (await db.execute(select(cf.symbol, cf.company, cf.ingested_at, *columns).where(
+        cf.symbol == ticker.upper()
+    ).order_by(cf.ingested_at.desc()).limit(1))).first()
+    if not rec:
+        raise HTTPException(status_code=404, detail="Ticker not found")
+    return rec
 
-    if not fundamentals:
-        raise HTTPException(status_code=404, content={"error": f"No fundamentals found for ticker {ticker}"})
+def ticker_header(rec) -> Dict[str, Any]:
+    return {"ticker": rec.symbol, "company": rec.company, "ingested_at": rec.ingested_at}
 
-    return {"ticker": ticker.upper(), "fundamentals": [jsonable_encoder(f) for f in fundamentals]}
+def row_fields(rec, keys) -> Dict[str, Any]:
+    return {key: rec._mapping[key] for key in keys}
+
+def latest_per_symbol(db: AsyncSession, *columns):
+    """SELECT symbol and columns from the newest company_fundamentals row of each symbol, in symbol order.
+    DISTINCT ON on PostgreSQL (an index scan over idx_company_fundamentals_symbol_latest_covering), ROW_NUMBER() elsewhere."""
+    cf = CompanyFundamentals
+    if db.get_bind().dialect.name == "postgresql":
+        return select(cf.symbol, *columns).distinct(cf.symbol).order_by(cf.symbol, cf.ingested_at.desc())
+    ranked = select(cf.symbol, *columns, func.row_number().over(
+        partition_by=cf.symbol, order_by=cf.ingested_at.desc()).label("rank")).subquery()
+    return select(*(ranked.c[c.key] for c in (cf.symbol, *columns))).where(ranked.c.rank == 1).order_by(ranked.c.symbol)
 
-# Enhanced risk score endpoints
 @app.get(
     "/risk_scores",
     summary="List latest risk scores",
     description="Get latest risk scores for all tickers",
     tags=["Data Retrieval"]
 )
-def list_risk_scores(db: Session = Depends(get_db)):
+async def list_risk_scores(request: Request, db: AsyncSession = Depends(get_async_db)):
     """Get latest risk scores for all tickers"""
-    records = db.query(CompanyFundamentals).order_by(
-        CompanyFundamentals.symbol,
-        CompanyFundamentals.ingested_at.desc()
-    ).all()
-
-    latest = {}
-    for r in records:
-        if r.symbol not in latest:
-            latest[r.symbol] = {
-                "ticker": r.symbol,
-                "company": r.company,
-                "risk_score": r.risk_score,
-                "ingested_at": r.ingested_at,
-                "revenue": r.total_revenue,
-                "net_income": r.net_income,
-                "free_cash_flow": r.free_cash_flow
-            }
+    return await cached_json(request, read_cache_key(request), READ_CACHE_TTL, lambda: load_risk_scores(db))
+
+async def load_risk_scores(db: AsyncSession) -> bytes:
+    records = (await db.execute(latest_per_symbol(
+        db,
+        CompanyFundamentals.company,
+        CompanyFundamentals.risk_score,
+        CompanyFundamentals.ingested_at,
+        CompanyFundamentals.total_revenue,
+        CompanyFundamentals.net_income,
+        CompanyFundamentals.free_cash_flow,
+    ))).all()
+    return await off_loop(risk_scores_body, len(records), records)
+
+def risk_scores_body(records) -> bytes:
+    items = [
+        {
+            "ticker": r.symbol,
+            "company": r.company,
+            "risk_score": r.risk_score,
+            "ingested_at": r.ingested_at,
+            "revenue": r.total_revenue,
+            "net_income": r.net_income,
+            "free_cash_flow": r.free_cash_flow
+        }
+        for r in records
+    ]
 
-    return {"count": len(latest), "items": list(latest.values())}
+    return dump_json({"count": len(items), "items": items})
 
 @app.get(
     "/academic-metrics/{ticker}",
@@ -768,24 +1191,27 @@ def list_risk_scores(db: Session = Depends(get_db)):
     description="Retrieve academic financial metrics (ROA, leverage, etc.) for CDS prediction models",
     tags=["Data Retrieval"]
 )
-def get_academic_metrics(ticker: str, db: Session = Depends(get_db)):
+async def get_academic_metrics(request: Request, ticker: str, db: AsyncSession = Depends(get_async_db)):
     """Get academic financial metrics for a specific ticker following Das et al. and Tsai et al."""
-    rec = db.query(CompanyFundamentals).filter(
-        CompanyFundamentals.symbol == ticker.upper()
-    ).order_by(CompanyFundamentals.ingested_at.desc()).first()
+    return await cached_json(request, read_cache_key(request), READ_CACHE_TTL, lambda: load_academic_metrics(db, ticker))
 
-    if not rec:
-        raise HTTPException(status_code=404, detail="Ticker not found")
+ACADEMIC_RAW_FIELDS = ("total_revenue", "net_income", "total_assets", "total_debt", "equity", "retained_earnings",
+                       "free_cash_flow")
+
+async def load_academic_metrics(db: AsyncSession, ticker: str) -> Dict[str, Any]:
+    # Academic metrics come back as columns; the fundamentals JSON itself is never fetched
+    cf = CompanyFundamentals
+    rec = await latest_for_ticker(db, ticker, cf.fiscal_year, cf.risk_score, *metric_columns(),
+                                  cf.fundamentals["retained_earnings"].label("retained_earnings"),
+                                  cf.total_revenue, cf.net_income, cf.total_assets, cf.total_debt, cf.equity,
+                                  cf.free_cash_flow)
+    fundamentals = rec._mapping
+    missing = missing_metrics(fundamentals)
 
-    # Extract academic metrics from fundamentals JSON
-    fundamentals = rec.fundamentals or {}
-    
     return {
-        "ticker": rec.symbol,
-        "company": rec.company,
+        **ticker_header(rec),
         "fiscal_year": rec.fiscal_year,
-        "ingested_at": rec.ingested_at,
-        "academic_metrics": {
+        "academic_metrics": strip_none({
             # Accounting measures (following Das et al.)
             "roa": fundamentals.get("roa"),  # Return on Assets
             "revenue_growth": fundamentals.get("revenue_growth"),  # Revenue growth
@@ -799,25 +1225,11 @@ def get_academic_metrics(ticker: str, db: Session = Depends(get_db)):
             
             # Risk score
             "risk_score": rec.risk_score
-        },
-        "raw_data": {
-            "total_revenue": rec.total_revenue,
-            "net_income": rec.net_income,
-            "total_assets": rec.total_assets,
-            "total_debt": rec.total_debt,
-            "equity": rec.equity,
-            "retained_earnings": fundamentals.get("retained_earnings"),
-            "free_cash_flow": rec.free_cash_flow
-        },
+        }),
+        "raw_data": strip_none(row_fields(rec, ACADEMIC_RAW_FIELDS)),
         "data_quality": {
-            "missing_fields": [
-                field for field in ["roa", "revenue_growth", "leverage", "retained_earnings_ratio"]
-                if fundamentals.get(field) is None
-            ],
-            "completeness_score": len([
-                field for field in ["roa", "revenue_growth", "leverage", "retained_earnings_ratio"]
-                if fundamentals.get(field) is not None
-            ]) / 4 * 100
+            "missing_fields": missing,
+            "completeness_score": completeness_score(missing)
         }
     }
 
@@ -827,250 +1239,336 @@ def get_academic_metrics(ticker: str, db: Session = Depends(get_db)):
     description="Retrieve academic financial metrics for multiple tickers for CDS modeling",
     tags=["Data Retrieval"]
 )
-def get_bulk_academic_metrics(limit: int = 100, db: Session = Depends(get_db)):
+async def get_bulk_academic_metrics(request: Request, limit: int = 100, db: AsyncSession = Depends(get_async_db)):
     """Get academic financial metrics for multiple tickers"""
-    # Get latest record for each ticker
-    records = db.query(CompanyFundamentals).order_by(
-        CompanyFundamentals.symbol,
-        CompanyFundamentals.ingested_at.desc()
-    ).all()
+    return await cached_json(request, read_cache_key(request), READ_CACHE_TTL, lambda: load_bulk_academic_metrics(db, limit))
 
-    latest = {}
-    for r in records:
-        if r.symbol not in latest:
-            fundamentals = r.fundamentals or {}
-            latest[r.symbol] = {
-                "ticker": r.symbol,
-                "company": r.company,
-                "fiscal_year": r.fiscal_year,
-                "ingested_at": r.ingested_at,
-                "academic_metrics": {
-                    "roa": fundamentals.get("roa"),
-                    "revenue_growth": fundamentals.get("revenue_growth"),
-                    "leverage": fundamentals.get("leverage"),
-                    "retained_earnings_ratio": fundamentals.get("retained_earnings_ratio"),
-                    "net_income_growth_normalized": fundamentals.get("net_income_growth_normalized"),
-                    "current_ratio": fundamentals.get("current_ratio"),
-                    "debt_to_equity": fundamentals.get("debt_to_equity"),
-                    "risk_score": r.risk_score
-                },
-                "data_completeness": len([
-                    field for field in ["roa", "revenue_growth", "leverage", "retained_earnings_ratio"]
-                    if fundamentals.get(field) is not None
-                ]) / 4 * 100
-            }
+@app.get(
+    "/academic-metrics.msgpack",
+    summary="Bulk Academic Financial Metrics (MessagePack)",
+    description="The /academic-metrics payload encoded as MessagePack (timestamps as ISO 8601 strings), "
+                "for modeling pipelines that pull the whole universe. Requires msgpack on the server.",
+    tags=["Data Retrieval"],
+    response_class=Response,
+)
+async def get_bulk_academic_metrics_msgpack(request: Request, limit: int = 100, db: AsyncSession = Depends(get_async_db)):
+    """Get academic financial metrics for multiple tickers as MessagePack"""
+    if not MSGPACK_AVAILABLE:
+        raise HTTPException(status_code=501, detail="msgpack is not installed on this server")
+    return await cached_json(request, read_cache_key(request), READ_CACHE_TTL,
+                             lambda: load_bulk_academic_metrics(db, limit, pack_msgpack), "application/msgpack")
 
-    result_list = list(latest.values())[:limit]
-    
-    return {
+def msgpack_default(obj):
+    return obj.isoformat() if isinstance(obj, datetime) else str(obj)
+
+def pack_msgpack(payload) -> bytes:
+    return msgpack.packb(payload, default=msgpack_default, use_bin_type=True)
+
+async def load_bulk_academic_metrics(db: AsyncSession, limit: int, encode=dump_json) -> bytes:
+    # Get latest record for each ticker
+    # Only the metrics are read (generated columns or server-side JSON extraction), not the whole document
+    records = (await db.execute(latest_per_symbol(
+        db,
+        CompanyFundamentals.company,
+        CompanyFundamentals.fiscal_year,
+        CompanyFundamentals.ingested_at,
+        CompanyFundamentals.risk_score,
+        *metric_columns(),
+    ).limit(limit))).all()
+    return await off_loop(academic_metrics_body, len(records), records, encode)
+
+def academic_metrics_body(records, encode) -> bytes:
+    result_list = []
+    total_completeness = 0.0
+    complete_records = 0
+    for r in records:
+        metrics = {key: r._mapping[key] for key in METRIC_NAMES}
+        completeness = completeness_score(missing_metrics(metrics))
+        total_completeness += completeness
+        complete_records += completeness == 100
+        result_list.append({
+            "ticker": r.symbol,
+            "company": r.company,
+            "fiscal_year": r.fiscal_year,
+            "ingested_at": r.ingested_at,
+            "academic_metrics": strip_none({**metrics, "risk_score": r.risk_score}),
+            "data_completeness": completeness
+        })
+
+    return encode({
         "count": len(result_list),
         "items": result_list,
         "summary": {
-            "avg_completeness": sum(item["data_completeness"] for item in result_list) / len(result_list) if result_list else 0,
-            "complete_records": len([item for item in result_list if item["data_completeness"] == 100]),
-            "sectors": list(set(item.get("sector", "Unknown") for item in result_list if "sector" in item))
+            "avg_completeness": total_completeness / len(result_list) if result_list else 0,
+            "complete_records": complete_records,
+            "sectors": []  # the latest-row query carries no sector column
         }
-    }
+    })
 
 
+RISK_SCORE_METRICS = ("total_revenue", "net_income", "free_cash_flow", "total_assets", "total_liabilities", "equity",
+                      "total_debt", "interest_expense", "cash", "current_assets", "current_liabilities",
+                      "revenue_growth", "current_ratio", "leverage_ratio")
+
 @app.get(
     "/risk_scores/{ticker}",
     summary="Get latest risk score",
     description="Get latest risk score for a specific ticker",
     tags=["Data Retrieval"]
 )
-def get_risk_score(ticker: str, db: Session = Depends(get_db)):
+async def get_risk_score(request: Request, ticker: str, db: AsyncSession = Depends(get_async_db)):
     """Get latest risk score for a specific ticker"""
-    rec = db.query(CompanyFundamentals).filter(
-        CompanyFundamentals.symbol == ticker.upper()
-    ).order_by(CompanyFundamentals.ingested_at.desc()).first()
+    async def load():
+        rec = await latest_for_ticker(db, ticker, CompanyFundamentals.risk_score,
+                                      *(getattr(CompanyFundamentals, key) for key in RISK_SCORE_METRICS))
+        return {**ticker_header(rec), "risk_score": rec.risk_score, "metrics": row_fields(rec, RISK_SCORE_METRICS)}
+    return await cached_json(request, read_cache_key(request), READ_CACHE_TTL, load)
 
-    if not rec:
-        raise HTTPException(status_code=404, detail="Ticker not found")
+# Manual data ingestion endpoints
+BULK_INSERT_CHUNK = 1000  # rows per multi-row INSERT, bounds statement size
+COPY_THRESHOLD = 200  # above this many rows, Postgres COPY beats executemany
+
+def insert_statement(db, model):
+    """INSERT ... ON CONFLICT DO NOTHING RETURNING id, so duplicates are skipped instead of aborting the transaction"""
+    return insert_ignoring_duplicates(model, db.get_bind().dialect.name).returning(model.__table__.c.id)
+
+async def copy_rows(db: AsyncSession, model, rows: List[Dict[str, Any]]) -> List[str]:
+    """COPY rows into a temp table with asyncpg, then move the non-duplicates into the model's table"""
+    table = model.__tablename__
+    staging = f"_copy_{table}"
+    columns = list(rows[0])
+    column_list = ", ".join(columns)
+    json_columns = {c.name for c in model.__table__.columns if isinstance(c.type, JSON)}
+    # COPY bypasses SQLAlchemy bind processing; the dialect's jsonb codec expects pre-encoded text
+    records = [
+        tuple(dump_json_column(row[c]) if c in json_columns and row[c] is not None else row[c] for c in columns)
+        for row in rows
+    ]
+    raw = await (await db.connection()).get_raw_connection()
+    conn = raw.driver_connection
+    await conn.execute(f"CREATE TEMP TABLE {staging} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP")
+    await conn.copy_records_to_table(staging, records=records, columns=columns)
+    inserted = await conn.fetch(
+        f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {staging} ON CONFLICT DO NOTHING RETURNING id"
+    )
+    await conn.execute(f"DROP TABLE {staging}")
+    return [record["id"] for record in inserted]
 
-    return {
-        "ticker": rec.symbol,
-        "company": rec.company,
-        "risk_score": rec.risk_score,
-        "ingested_at": rec.ingested_at,
-        "metrics": {
-            "total_revenue": rec.total_revenue,
-            "net_income": rec.net_income,
-            "free_cash_flow": rec.free_cash_flow,
-            "total_assets": rec.total_assets,
-            "total_liabilities": rec.total_liabilities,
-            "equity": rec.equity,
-            "total_debt": rec.total_debt,
-            "interest_expense": rec.interest_expense,
-            "cash": rec.cash,
-            "current_assets": rec.current_assets,
-            "current_liabilities": rec.current_liabilities,
-            "revenue_growth": rec.revenue_growth,
-            "current_ratio": rec.current_ratio,
-            "leverage_ratio": rec.leverage_ratio
-        }
+async def insert_isolated(db: AsyncSession, stmt, model, rows: List[Dict[str, Any]]) -> List[str]:
+    """Insert rows inside a SAVEPOINT; if the batch fails, retry it one row at a time and drop the rows that still fail"""
+    try:
+        async with db.begin_nested():
+            return (await db.execute(stmt, rows)).scalars().all()
+    except DBAPIError as e:
+        if len(rows) == 1:
+            logger.warning("Skipping %s row that failed to insert: %s", model.__tablename__, e.orig)
+            return []
+    ids = []
+    for row in rows:
+        ids.extend(await insert_isolated(db, stmt, model, [row]))
+    return ids
+
+async def bulk_insert(db: AsyncSession, model, rows: List[Dict[str, Any]], skip_bad_rows: bool = False) -> List[str]:
+    """Insert rows in fixed-size executemany chunks (COPY for large asyncpg batches); returns the ids actually stored.
+    With skip_bad_rows every chunk runs in its own SAVEPOINT, so a malformed row costs only itself, not the batch."""
+    if not rows:
+        return []
+    if len(rows) > COPY_THRESHOLD and db.get_bind().dialect.driver == "asyncpg":
+        if not skip_bad_rows:
+            return await copy_rows(db, model, rows)
+        try:
+            async with db.begin_nested():
+                return await copy_rows(db, model, rows)
+        except Exception as e:  # raised by asyncpg itself, the COPY bypasses SQLAlchemy
+            logger.warning("COPY into %s failed, retrying in savepointed chunks: %s", model.__tablename__, e)
+    stmt = insert_statement(db, model)
+    ids = []
+    for i in range(0, len(rows), BULK_INSERT_CHUNK):
+        chunk = rows[i:i + BULK_INSERT_CHUNK]
+        if skip_bad_rows:
+            ids.extend(await insert_isolated(db, stmt, model, chunk))
+        else:
+            ids.extend((await db.execute(stmt, chunk)).scalars().all())
+    return ids
+
+def enrich_fundamentals(fjson: Dict[str, Any], academic_metrics: Dict[str, Optional[float]]) -> Dict[str, Any]:
+    """Fundamentals JSON plus its academic metrics and the legacy ratio names; risk_score is added by the caller"""
+    enriched = dict(fjson)
+    enriched.update(academic_metrics)
+    # Legacy calculations for backward compatibility
+    enriched["current_ratio"] = academic_metrics.get("current_ratio")
+    enriched["leverage_ratio"] = academic_metrics.get("debt_to_equity")
+    return enriched
+
+def manual_fundamentals_row(fundamentals_data: FundamentalsCreate) -> Dict[str, Any]:
+    """Build a company_fundamentals row enriched with academic metrics and a risk score"""
+    enriched = enrich_fundamentals(fundamentals_data.fundamentals or {},
+                                   compute_financial_metrics(fundamentals_data.fundamentals or {}))
+    enriched["risk_score"] = compute_risk_score(enriched)
+    return fundamentals_record(fundamentals_data, enriched)
+
+def manual_fundamentals_rows(items: List[FundamentalsCreate]) -> List[Dict[str, Any]]:
+    """manual_fundamentals_row for a whole batch, scoring every company in one pass of array operations"""
+    fjsons = [item.fundamentals or {} for item in items]
+    metrics = compute_financial_metrics_batch(numeric_matrix(fjsons, METRIC_FIELDS))
+    enriched = [enrich_fundamentals(fjson, metrics_at(metrics, i)) for i, fjson in enumerate(fjsons)]
+    for record, score in zip(enriched, compute_risk_score_batch(numeric_matrix(enriched, RISK_FIELDS)).tolist()):
+        record["risk_score"] = score
+    return [fundamentals_record(item, record) for item, record in zip(items, enriched)]
+
+def fundamentals_record(fundamentals_data: FundamentalsCreate, enriched: Dict[str, Any]) -> Dict[str, Any]:
+    """company_fundamentals row for an item whose enriched JSON (metrics and risk score) is already computed"""
+    fjson = fundamentals_data.fundamentals or {}
+    current_ratio = enriched["current_ratio"]
+    leverage_ratio = enriched["leverage_ratio"]
+    row = {
+        "company": fundamentals_data.company,
+        "symbol": fundamentals_data.ticker.upper(),
+        "fiscal_year": fundamentals_data.fiscal_year,
+        "fiscal_quarter": fundamentals_data.fiscal_quarter,
+        "fundamentals": enriched,
+        "source": fundamentals_data.source,
+        # Map specific fields
+        "total_revenue": fjson.get("total_revenue"),
+        "net_income": fjson.get("net_income"),
+        "free_cash_flow": fjson.get("free_cash_flow"),
+        "total_assets": fjson.get("total_assets"),
+        "total_liabilities": fjson.get("total_liabilities"),
+        "equity": fjson.get("equity"),
+        "debt_short": fjson.get("debt_short"),
+        "debt_long": fjson.get("debt_long"),
+        "total_debt": fjson.get("total_debt"),
+        "interest_expense": fjson.get("interest_expense"),
+        "cash": fjson.get("cash"),
+        "current_assets": fjson.get("current_assets"),
+        "current_liabilities": fjson.get("current_liabilities"),
+        "revenue_growth": fjson.get("revenue_growth"),
+        "sector": fjson.get("sector"),
+        "industry": fjson.get("industry"),
+        "region": fjson.get("region"),
+        "current_ratio": current_ratio,
+        "leverage_ratio": leverage_ratio,
+        "risk_score": enriched.get("risk_score")
     }
+    return row
 
-# Manual data ingestion endpoints
-@app.post(
-    "/manual/fundamentals",
-    summary="Manual Fundamentals Ingestion",
-    description="Manually add company fundamentals data",
-    tags=["Manual Ingest"]
-)
-def manual_ingest_fundamentals(fundamentals_data: FundamentalsCreate, db: Session = Depends(get_db)):
-    """Manually ingest company fundamentals"""
-    try:
-        # Calculate derived metrics and risk score
-        fjson = fundamentals_data.fundamentals or {}
-
-        # current_ratio = None
-        # if fjson.get("current_assets") and fjson.get("current_liabilities"):
-        #     try:
-        #         current_ratio = fjson["current_assets"] / fjson["current_liabilities"]
-        #     except (ZeroDivisionError, TypeError):
-        #         pass
-
-        # leverage_ratio = None
-        # if fjson.get("total_debt") and fjson.get("equity"):
-        #     try:
-        #         leverage_ratio = fjson["total_debt"] / fjson["equity"]
-        #     except (ZeroDivisionError, TypeError):
-        #         pass
+def manual_stock_price_row(price_data: StockPriceCreate) -> Dict[str, Any]:
+    return {
+        "symbol": price_data.ticker.upper(),  # Store ticker as symbol in DB
+        "date": price_data.date,
+        "open": price_data.open,
+        "close": price_data.close,
+        "high": price_data.high,
+        "low": price_data.low,
+        "volume": price_data.volume,
+        "source": price_data.source
+    }
 
-        # Enrich fundamentals data
+def manual_filing_row(filing_data: FilingCreate) -> Dict[str, Any]:
+    return {
+        "company": filing_data.company,
+        "symbol": filing_data.ticker.upper(),  # Store ticker as symbol in DB
+        "filing_type": filing_data.filing_type,
+        "filing_date": filing_data.filing_date,
+        "accession": filing_data.accession or content_accession(
+            filing_data.ticker.upper(), filing_data.filing_type, filing_data.filing_date, filing_data.data),
+        "data": filing_data.data,
+        "source": filing_data.source
+    }
 
-        academic_metrics = compute_financial_metrics(fjson)
-        
-        # Legacy calculations for backward compatibility
-        current_ratio = academic_metrics.get("current_ratio")
-        leverage_ratio = academic_metrics.get("debt_to_equity")
-
-        enriched = dict(fjson)
-
-        enriched.update(academic_metrics)
-        enriched["current_ratio"] = current_ratio
-        enriched["leverage_ratio"] = leverage_ratio
-        enriched["risk_score"] = compute_risk_score(enriched)
-
-        fundamental = CompanyFundamentals(
-                id=str(uuid.uuid4()),
-                company=fundamentals_data.company,
-                symbol=fundamentals_data.ticker.upper(),
-                fiscal_year=fundamentals_data.fiscal_year,
-                fiscal_quarter=fundamentals_data.fiscal_quarter,
-                fundamentals=enriched,
-                source=fundamentals_data.source,
-                ingested_at=datetime.now(UTC),
-                # Map specific fields
-                total_revenue=fjson.get("total_revenue"),
-                net_income=fjson.get("net_income"),
-                free_cash_flow=fjson.get("free_cash_flow"),
-                total_assets=fjson.get("total_assets"),
-                total_liabilities=fjson.get("total_liabilities"),
-                equity=fjson.get("equity"),
-                debt_short=fjson.get("debt_short"),
-                debt_long=fjson.get("debt_long"),
-                total_debt=fjson.get("total_debt"),
-                interest_expense=fjson.get("interest_expense"),
-                cash=fjson.get("cash"),
-                current_assets=fjson.get("current_assets"),
-                current_liabilities=fjson.get("current_liabilities"),
-                revenue_growth=fjson.get("revenue_growth"),
-                sector=fjson.get("sector"),
-                industry=fjson.get("industry"),
-                region=fjson.get("region"),
-                current_ratio=current_ratio,
-                leverage_ratio=leverage_ratio,
-                risk_score=enriched.get("risk_score")
-)
-        
-        db.add(fundamental)
-        db.commit()
-        log_ingestion("FUNDAMENTALS", 1, fundamentals_data.source, fundamentals_data.ticker)
-        return {
-            "status": "success",
-            "message": f"Successfully ingested fundamentals for {fundamentals_data.ticker}",
-            "id": fundamental.id,
-            "risk_score": enriched.get("risk_score"),
-            "academic_metrics": {
-                "roa": academic_metrics.get("roa"),
-                "leverage": academic_metrics.get("leverage"),
-                "revenue_growth": academic_metrics.get("revenue_growth"),
-                "retained_earnings_ratio": academic_metrics.get("retained_earnings_ratio"),
-                "net_income_growth_normalized": academic_metrics.get("net_income_growth_normalized")
-            }
+def fundamentals_summary(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Risk score and headline academic metrics echoed back after a fundamentals insert"""
+    enriched = row["fundamentals"]
+    return {
+        "risk_score": row["risk_score"],
+        "academic_metrics": {
+            "roa": enriched.get("roa"),
+            "leverage": enriched.get("leverage"),
+            "revenue_growth": enriched.get("revenue_growth"),
+            "retained_earnings_ratio": enriched.get("retained_earnings_ratio"),
+            "net_income_growth_normalized": enriched.get("net_income_growth_normalized")
         }
-    except Exception as e:
-        db.rollback()
-        logger.error(f"❌ Manual ingestion failed: {e}")
-        return handle_database_error(e, "manual_fundamentals")
+    }
 
-@app.post(
-    "/manual/stock-prices",
-    summary="Manual Stock Price Ingestion",
-    description="Manually add stock price data",
-    tags=["Manual Ingest"]
+def register_manual_ingest(path: str, model, create_model, build_row, data_type: str, name: str,
+                           noun: str, plural: str, summary: str, description: str, extra=None, build_rows=None):
+    """Register the single-row and /bulk POST routes for one manually ingested table"""
+    async def ingest_one(item: create_model, db: AsyncSession = Depends(get_async_db)):
+        try:
+            row = build_row(item)
+            # The database assigns id and ingested_at; RETURNING hands the id back in the same round trip
+            stored = (await db.execute(insert_statement(db, model).values(**row))).first()
+            await db.commit()
+            if stored is None:
+                return DefaultJSONResponse(status_code=409, content={"error": "Data already exists", "operation": f"manual_{name}"})
+            await invalidate_read_caches()
+            log_ingestion(data_type, 1, item.source, item.ticker)
+            return {
+                "status": "success",
+                "message": f"Successfully ingested {noun} for {item.ticker}",
+                "id": stored.id,
+                **(extra(row) if extra else {})
+            }
+        except Exception as e:
+            await db.rollback()
+            logger.error("❌ Manual %s ingestion failed: %s", noun, e)
+            return handle_database_error(e, f"manual_{name}")
+
+    # Bulk bodies are validated straight from the raw bytes: pydantic-core parses the JSON itself instead of
+    # FastAPI decoding it to Python objects first and validating those item by item
+    batch_adapter = TypeAdapter(List[create_model])
+
+    async def ingest_many(request: Request, db: AsyncSession = Depends(get_async_db)):
+        try:
+            items = batch_adapter.validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError([{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)])
+        try:
+            rows = build_rows(items) if build_rows else [build_row(item) for item in items]
+            ids = await bulk_insert(db, model, rows)
+            await db.commit()
+            if ids:
+                await invalidate_read_caches()
+            log_ingestion(data_type, len(ids), ",".join(sorted({item.source for item in items})),
+                          ",".join(sorted({item.ticker.upper() for item in items})))
+            return {
+                "status": "success",
+                "message": f"Successfully ingested {len(ids)} {plural}",
+                "records_created": len(ids),
+                "duplicates_skipped": len(rows) - len(ids),
+                "ids": ids
+            }
+        except Exception as e:
+            await db.rollback()
+            logger.error("❌ Bulk manual %s ingestion failed: %s", noun, e)
+            return handle_database_error(e, f"manual_{name}_bulk")
+
+    ingest_one.__name__ = f"manual_ingest_{name}"
+    ingest_one.__doc__ = f"Manually ingest {noun} data"
+    ingest_many.__name__ = f"manual_ingest_{name}_bulk"
+    ingest_many.__doc__ = f"Manually ingest a batch of {plural}"
+    app.post(path, summary=summary, description=description, tags=["Manual Ingest"])(ingest_one)
+    app.post(f"{path}/bulk", summary=f"Bulk {summary}", description=f"{description} in one transaction",
+             tags=["Manual Ingest"], openapi_extra={"requestBody": {"required": True, "content": {"application/json": {
+                 "schema": {"type": "array", "items": {"$ref": f"#/components/schemas/{create_model.__name__}"}}}}}})(ingest_many)
+    return ingest_one
+
+manual_ingest_fundamentals = register_manual_ingest(
+    "/manual/fundamentals", CompanyFundamentals, FundamentalsCreate, manual_fundamentals_row,
+    "FUNDAMENTALS", "fundamentals", "fundamentals", "fundamentals records",
+    "Manual Fundamentals Ingestion", "Manually add company fundamentals data", extra=fundamentals_summary,
+    build_rows=manual_fundamentals_rows
 )
-def manual_ingest_stock_price(price_data: StockPriceCreate, db: Session = Depends(get_db)):
-    """Manually ingest stock price data"""
-    try:
-        stock_price = StockPrice(
-            id=str(uuid.uuid4()),
-            symbol=price_data.ticker.upper(),  # Store ticker as symbol in DB
-            date=price_data.date,
-            open=price_data.open,
-            close=price_data.close,
-            high=price_data.high,
-            low=price_data.low,
-            volume=price_data.volume,
-            source=price_data.source,
-            ingested_at=datetime.now(UTC)
-        )
-        db.add(stock_price)
-        db.commit()
-        log_ingestion("STOCK_PRICE", 1, price_data.source, price_data.ticker)
-        return {
-            "status": "success",
-            "message": f"Successfully ingested stock price for {price_data.ticker}",
-            "id": stock_price.id
-        }
-    except Exception as e:
-        db.rollback()
-        logger.error(f"❌ Manual stock price ingestion failed: {e}")
-        return handle_database_error(e, "manual_stock_price")
-
-@app.post(
-    "/manual/regulatory-filings",
-    summary="Manual Filing Ingestion",
-    description="Manually add regulatory filing data",
-    tags=["Manual Ingest"]
+manual_ingest_stock_price = register_manual_ingest(
+    "/manual/stock-prices", StockPrice, StockPriceCreate, manual_stock_price_row,
+    "STOCK_PRICE", "stock_price", "stock price", "stock prices",
+    "Manual Stock Price Ingestion", "Manually add stock price data"
+)
+manual_ingest_filing = register_manual_ingest(
+    "/manual/regulatory-filings", RegulatoryFiling, FilingCreate, manual_filing_row,
+    "REGULATORY_FILING", "filing", "filing", "filings",
+    "Manual Filing Ingestion", "Manually add regulatory filing data"
 )
-def manual_ingest_filing(filing_data: FilingCreate, db: Session = Depends(get_db)):
-    """Manually ingest regulatory filing data"""
-    try:
-        filing = RegulatoryFiling(
-            id=str(uuid.uuid4()),
-            company=filing_data.company,
-            symbol=filing_data.ticker.upper(),  # Store ticker as symbol in DB
-            filing_type=filing_data.filing_type,
-            filing_date=filing_data.filing_date,
-            data=filing_data.data,
-            source=filing_data.source,
-            ingested_at=datetime.now(UTC)
-        )
-        db.add(filing)
-        db.commit()
-        log_ingestion("REGULATORY_FILING", 1, filing_data.source, filing_data.ticker)
-        return {
-            "status": "success",
-            "message": f"Successfully ingested filing for {filing_data.ticker}",
-            "id": filing.id
-        }
-    except Exception as e:
-        db.rollback()
-        logger.error(f"❌ Manual filing ingestion failed: {e}")
-        return handle_database_error(e, "manual_filing")
 
 # Legacy endpoints for backward compatibility
 @app.post(
@@ -1079,7 +1577,7 @@ def manual_ingest_filing(filing_data: FilingCreate, db: Session = Depends(get_db
     description="Store company fundamentals JSON + populate risk columns - Legacy endpoint",
     tags=["Manual Ingest"]
 )
-def create_company_fundamentals(cf: CompanyFundamentalsIn, db: Session = Depends(get_db)):
+async def create_company_fundamentals(cf: CompanyFundamentalsIn, db: AsyncSession = Depends(get_async_db)):
     """Legacy endpoint - use /manual/fundamentals instead"""
     fundamentals_data = FundamentalsCreate(
         company=cf.company,
@@ -1089,20 +1587,28 @@ def create_company_fundamentals(cf: CompanyFundamentalsIn, db: Session = Depends
         fundamentals=cf.fundamentals,
         source=cf.source
     )
-    return manual_ingest_fundamentals(fundamentals_data, db)
+    return await manual_ingest_fundamentals(fundamentals_data, db)
 
 @app.get("/company_fundamentals/", summary="List fundamentals (Legacy)", tags=["Data Retrieval"])
-def list_company_fundamentals(db: Session = Depends(get_db)):
+async def list_company_fundamentals(limit: int = Query(100, ge=1, le=1000), cursor: Optional[str] = None,
+                                    db: AsyncSession = Depends(get_async_db)):
     """Legacy endpoint - use /fundamentals instead"""
-    return db.query(CompanyFundamentals).all()
+    return await fetch_page(db, CompanyFundamentals, limit, cursor)
+
+@app.get("/company_fundamentals/stream", summary="Export fundamentals (Legacy)", tags=["Data Retrieval"])
+async def stream_company_fundamentals():
+    """Stream every stored fundamentals record as a JSON array"""
+    return stream_table(CompanyFundamentals)
 
 @app.get("/company_fundamentals/{fundamentals_id}", summary="Get fundamentals (Legacy)", tags=["Data Retrieval"])
-def get_company_fundamentals(fundamentals_id: str, db: Session = Depends(get_db)):
+async def get_company_fundamentals(request: Request, fundamentals_id: str, db: AsyncSession = Depends(get_async_db)):
     """Legacy endpoint - use /fundamentals/{ticker} instead"""
-    fundamentals = db.query(CompanyFundamentals).filter(CompanyFundamentals.id == fundamentals_id).first()
-    if not fundamentals:
-        raise HTTPException(status_code=404, detail="Company fundamentals not found")
-    return fundamentals
+    async def load():
+        fundamentals = await fetch_row(db, select_columns(CompanyFundamentals).where(CompanyFundamentals.id == fundamentals_id))
+        if not fundamentals:
+            raise HTTPException(status_code=404, detail="Company fundamentals not found")
+        return fundamentals
+    return await cached_record(request, f"fundamentals:{fundamentals_id}", load)
 
 # Advanced ingestion endpoints from old file
 @app.post(
@@ -1112,73 +1618,312 @@ def get_company_fundamentals(fundamentals_id: str, db: Session = Depends(get_db)
     description="Fetch + store fundamentals & recent prices - Legacy endpoint",
     tags=["Auto Fetch & Store"]
 )
-def ingest_credit_features(ticker: str = Path(..., min_length=1, max_length=10, description="Stock ticker symbol"),
-                          db: Session = Depends(get_db)):
+async def ingest_credit_features(ticker: str = Path(..., min_length=1, max_length=10, description="Stock ticker symbol"),
+                                 db: AsyncSession = Depends(get_async_db)):
     """Legacy endpoint - use /ingest/yahoo/{ticker} instead"""
-    return ingest_yahoo_fundamentals(ticker, db)
+    return await ingest_yahoo_fundamentals(ticker, db=db)
+
+async def fetch_ticker_bundle(ticker: str, session: aiohttp.ClientSession,
+                              yahoo_limit: asyncio.Semaphore, http_limit: asyncio.Semaphore, include_sec: bool = True):
+    """Fetch Yahoo credit features and (optionally) SEC filings for one ticker concurrently"""
+    async def fetch_yahoo():
+        async with yahoo_limit:
+            return await fetch_source("yahoo", ticker, fetch_credit_features, ticker, limiter=YAHOO_RATE_LIMIT)
+
+    if not include_sec:
+        return await fetch_yahoo(), None
+    return await asyncio.gather(fetch_yahoo(), fetch_sec_filings_async(ticker, session, http_limit))
+
+@app.post(
+    "/ingest/credit_features",
+    summary="Ingest Yahoo + SEC data for many tickers",
+    description="Fetch fundamentals, recent prices and SEC filings for a list of tickers concurrently and store them in one transaction.",
+    tags=["Auto Fetch & Store"]
+)
+async def ingest_credit_features_batch(request: BatchIngestRequest, db: AsyncSession = Depends(get_async_db)):
+    """Ingest Yahoo Finance and SEC Edgar data for multiple tickers"""
+    return await run_ingest_pipeline(request.tickers, request.filings_limit, db, "ingest_credit_features_batch",
+                                     "CREDIT_FEATURES_BATCH", "Yahoo Finance + SEC Edgar")
+
+async def run_ingest_pipeline(tickers: List[str], filings_limit: Optional[int], db: AsyncSession,
+                              operation: str, data_type: str, source: str):
+    """Fetch and store Yahoo (and, unless filings_limit is None, SEC) data for many tickers in one transaction"""
+    start_ts = datetime.now(UTC)
+    tickers = list(dict.fromkeys(t.upper() for t in tickers))
+    include_sec = filings_limit is not None
+    models = (CompanyFundamentals, StockPrice) + ((RegulatoryFiling,) if include_sec else ())
+
+    yahoo_limit = asyncio.Semaphore(YAHOO_FETCH_CONCURRENCY)
+    http_limit = asyncio.Semaphore(HTTP_FETCH_CONCURRENCY)
+    # fetch -> parse -> write stages; bounded queues apply backpressure to the stage before
+    fetch_q = asyncio.Queue(maxsize=PIPELINE_FETCH_QUEUE)
+    write_q = asyncio.Queue(maxsize=PIPELINE_WRITE_QUEUE)
+    failed = {}
+    records_created = {model.__tablename__: 0 for model in models}
+
+    async def fetch_stage(session: aiohttp.ClientSession):
+        async def fetch_one(ticker: str):
+            try:
+                result = await fetch_ticker_bundle(ticker, session, yahoo_limit, http_limit, include_sec)
+            except Exception as e:
+                result = e
+            await fetch_q.put((ticker, result))
+
+        await asyncio.gather(*(fetch_one(t) for t in tickers))
+        await fetch_q.put(None)
+
+    async def parse_stage():
+        while (item := await fetch_q.get()) is not None:
+            ticker, result = item
+            if isinstance(result, Exception):
+                logger.warning("⚠️ Skipping %s: %s", ticker, result)
+                failed[ticker] = str(result)
+                continue
+
+            yahoo_data, filings_data = result
+            batch = {model: [] for model in models}
+            if yahoo_data and "fundamentals" in yahoo_data:
+                fundamentals_row, batch[StockPrice] = build_yahoo_rows(ticker, yahoo_data, start_ts)
+                if fundamentals_row:
+                    batch[CompanyFundamentals].append(fundamentals_row)
+            else:
+                failed[ticker] = f"Invalid data structure received from Yahoo Finance for {ticker}"
+            if include_sec and isinstance(filings_data, list):
+                batch[RegulatoryFiling] = build_sec_filing_rows(ticker, filings_data, filings_limit, start_ts)
+            await write_q.put(batch)
+        await write_q.put(None)
+
+    async def write_stage():
+        # Buffer rows until PIPELINE_FLUSH_ROWS or PIPELINE_FLUSH_SECONDS, whichever comes first
+        buffers = {model: [] for model in models}
+        loop = asyncio.get_running_loop()
+        buffered, deadline = 0, None
+
+        async def flush():
+            for model, rows in buffers.items():
+                records_created[model.__tablename__] += len(await bulk_insert(db, model, rows, skip_bad_rows=True))
+                rows.clear()
+
+        while True:
+            timeout = None if deadline is None else max(deadline - loop.time(), 0)
+            try:
+                batch = await asyncio.wait_for(write_q.get(), timeout)
+            except asyncio.TimeoutError:
+                await flush()
+                buffered, deadline = 0, None
+                continue
+            if batch is None:
+                await flush()
+                return
+            for model, rows in batch.items():
+                buffers[model].extend(rows)
+                buffered += len(rows)
+            if deadline is None:
+                deadline = loop.time() + PIPELINE_FLUSH_SECONDS
+            if buffered >= PIPELINE_FLUSH_ROWS:
+                await flush()
+                buffered, deadline = 0, None
+
+    connector = aiohttp.TCPConnector(limit_per_host=HTTP_FETCH_CONCURRENCY)
+    try:
+        # Flushes go into one transaction that is committed once every stage has finished
+        async with aiohttp.ClientSession(connector=connector) as session:
+            async with asyncio.TaskGroup() as stages:
+                stages.create_task(fetch_stage(session))
+                stages.create_task(parse_stage())
+                stages.create_task(write_stage())
+        await db.commit()
+    except Exception as e:
+        if isinstance(e, ExceptionGroup):
+            e = e.exceptions[0]
+        await db.rollback()
+        logger.error("❌ INGESTION FAILED: batch %s: %s", tickers, e)
+        return handle_database_error(e, operation)
+
+    if any(records_created.values()):
+        await invalidate_read_caches()
+    log_ingestion(data_type, sum(records_created.values()), source, ",".join(tickers))
+    return {
+        "status": "success",
+        "message": f"Ingested data for {len(tickers) - len(failed)} of {len(tickers)} tickers",
+        "records_created": records_created,
+        "failed": failed,
+        "ingestion_timestamp": start_ts,
+        "source": source
+    }
 
 # System Status and Health Check Endpoints
+# Liveness probes run every few seconds, so /health answers from the process alone; /health/ready does the round trip
 @app.get(
     "/health",
     summary="Health Check",
+    description="Liveness check: the API process is serving. Reports the connection pool without touching the database.",
+    tags=["System"]
+)
+async def health_check():
+    """System liveness endpoint"""
+    return {
+        "status": "healthy",
+        "timestamp": datetime.now(UTC),
+        "pool": async_engine.pool.status(),
+        "api": "running"
+    }
+
+@app.get(
+    "/health/ready",
+    summary="Readiness Check",
     description="API and database status check.",
     tags=["System"]
 )
-def health_check():
-    """System health check endpoint"""
+async def readiness_check():
+    """System readiness endpoint"""
     db = None
     try:
         # Open a DB session
-        db = SessionLocal()
+        db = AsyncSessionLocal()
 
         # Execute a simple query to test database connectivity
-        result = db.execute(text("SELECT 1")).fetchone()
+        await db.execute(text("SELECT 1"))
 
         return {
             "status": "healthy",
             "timestamp": datetime.now(UTC),
             "database": "connected",
+            "pool": async_engine.pool.status(),
             "api": "running"
         }
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        return JSONResponse(
+        logger.error("Health check failed: %s", e)
+        return DefaultJSONResponse(
             status_code=503,
             content={
                 "status": "unhealthy",
                 "timestamp": datetime.now(UTC),
                 "database": "disconnected" if db is None else "error",
+                "pool": async_engine.pool.status(),
                 "api": "running",
                 "error": str(e)
             }
         )
     finally:
         if db:
-            db.close()
+            await db.close()
 
 # System Statistics and Configuration Endpoints
-@app.get(
+STATS_COUNTS = {
+    "fundamentals_count": CompanyFundamentals,
+    "stock_prices_count": StockPrice,
+    "economic_indicators_count": EconomicIndicator,
+    "regulatory_filings_count": RegulatoryFiling,
+}
+
+STATS_CACHE_KEY = "credtech:stats"
+STATS_STALE_KEY = "credtech:stats:stale"  # last good body, served if the database is unreachable
+STATS_CACHE_TTL = 30
+STATS_STALE_TTL = 86400
+STATS_CLIENT_MAX_AGE = 10
+
+async def invalidate_read_caches():
+    """Drop the fresh /stats entry and the cached listings after a write; the stale /stats copy stays as the outage fallback"""
+    await cache_clear(key=STATS_CACHE_KEY)
+    await cache_clear(namespace=READ_CACHE_NAMESPACE)
+
+# Every count as a scalar subquery of one SELECT, so /stats is a single round trip
+STATS_QUERY = select(
+    *(select(func.count()).select_from(model).scalar_subquery().label(key) for key, model in STATS_COUNTS.items()),
+    select(func.count(distinct(CompanyFundamentals.symbol))).scalar_subquery().label("unique_tickers"),
+)
+
+# Trigger-maintained counters (init.sql): exact, and a primary-key lookup per table
+STATS_COUNTER_QUERY = select(
+    *(select(TableCount.n).where(TableCount.name == model.__tablename__).scalar_subquery().label(key)
+      for key, model in STATS_COUNTS.items()),
+    select(func.count(distinct(CompanyFundamentals.symbol))).scalar_subquery().label("unique_tickers"),
+)
+
+# PostgreSQL keeps a row estimate per table in pg_class (refreshed by ANALYZE/autovacuum), which is
+# a catalog lookup instead of a sequential scan; reltuples is -1 for tables never analyzed
+STATS_ESTIMATE_QUERY = text("SELECT " + ", ".join(
+    [f"(SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass('{model.__tablename__}')) AS {key}"
+     for key, model in STATS_COUNTS.items()]
+    + ["(SELECT count(DISTINCT symbol) FROM company_fundamentals) AS unique_tickers"]
+))
+
+async def query_stats(db: AsyncSession) -> Dict[str, Any]:
+    """Table sizes from the trigger-maintained counters on PostgreSQL, then planner estimates for any table
+    without a counter row, and exact counts elsewhere or when neither exists"""
+    if db.get_bind().dialect.name == "postgresql":
+        stats = dict((await db.execute(STATS_COUNTER_QUERY)).one()._mapping)
+        if all(stats[key] is not None for key in STATS_COUNTS):
+            stats["counts_estimated"] = False
+            return stats
+        stats = dict((await db.execute(STATS_ESTIMATE_QUERY)).one()._mapping)
+        if all(stats[key] is not None and stats[key] >= 0 for key in STATS_COUNTS):
+            stats["counts_estimated"] = True
+            return stats
+    stats = dict((await db.execute(STATS_QUERY)).one()._mapping)
+    stats["counts_estimated"] = False
+    return stats
+
+async def refresh_stats(db: AsyncSession) -> bytes:
+    """Query the stats, store the entry under the fresh and stale keys and return it"""
+    stats = await query_stats(db)
+    stats["data_sources"] = Config.SOURCES
+    # The ETag covers the counts but not the timestamp, so pollers keep getting 304 until the data changes
+    etag = body_etag(dump_json(stats))
+    stats["timestamp"] = datetime.now(UTC)
+    entry = etag.encode() + dump_json(stats)
+    await cache_set(STATS_CACHE_KEY, entry, STATS_CACHE_TTL)
+    await cache_set(STATS_STALE_KEY, entry, STATS_STALE_TTL)
+    return entry
+
+stats_refresh: Optional[asyncio.Task] = None
+
+async def load_stats() -> bytes:
+    async with AsyncSessionLocal() as db:
+        return await refresh_stats(db)
+
+def clear_stats_refresh(task: asyncio.Task):
+    global stats_refresh
+    stats_refresh = None
+
+async def refresh_stats_once() -> bytes:
+    """Single-flight refresh: concurrent misses in this process await one query instead of each running it"""
+    global stats_refresh
+    if stats_refresh is None:
+        stats_refresh = asyncio.create_task(load_stats())
+        stats_refresh.add_done_callback(clear_stats_refresh)
+    # A disconnecting client cancels only its own wait, not the refresh the others are sharing
+    return await asyncio.shield(stats_refresh)
+
+def stats_response(request: Request, entry: bytes, cache_status: str) -> Response:
+    """Answer a /stats request from a cache entry, with 304 when the client already holds these counts"""
+    return etag_response(request, entry[:ETAG_LENGTH].decode(), entry[ETAG_LENGTH:],
+                         {"Cache-Control": f"max-age={STATS_CLIENT_MAX_AGE}", "X-Cache": cache_status})
+
+@app.api_route(
     "/stats",
+    methods=["GET", "HEAD"],
     summary="Database Statistics",
-    description="Get statistics about stored data",
+    description="Get statistics about stored data. On PostgreSQL the record counts come from trigger-maintained "
+                "counters, which move with each committed write; without them they are planner estimates "
+                "(typically within a few percent, see counts_estimated). unique_tickers is always exact.",
     tags=["System"]
 )
-def get_stats(db: Session = Depends(get_db)):
+async def get_stats(request: Request):
     """Get database statistics"""
+    cached = await cache_get(STATS_CACHE_KEY)
+    if cached is not None:
+        return stats_response(request, cached, "HIT")
     try:
-        stats = {
-            "fundamentals_count": db.query(CompanyFundamentals).count(),
-            "stock_prices_count": db.query(StockPrice).count(),
-            "economic_indicators_count": db.query(EconomicIndicator).count(),
-            "regulatory_filings_count": db.query(RegulatoryFiling).count(),
-            "unique_tickers": db.query(CompanyFundamentals.symbol).distinct().count(),
-            "data_sources": Config.SOURCES,
-            "timestamp": datetime.now(UTC)
-        }
-        return stats
+        entry = await refresh_stats_once()
     except Exception as e:
-        logger.error(f"❌ Stats retrieval failed: {e}")
+        logger.error("❌ Stats retrieval failed: %s", e)
+        stale = await cache_get(STATS_STALE_KEY)
+        if stale is not None:
+            return stats_response(request, stale, "STALE")
         return handle_database_error(e, "get_stats")
+    return stats_response(request, entry, "MISS")
 
 @app.get(
     "/config",
@@ -1186,7 +1931,7 @@ def get_stats(db: Session = Depends(get_db)):
     description="Get API configuration information",
     tags=["System"]
 )
-def get_config():
+async def get_config():
     """Get API configuration"""
     return {
         "db_type": Config.DB_TYPE,
@@ -1196,44 +1941,73 @@ def get_config():
         "timestamp": datetime.now(UTC)
     }
 
-@app.get("/db_creds", tags=["System"])
-def get_db_creds():
+# Config is fixed for the life of the process, so the body is serialized once; the password never leaves the process
+DB_CREDS_BODY = dump_json({"db_url": make_url(Config.DB_URL).render_as_string(hide_password=True), "db_type": Config.DB_TYPE})
+DB_CREDS_HEADERS = {"Cache-Control": "private, max-age=300"}
+
+@app.get("/db_creds", tags=["System"], response_class=Response, dependencies=[Depends(require_admin)])
+async def get_db_creds():
     """Get database credentials info"""
-    return {
-        "db_url": Config.DB_URL,
-        "db_type": Config.DB_TYPE
-    }
+    return Response(content=DB_CREDS_BODY, media_type="application/json", headers=DB_CREDS_HEADERS)
+
+@app.post("/admin/refresh-metrics", tags=["System"], dependencies=[Depends(require_admin)])
+async def refresh_company_metrics(db: AsyncSession = Depends(get_async_db)):
+    """Recompute the company_metrics materialized view (init.sql); meant for a nightly job"""
+    if async_engine.dialect.name != "postgresql":
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail="company_metrics requires PostgreSQL")
+    await db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY company_metrics"))
+    await db.commit()
+    return {"status": "refreshed", "view": "company_metrics"}
 
 # Additional legacy endpoints
 @app.get("/regulatory_filings/", summary="List regulatory filings (Legacy)", tags=["Data Retrieval"])
-def list_reg_filings(db: Session = Depends(get_db)):
+async def list_reg_filings(limit: int = Query(100, ge=1, le=1000), cursor: Optional[str] = None,
+                           db: AsyncSession = Depends(get_async_db)):
     """Legacy endpoint - use /regulatory-filings instead"""
-    return db.query(RegulatoryFiling).all()
+    return await fetch_page(db, RegulatoryFiling, limit, cursor)
+
+@app.get("/regulatory_filings/stream", summary="Export regulatory filings (Legacy)", tags=["Data Retrieval"])
+async def stream_reg_filings():
+    """Stream every stored regulatory filing as a JSON array"""
+    return stream_table(RegulatoryFiling)
 
 @app.get("/regulatory_filings/{filing_id}", summary="Get regulatory filing (Legacy)", tags=["Data Retrieval"])
-def get_reg_filing(filing_id: str, db: Session = Depends(get_db)):
+async def get_reg_filing(request: Request, filing_id: str, db: AsyncSession = Depends(get_async_db)):
     """Legacy endpoint - use /regulatory-filings instead"""
-    rf = db.query(RegulatoryFiling).filter(RegulatoryFiling.id == filing_id).first()
-    if not rf:
-        raise HTTPException(status_code=404, detail="Filing not found")
-    return rf
+    async def load():
+        rf = await fetch_row(db, select_columns(RegulatoryFiling).where(RegulatoryFiling.id == filing_id))
+        if not rf:
+            raise HTTPException(status_code=404, detail="Filing not found")
+        return rf
+    return await cached_record(request, f"filing:{filing_id}", load)
 
 @app.get("/economic_indicators/", summary="List economic indicators (Legacy)", tags=["Data Retrieval"])
-def list_economic_indicators(db: Session = Depends(get_db)):
+async def list_economic_indicators(limit: int = Query(100, ge=1, le=1000), cursor: Optional[str] = None,
+                                   db: AsyncSession = Depends(get_async_db)):
     """Legacy endpoint - use /economic-indicators instead"""
-    return db.query(EconomicIndicator).all()
+    return await fetch_page(db, EconomicIndicator, limit, cursor)
+
+@app.get("/economic_indicators/stream", summary="Export economic indicators (Legacy)", tags=["Data Retrieval"])
+async def stream_economic_indicators():
+    """Stream every stored economic indicator as a JSON array"""
+    return stream_table(EconomicIndicator)
 
 @app.get("/economic_indicators/{indicator_id}", summary="Get economic indicator (Legacy)", tags=["Data Retrieval"])
-def get_economic_indicator(indicator_id: str, db: Session = Depends(get_db)):
+async def get_economic_indicator(request: Request, indicator_id: str, db: AsyncSession = Depends(get_async_db)):
     """Legacy endpoint - use /economic-indicators instead"""
-    ei = db.query(EconomicIndicator).filter(EconomicIndicator.id == indicator_id).first()
-    if not ei:
-        raise HTTPException(status_code=404, detail="Indicator not found")
-    return ei
+    async def load():
+        ei = await fetch_row(db, select_columns(EconomicIndicator).where(EconomicIndicator.id == indicator_id))
+        if not ei:
+            raise HTTPException(status_code=404, detail="Indicator not found")
+        return ei
+    return await cached_record(request, f"indicator:{indicator_id}", load)
 
 # Mount the Socket.IO app
 app.mount("/socket.io", socketio_app)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Workers need an import string; each one imports the module and so builds its own connection pools.
+    # With more than one worker, set REDIS_URL so the response cache and its invalidation are shared.
+    uvicorn.run("api:app", host="0.0.0.0", port=8000, workers=Config.API_WORKERS,
+                loop="uvloop", http="httptools", access_log=Config.ACCESS_LOG)
@@ -5,7 +5,9 @@ Provides OHLCV data and real-time updates for financial charts
 
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import select
 from sqlalchemy.orm import sessionmaker
+from responses import DefaultJSONResponse
 from storage import SessionLocal, engine
 from models import StockPrice, CompanyFundamentals
 from sources.yahoo_finance_features import fetch_stock_price_data
@@ -15,7 +17,10 @@ import json
 import asyncio
 import uvicorn
 
-app = FastAPI(title="CredTech Candlestick API", version="1.0.0")
+app = FastAPI(title="CredTech Candlestick API", version="1.0.0", default_response_class=DefaultJSONResponse)
+
+CANDLE_COLUMNS = (StockPrice.date, StockPrice.open, StockPrice.high, StockPrice.low, StockPrice.close, StockPrice.volume)
+CANDLE_KEYS = tuple(column.key for column in CANDLE_COLUMNS)
 
 # Enable CORS for frontend
 app.add_middleware(
@@ -87,34 +92,26 @@ async def get_candlestick_data(
         else:
             start_date = end_date - timedelta(days=365)
         
-        # Query database
-        db_data = db.query(StockPrice).filter(
-            StockPrice.symbol == symbol,
-            StockPrice.date >= start_date
-        ).order_by(StockPrice.date).all()
+        # Query database: plain row tuples instead of ORM objects; the response class encodes the datetimes
+        db_data = db.execute(
+            select(*CANDLE_COLUMNS, StockPrice.ingested_at)
+            .where(StockPrice.symbol == symbol, StockPrice.date >= start_date)
+            .order_by(StockPrice.date)
+        ).all()
         
         db.close()
         
         # If we have recent data in database, use it
         if db_data and len(db_data) > 10:
-            candlestick_data = []
-            for record in db_data:
-                candlestick_data.append({
-                    "date": record.date.isoformat(),
-                    "open": record.open,
-                    "high": record.high,
-                    "low": record.low,
-                    "close": record.close,
-                    "volume": record.volume
-                })
-            
+            last_ingested = db_data[-1].ingested_at
             return {
                 "symbol": symbol,
                 "period": period,
                 "interval": interval,
-                "data": candlestick_data,
+                # zip stops at the candle keys, leaving ingested_at out
+                "data": [dict(zip(CANDLE_KEYS, row)) for row in db_data],
                 "source": "database",
-                "last_updated": db_data[-1].ingested_at.isoformat() if db_data else None
+                "last_updated": last_ingested.isoformat() if last_ingested else None
             }
         
         # Otherwise fetch fresh data from Yahoo Finance
@@ -7,4 +7,26 @@ class Config:
         "SEC_EDGAR", "YahooFinance", "FRED",
     ]
     SOCKET_IO_PORT = int(os.getenv("SOCKET_IO_PORT", 5001))
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 20))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 40))
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))  # seconds
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 30))  # seconds to wait for a free connection
+    # Pinging on every checkout costs a round trip per request; recycling already retires idle connections
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"
+    DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", 1200))  # compiled statements kept per engine
+    ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+    # Interactive docs are off in production unless configured; an empty value disables an endpoint
+    DOCS_URL = os.getenv("DOCS_URL", "" if ENVIRONMENT == "production" else "/docs") or None
+    REDOC_URL = os.getenv("REDOC_URL", "" if ENVIRONMENT == "production" else "/redoc") or None
+    OPENAPI_URL = os.getenv("OPENAPI_URL", "" if ENVIRONMENT == "production" else "/openapi.json") or None
+    # Exact-match allowlist (the Next.js dev server by default); "*" is still accepted but opts out of the allowlist
+    CORS_ORIGINS = frozenset(o.strip() for o in os.getenv(
+        "CORS_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000").split(",") if o.strip())
+    CORS_CREDENTIALS = os.getenv("CORS_CREDENTIALS", "true").lower() == "true"
+    REDIS_URL = os.getenv("REDIS_URL")  # unset -> in-process response cache
+    CACHE_TTL = int(os.getenv("CACHE_TTL", 300))
+    ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")  # bearer token for admin-only endpoints; unset -> those endpoints are refused
+    API_WORKERS = int(os.getenv("API_WORKERS", os.cpu_count() or 1))
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING" if ENVIRONMENT == "production" else "INFO").upper()
+    ACCESS_LOG = os.getenv("ACCESS_LOG", "false" if ENVIRONMENT == "production" else "true").lower() == "true"
     # Add more config as needed like : "WorldBank", "Morningstar", "Quandl", "S&P", "Moody's", "Fitch"
@@ -21,6 +21,7 @@ root_dir = os.path.join(current_dir, '..', '..')
 sys.path.insert(0, root_dir)  # Add root directory to Python path
 
 # Import existing modules
+from responses import DefaultJSONResponse
 from storage import SessionLocal
 from models import CompanyFundamentals
 from sources.yahoo_finance_features import fetch_credit_features, fetch_historical_fundamentals
@@ -41,10 +42,10 @@ try:
     SENTIMENT_AVAILABLE = True
     logger.info("Sentiment analysis module loaded successfully")
 except ImportError as e:
-    logger.warning(f"Sentiment analysis not available: {e}")
+    logger.warning("Sentiment analysis not available: %s", e)
     SENTIMENT_AVAILABLE = False
 except Exception as e:
-    logger.warning(f"Sentiment analysis module error: {e}")
+    logger.warning("Sentiment analysis module error: %s", e)
     SENTIMENT_AVAILABLE = False
 
 # Import news service
@@ -53,10 +54,10 @@ try:
     NEWS_AVAILABLE = True
     logger.info("News service module loaded successfully")
 except ImportError as e:
-    logger.warning(f"News service not available: {e}")
+    logger.warning("News service not available: %s", e)
     NEWS_AVAILABLE = False
 except Exception as e:
-    logger.warning(f"News service module error: {e}")
+    logger.warning("News service module error: %s", e)
     NEWS_AVAILABLE = False
 
 # Database dependency function
@@ -73,21 +74,22 @@ try:
     from feature_engineering.AcademicFeatureEngineer import AcademicFeatureEngineer
     PIPELINE_AVAILABLE = True
 except ImportError as e:
-    logger.warning(f"Pipeline not available: {e}")
+    logger.warning("Pipeline not available: %s", e)
     PIPELINE_AVAILABLE = False
 
 try:
     from model_training.cds_prediction_model import CDSPredictionModel
     MODEL_AVAILABLE = True
 except ImportError as e:
-    logger.warning(f"Model training not available: {e}")
+    logger.warning("Model training not available: %s", e)
     MODEL_AVAILABLE = False
 
 # Create FastAPI app
 app = FastAPI(
     title="CredTech API",
     description="Credit Risk Management and CDS Prediction Platform",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=DefaultJSONResponse
 )
 
 # Define the specific origins that are allowed to connect.
@@ -130,20 +132,14 @@ async def get_dashboard_summary():
     """Get comprehensive dashboard summary for frontend"""
     db = SessionLocal()
     try:
-        # Get portfolio summary
-        total_companies = db.query(CompanyFundamentals.symbol).distinct().count()
-        
-        # Recent ingestions (last 7 days)
+        # Portfolio summary, recent ingestions (last 7 days) and average risk score in one aggregate query
         week_ago = datetime.now() - timedelta(days=7)
-        recent_data = db.query(CompanyFundamentals)\
-            .filter(CompanyFundamentals.ingested_at >= week_ago)\
-            .count()
-        
-        # Calculate average risk score
-        risk_scores = db.query(CompanyFundamentals.risk_score)\
-            .filter(CompanyFundamentals.risk_score.isnot(None))\
-            .all()
-        avg_risk_score = sum([r[0] for r in risk_scores]) / len(risk_scores) if risk_scores else 0
+        total_companies, recent_data, avg_risk_score = db.query(
+            func.count(CompanyFundamentals.symbol.distinct()),
+            func.count().filter(CompanyFundamentals.ingested_at >= week_ago),
+            func.avg(CompanyFundamentals.risk_score),  # NULL scores are skipped
+        ).one()
+        avg_risk_score = avg_risk_score or 0
         
         # Get sector distribution
         sectors = db.execute(text("""
@@ -187,7 +183,7 @@ async def get_dashboard_summary():
             }
         }
     except Exception as e:
-        logger.error(f"Dashboard summary error: {e}")
+        logger.error("Dashboard summary error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         db.close()
@@ -261,7 +257,7 @@ async def get_companies(
             }
         }
     except Exception as e:
-        logger.error(f"Get companies error: {e}")
+        logger.error("Get companies error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         db.close()
@@ -287,7 +283,7 @@ async def get_company_analysis(symbol: str):
                 pipeline = AcademicFeatureEngineer()
                 enhanced_features = pipeline.process_company(symbol.upper())
             except Exception as e:
-                logger.warning(f"Feature engineering failed for {symbol}: {e}")
+                logger.warning("Feature engineering failed for %s: %s", symbol, e)
                 enhanced_features = {"error": "Feature engineering unavailable"}
         
         # Get model predictions if available
@@ -298,7 +294,7 @@ async def get_company_analysis(symbol: str):
                 predictions = model.train_model_from_postgres([symbol.upper()])
                 model_predictions = predictions
             except Exception as e:
-                logger.warning(f"Model prediction failed for {symbol}: {e}")
+                logger.warning("Model prediction failed for %s: %s", symbol, e)
                 model_predictions = {"error": "Model predictions unavailable"}
         
         fundamentals = company.fundamentals or {}
@@ -352,7 +348,7 @@ async def get_company_analysis(symbol: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Company analysis error for {symbol}: {e}")
+        logger.error("Company analysis error for %s: %s", symbol, e)
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         db.close()
@@ -382,7 +378,7 @@ async def fetch_company_historical(
                 db.merge(fundamentals)  # Use merge to handle duplicates
                 stored_records += 1
             except Exception as e:
-                logger.warning(f"Failed to store quarter data for {ticker}: {e}")
+                logger.warning("Failed to store quarter data for %s: %s", ticker, e)
         
         db.commit()
         
@@ -400,7 +396,7 @@ async def fetch_company_historical(
         }
         
     except Exception as e:
-        logger.error(f"Error in fetch_company_historical for {ticker}: {e}")
+        logger.error("Error in fetch_company_historical for %s: %s", ticker, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -436,7 +432,7 @@ async def fetch_bulk_historical(
                         db.merge(fundamentals)
                         company_stored += 1
                     except Exception as e:
-                        logger.warning(f"Failed to store quarter data for {symbol}: {e}")
+                        logger.warning("Failed to store quarter data for %s: %s", symbol, e)
                 
                 if company_stored > 0:
                     total_stored += company_stored
@@ -462,7 +458,7 @@ async def fetch_bulk_historical(
         }
         
     except Exception as e:
-        logger.error(f"Error in fetch_bulk_historical: {e}")
+        logger.error("Error in fetch_bulk_historical: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -547,7 +543,7 @@ async def get_panel_dataset_info(db: Session = Depends(get_db)):
         }
         
     except Exception as e:
-        logger.error(f"Error in get_panel_dataset_info: {e}")
+        logger.error("Error in get_panel_dataset_info: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -639,7 +635,7 @@ async def train_academic_models(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in train_academic_models: {e}")
+        logger.error("Error in train_academic_models: %s", e)
         raise HTTPException(status_code=500, detail=f"Model training failed: {str(e)}")
 
 
@@ -724,7 +720,7 @@ async def get_academic_model_status(db: Session = Depends(get_db)):
         }
         
     except Exception as e:
-        logger.error(f"Error in get_academic_model_status: {e}")
+        logger.error("Error in get_academic_model_status: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -788,7 +784,7 @@ async def analyze_portfolio(portfolio_data: Dict):
                 model = CDSPredictionModel('panel_fe')
                 model_results = model.train_model_from_postgres(symbols)
             except Exception as e:
-                logger.warning(f"Portfolio model training failed: {e}")
+                logger.warning("Portfolio model training failed: %s", e)
                 model_results = {"error": "Model training failed"}
         
         return {
@@ -811,7 +807,7 @@ async def analyze_portfolio(portfolio_data: Dict):
             "recommendations": generate_portfolio_recommendations(portfolio_companies, avg_portfolio_risk)
         }
     except Exception as e:
-        logger.error(f"Portfolio analysis error: {e}")
+        logger.error("Portfolio analysis error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/models/train")
@@ -843,18 +839,18 @@ async def train_risk_model(
 async def run_full_pipeline(symbol: str):
     """Background task to run complete data pipeline for a symbol"""
     try:
-        logger.info(f"Starting full pipeline for {symbol}")
+        logger.info("Starting full pipeline for %s", symbol)
         
         # Step 1: Fetch fresh data from Yahoo Finance
-        logger.info(f"Step 1: Fetching Yahoo Finance data for {symbol}")
+        logger.info("Step 1: Fetching Yahoo Finance data for %s", symbol)
         fundamentals = fetch_credit_features(symbol)
         
         if "error" in fundamentals:
-            logger.error(f"Data fetching failed for {symbol}: {fundamentals['error']}")
+            logger.error("Data fetching failed for %s: %s", symbol, fundamentals['error'])
             return
         
         # Step 2: Store in database
-        logger.info(f"Step 2: Storing data for {symbol}")
+        logger.info("Step 2: Storing data for %s", symbol)
         db = SessionLocal()
         try:
             # Check if company exists, update or create
@@ -903,38 +899,38 @@ async def run_full_pipeline(symbol: str):
                 db.add(new_company)
             
             db.commit()
-            logger.info(f"Step 2 completed: Data stored for {symbol}")
+            logger.info("Step 2 completed: Data stored for %s", symbol)
             
         finally:
             db.close()
         
         # Step 3: Run feature engineering if available
         if PIPELINE_AVAILABLE:
-            logger.info(f"Step 3: Running feature engineering for {symbol}")
+            logger.info("Step 3: Running feature engineering for %s", symbol)
             try:
                 pipeline = AcademicFeatureEngineer()
                 enhanced_features = pipeline.process_company(symbol)
-                logger.info(f"Step 3 completed: Enhanced features generated for {symbol}")
+                logger.info("Step 3 completed: Enhanced features generated for %s", symbol)
             except Exception as e:
-                logger.warning(f"Feature engineering failed for {symbol}: {e}")
+                logger.warning("Feature engineering failed for %s: %s", symbol, e)
         
-        logger.info(f"✅ Full pipeline completed successfully for {symbol}")
+        logger.info("✅ Full pipeline completed successfully for %s", symbol)
         
     except Exception as e:
-        logger.error(f"❌ Pipeline failed for {symbol}: {e}")
+        logger.error("❌ Pipeline failed for %s: %s", symbol, e)
 
 async def run_model_training(symbols: List[str], model_type: str):
     """Background task for model training"""
     try:
-        logger.info(f"Starting model training: {model_type} with {len(symbols)} symbols")
+        logger.info("Starting model training: %s with %s symbols", model_type, len(symbols))
         
         model = CDSPredictionModel(model_type)
         results = model.train_model_from_postgres(symbols)
         
-        logger.info(f"✅ Model training completed: {results.get('success', False)}")
+        logger.info("✅ Model training completed: %s", results.get('success', False))
         
     except Exception as e:
-        logger.error(f"❌ Model training failed: {e}")
+        logger.error("❌ Model training failed: %s", e)
 
 # Helper functions
 def calculate_risk_score(fundamentals: Dict) -> float:
@@ -1060,7 +1056,7 @@ async def get_feature_importance():
         }
         
     except Exception as e:
-        logger.error(f"Error getting feature importance: {e}")
+        logger.error("Error getting feature importance: %s", e)
         raise HTTPException(status_code=500, detail=f"Error retrieving feature importance: {str(e)}")
 
 
@@ -1099,7 +1095,7 @@ async def get_top_risk_factors(limit: int = Query(10, ge=1, le=50)):
         }
         
     except Exception as e:
-        logger.error(f"Error getting top features: {e}")
+        logger.error("Error getting top features: %s", e)
         raise HTTPException(status_code=500, detail=f"Error retrieving top features: {str(e)}")
 
 
@@ -1145,7 +1141,7 @@ async def get_explainability_insights():
         }
         
     except Exception as e:
-        logger.error(f"Error getting insights: {e}")
+        logger.error("Error getting insights: %s", e)
         raise HTTPException(status_code=500, detail=f"Error retrieving insights: {str(e)}")
 
 
@@ -1167,7 +1163,8 @@ async def get_candlestick_data(symbol: str, timeframe: str = "1Y", db: Session =
         else:  # 1Y
             days = 365
         
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        now = datetime.utcnow()
+        cutoff_date = now - timedelta(days=days)
         
         # For now, generate sample data since we don't have MarketData table yet
         import random
@@ -1175,7 +1172,7 @@ async def get_candlestick_data(symbol: str, timeframe: str = "1Y", db: Session =
         candlesticks = []
         
         for i in range(min(days, 100)):  # Limit to 100 points for performance
-            date_obj = datetime.utcnow() - timedelta(days=days-i)
+            date_obj = now - timedelta(days=days-i)
             
             # Simulate realistic price movement
             change = random.uniform(-0.05, 0.05)
@@ -1198,7 +1195,7 @@ async def get_candlestick_data(symbol: str, timeframe: str = "1Y", db: Session =
         return candlesticks
         
     except Exception as e:
-        logger.error(f"Error fetching candlestick data for {symbol}: {e}")
+        logger.error("Error fetching candlestick data for %s: %s", symbol, e)
         raise HTTPException(status_code=500, detail=f"Failed to fetch candlestick data: {str(e)}")
 
 @app.get("/api/models/results")
@@ -1222,7 +1219,7 @@ async def get_model_results():
             }
             
     except Exception as e:
-        logger.error(f"Error fetching model results: {e}")
+        logger.error("Error fetching model results: %s", e)
         return {
             "models_trained": 0,
             "models_failed": 0,
@@ -1269,7 +1266,7 @@ async def get_feature_importance():
         }
         
     except Exception as e:
-        logger.error(f"Error fetching feature importance: {e}")
+        logger.error("Error fetching feature importance: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to fetch feature importance: {str(e)}")
 
 @app.post("/api/pipeline/run")
@@ -1305,7 +1302,7 @@ async def run_complete_pipeline():
             }
             
     except Exception as e:
-        logger.error(f"Error running pipeline: {e}")
+        logger.error("Error running pipeline: %s", e)
         return {
             "status": "error",
             "error": str(e),
@@ -1344,7 +1341,7 @@ async def get_system_health(db: Session = Depends(get_db)):
         }
         
     except Exception as e:
-        logger.error(f"Error checking system health: {e}")
+        logger.error("Error checking system health: %s", e)
         return {
             "status": "unhealthy",
             "error": str(e),
@@ -1401,7 +1398,7 @@ async def get_company_sentiment(symbol: str):
                 raise Exception("Sentiment script not found")
                 
         except Exception as e:
-            logger.warning(f"Real sentiment analysis failed for {symbol}: {e}")
+            logger.warning("Real sentiment analysis failed for %s: %s", symbol, e)
             # Generate realistic mock sentiment data
             import random
             
@@ -1466,7 +1463,7 @@ async def get_company_sentiment(symbol: str):
         }
         
     except Exception as e:
-        logger.error(f"Error getting sentiment for {symbol}: {e}")
+        logger.error("Error getting sentiment for %s: %s", symbol, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/sentiment/analyze")
@@ -1492,7 +1489,7 @@ async def analyze_text_sentiment(text_data: dict):
         }
         
     except Exception as e:
-        logger.error(f"Error analyzing sentiment: {e}")
+        logger.error("Error analyzing sentiment: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/sentiment/dashboard")
@@ -1542,7 +1539,7 @@ async def get_sentiment_dashboard():
         }
         
     except Exception as e:
-        logger.error(f"Error getting sentiment dashboard: {e}")
+        logger.error("Error getting sentiment dashboard: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -1578,7 +1575,7 @@ async def get_latest_news(
         }
         
     except Exception as e:
-        logger.error(f"Error fetching latest news: {e}")
+        logger.error("Error fetching latest news: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -1600,7 +1597,7 @@ async def get_company_news(
         }
         
     except Exception as e:
-        logger.error(f"Error fetching company news for {symbol}: {e}")
+        logger.error("Error fetching company news for %s: %s", symbol, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -1622,7 +1619,7 @@ async def get_news_by_category(
         }
         
     except Exception as e:
-        logger.error(f"Error fetching news for category {category}: {e}")
+        logger.error("Error fetching news for category %s: %s", category, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -1644,7 +1641,7 @@ async def search_news(
         }
         
     except Exception as e:
-        logger.error(f"Error searching news for '{q}': {e}")
+        logger.error("Error searching news for '%s': %s", q, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -1661,7 +1658,7 @@ async def get_trending_symbols():
         }
         
     except Exception as e:
-        logger.error(f"Error fetching trending symbols: {e}")
+        logger.error("Error fetching trending symbols: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -1698,7 +1695,7 @@ async def get_news_dashboard():
         }
         
     except Exception as e:
-        logger.error(f"Error fetching news dashboard: {e}")
+        logger.error("Error fetching news dashboard: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
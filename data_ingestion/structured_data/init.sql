@@ -98,6 +98,7 @@ CREATE TABLE IF NOT EXISTS regulatory_filings (
     symbol VARCHAR,
     filing_type VARCHAR,
     filing_date TIMESTAMP WITH TIME ZONE,
+    accession VARCHAR,
     data JSONB,
     source VARCHAR,
     ingested_at TIMESTAMP WITH TIME ZONE
@@ -120,6 +121,72 @@ CREATE INDEX IF NOT EXISTS idx_company_fundamentals_symbol ON company_fundamenta
 CREATE INDEX IF NOT EXISTS idx_economic_indicators_country ON economic_indicators(country);
 CREATE INDEX IF NOT EXISTS idx_credit_ratings_symbol ON credit_ratings(symbol);
 CREATE INDEX IF NOT EXISTS idx_regulatory_filings_symbol ON regulatory_filings(symbol);
+CREATE INDEX IF NOT EXISTS idx_regulatory_filings_symbol_date ON regulatory_filings(symbol, filing_date DESC);
+
+-- Ids and ingestion timestamps are assigned by the database
+CREATE EXTENSION IF NOT EXISTS pgcrypto;  -- gen_random_uuid() on PostgreSQL < 13
+-- Time-ordered UUIDv7 (millisecond timestamp prefix), so inserts append to the primary-key index
+CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid LANGUAGE sql VOLATILE AS $$
+    SELECT encode(set_bit(set_bit(overlay(uuid_send(gen_random_uuid())
+        PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+        FROM 1 FOR 6), 52, 1), 53, 1), 'hex')::uuid
+$$;
+ALTER TABLE financial_statements ALTER COLUMN id SET DEFAULT uuid_generate_v7()::text, ALTER COLUMN ingested_at SET DEFAULT now();
+ALTER TABLE stock_prices ALTER COLUMN id SET DEFAULT uuid_generate_v7()::text, ALTER COLUMN ingested_at SET DEFAULT now();
+ALTER TABLE company_fundamentals ALTER COLUMN id SET DEFAULT uuid_generate_v7()::text, ALTER COLUMN ingested_at SET DEFAULT now();
+ALTER TABLE economic_indicators ALTER COLUMN id SET DEFAULT uuid_generate_v7()::text, ALTER COLUMN ingested_at SET DEFAULT now();
+ALTER TABLE credit_ratings ALTER COLUMN id SET DEFAULT uuid_generate_v7()::text, ALTER COLUMN ingested_at SET DEFAULT now();
+ALTER TABLE regulatory_filings ALTER COLUMN id SET DEFAULT uuid_generate_v7()::text, ALTER COLUMN ingested_at SET DEFAULT now();
+
+-- Natural keys: re-ingesting the same observation is skipped with ON CONFLICT DO NOTHING
+CREATE UNIQUE INDEX IF NOT EXISTS uq_financial_statements_period ON financial_statements(company, fiscal_year, fiscal_quarter, statement_type);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_stock_prices_symbol_date_source ON stock_prices(symbol, date, source);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_economic_indicators_series_date ON economic_indicators(indicator_name, date, country, source);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_regulatory_filings_source_accession ON regulatory_filings(source, accession);
+
+-- Row counts for /stats, maintained by statement-level triggers so reading them is a primary-key lookup.
+-- Every insert/delete statement also updates its table's counter row, so concurrent writers to the
+-- same table serialize on that row until they commit.
+CREATE TABLE IF NOT EXISTS table_counts (
+    name VARCHAR PRIMARY KEY,
+    n BIGINT NOT NULL DEFAULT 0
+);
+ALTER TABLE table_counts OWNER TO credtech;
+
+CREATE OR REPLACE FUNCTION bump_table_count() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE table_counts SET n = n + (SELECT count(*) FROM changed_rows) WHERE name = TG_TABLE_NAME;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE table_counts SET n = n - (SELECT count(*) FROM changed_rows) WHERE name = TG_TABLE_NAME;
+    ELSE
+        UPDATE table_counts SET n = 0 WHERE name = TG_TABLE_NAME;
+    END IF;
+    RETURN NULL;
+END
+$$;
+
+DO $$
+DECLARE
+    tbl TEXT;
+BEGIN
+    FOREACH tbl IN ARRAY ARRAY['financial_statements', 'stock_prices', 'company_fundamentals',
+                               'economic_indicators', 'credit_ratings', 'regulatory_filings'] LOOP
+        -- Transition tables allow one event per trigger, hence separate insert and delete triggers
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', tbl || '_count_insert', tbl);
+        EXECUTE format('CREATE TRIGGER %I AFTER INSERT ON %I REFERENCING NEW TABLE AS changed_rows '
+                       'FOR EACH STATEMENT EXECUTE FUNCTION bump_table_count()', tbl || '_count_insert', tbl);
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', tbl || '_count_delete', tbl);
+        EXECUTE format('CREATE TRIGGER %I AFTER DELETE ON %I REFERENCING OLD TABLE AS changed_rows '
+                       'FOR EACH STATEMENT EXECUTE FUNCTION bump_table_count()', tbl || '_count_delete', tbl);
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', tbl || '_count_truncate', tbl);
+        EXECUTE format('CREATE TRIGGER %I AFTER TRUNCATE ON %I '
+                       'FOR EACH STATEMENT EXECUTE FUNCTION bump_table_count()', tbl || '_count_truncate', tbl);
+        -- Backfill once; the triggers keep the row current from here on
+        EXECUTE format('INSERT INTO table_counts (name, n) SELECT %L, count(*) FROM %I ON CONFLICT (name) DO NOTHING', tbl, tbl);
+    END LOOP;
+END
+$$;
 
 -- Insert sample data for testing
 INSERT INTO test_table (name) VALUES ('Initial Setup Complete') ON CONFLICT DO NOTHING;
@@ -144,3 +211,45 @@ ALTER TABLE company_fundamentals ADD COLUMN IF NOT EXISTS region VARCHAR;
 ALTER TABLE company_fundamentals ADD COLUMN IF NOT EXISTS current_ratio REAL;
 ALTER TABLE company_fundamentals ADD COLUMN IF NOT EXISTS leverage_ratio REAL;
 ALTER TABLE company_fundamentals ADD COLUMN IF NOT EXISTS risk_score REAL;
+
+-- Latest row per symbol with the headline columns, created once the INCLUDE columns above exist;
+-- replaces the earlier key-only index of the same purpose
+DROP INDEX IF EXISTS idx_company_fundamentals_symbol_latest;
+CREATE INDEX IF NOT EXISTS idx_company_fundamentals_symbol_latest_covering ON company_fundamentals(symbol, ingested_at DESC)
+    INCLUDE (company, risk_score, total_revenue, net_income, free_cash_flow);
+
+-- Hot academic metrics as stored generated columns; adding them computes every existing row, so no backfill is needed.
+-- Non-numeric members (strings, nulls) become NULL instead of failing the write with a cast error.
+ALTER TABLE company_fundamentals ADD COLUMN IF NOT EXISTS roa_g DOUBLE PRECISION
+    GENERATED ALWAYS AS (CASE WHEN jsonb_typeof(fundamentals->'roa') = 'number' THEN (fundamentals->>'roa')::double precision END) STORED;
+ALTER TABLE company_fundamentals ADD COLUMN IF NOT EXISTS leverage_g DOUBLE PRECISION
+    GENERATED ALWAYS AS (CASE WHEN jsonb_typeof(fundamentals->'leverage') = 'number' THEN (fundamentals->>'leverage')::double precision END) STORED;
+ALTER TABLE company_fundamentals ADD COLUMN IF NOT EXISTS retained_earnings_ratio_g DOUBLE PRECISION
+    GENERATED ALWAYS AS (CASE WHEN jsonb_typeof(fundamentals->'retained_earnings_ratio') = 'number' THEN (fundamentals->>'retained_earnings_ratio')::double precision END) STORED;
+ALTER TABLE company_fundamentals ADD COLUMN IF NOT EXISTS net_income_growth_normalized_g DOUBLE PRECISION
+    GENERATED ALWAYS AS (CASE WHEN jsonb_typeof(fundamentals->'net_income_growth_normalized') = 'number' THEN (fundamentals->>'net_income_growth_normalized')::double precision END) STORED;
+
+-- Latest ratios per symbol, computed in the database so analysis queries can filter and sort on them
+-- through the indexes below. Same rules as compute_financial_metrics: a ratio is NULL unless both sides
+-- are present and non-zero. Refreshed out of band (POST /admin/refresh-metrics, e.g. nightly).
+CREATE MATERIALIZED VIEW IF NOT EXISTS company_metrics AS
+SELECT DISTINCT ON (symbol)
+    symbol,
+    company,
+    fiscal_year,
+    ingested_at,
+    risk_score,
+    round((NULLIF(net_income, 0)::double precision / NULLIF(total_assets, 0) * 100)::numeric, 4)::double precision AS roa,
+    round((NULLIF(total_debt, 0)::double precision / NULLIF(total_assets, 0))::numeric, 4)::double precision AS leverage,
+    round((NULLIF(current_assets, 0)::double precision / NULLIF(current_liabilities, 0))::numeric, 4)::double precision AS current_ratio,
+    round((NULLIF(total_debt, 0)::double precision / NULLIF(equity, 0))::numeric, 4)::double precision AS debt_to_equity
+FROM company_fundamentals
+WHERE symbol IS NOT NULL
+ORDER BY symbol, ingested_at DESC;
+ALTER MATERIALIZED VIEW company_metrics OWNER TO credtech;
+
+-- The unique index is what allows REFRESH ... CONCURRENTLY (readers are not blocked during a refresh)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_company_metrics_symbol ON company_metrics(symbol);
+CREATE INDEX IF NOT EXISTS idx_company_metrics_risk_score ON company_metrics(risk_score);
+CREATE INDEX IF NOT EXISTS idx_company_metrics_roa ON company_metrics(roa);
+CREATE INDEX IF NOT EXISTS idx_company_metrics_leverage ON company_metrics(leverage);
@@ -0,0 +1,31 @@
+-- Natural-key unique indexes for databases created before init.sql declared them.
+-- Ingestion inserts with ON CONFLICT (<natural key>) DO NOTHING, which PostgreSQL rejects
+-- unless a matching unique index exists. Duplicates already stored are removed first,
+-- keeping one row per key. Safe to run more than once.
+BEGIN;
+
+DELETE FROM financial_statements a USING financial_statements b
+WHERE a.company = b.company AND a.fiscal_year = b.fiscal_year AND a.fiscal_quarter = b.fiscal_quarter
+  AND a.statement_type = b.statement_type AND a.id > b.id;
+CREATE UNIQUE INDEX IF NOT EXISTS uq_financial_statements_period ON financial_statements(company, fiscal_year, fiscal_quarter, statement_type);
+
+DELETE FROM stock_prices a USING stock_prices b
+WHERE a.symbol = b.symbol AND a.date = b.date AND a.source = b.source AND a.id > b.id;
+CREATE UNIQUE INDEX IF NOT EXISTS uq_stock_prices_symbol_date_source ON stock_prices(symbol, date, source);
+
+DELETE FROM economic_indicators a USING economic_indicators b
+WHERE a.indicator_name = b.indicator_name AND a.date = b.date AND a.country = b.country
+  AND a.source = b.source AND a.id > b.id;
+CREATE UNIQUE INDEX IF NOT EXISTS uq_economic_indicators_series_date ON economic_indicators(indicator_name, date, country, source);
+
+-- Filings are keyed on the EDGAR accession id (the feed entry id, else the filing link)
+ALTER TABLE regulatory_filings ADD COLUMN IF NOT EXISTS accession VARCHAR;
+UPDATE regulatory_filings
+SET accession = COALESCE(NULLIF(data->'raw_entry'->>'id', ''), NULLIF(data->>'link', ''), 'legacy:' || id)
+WHERE accession IS NULL;
+DELETE FROM regulatory_filings a USING regulatory_filings b
+WHERE a.source = b.source AND a.accession = b.accession AND a.id > b.id;
+DROP INDEX IF EXISTS uq_regulatory_filings_symbol_type_date;
+CREATE UNIQUE INDEX IF NOT EXISTS uq_regulatory_filings_source_accession ON regulatory_filings(source, accession);
+
+COMMIT;
@@ -0,0 +1,12 @@
+-- Covering index for the latest-row-per-symbol reads (/risk_scores), replacing the key-only
+-- idx_company_fundamentals_symbol_latest. Not wrapped in a transaction so both steps can run
+-- CONCURRENTLY without blocking ingestion. Safe to run more than once.
+ALTER TABLE company_fundamentals ADD COLUMN IF NOT EXISTS total_revenue REAL;
+ALTER TABLE company_fundamentals ADD COLUMN IF NOT EXISTS net_income REAL;
+ALTER TABLE company_fundamentals ADD COLUMN IF NOT EXISTS free_cash_flow REAL;
+ALTER TABLE company_fundamentals ADD COLUMN IF NOT EXISTS risk_score REAL;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_company_fundamentals_symbol_latest_covering
+    ON company_fundamentals(symbol, ingested_at DESC)
+    INCLUDE (company, risk_score, total_revenue, net_income, free_cash_flow);
+DROP INDEX CONCURRENTLY IF EXISTS idx_company_fundamentals_symbol_latest;
@@ -0,0 +1,23 @@
+-- Generated academic-metric columns on company_fundamentals, guarded so a non-numeric member
+-- (e.g. "N/A") stores NULL instead of rejecting the write. Replaces the unguarded columns an
+-- earlier init.sql created; PostgreSQL before 17 cannot change a generation expression in place,
+-- so they are dropped and re-added, which rewrites the table. Safe to run more than once.
+BEGIN;
+
+ALTER TABLE company_fundamentals
+    DROP COLUMN IF EXISTS roa_g,
+    DROP COLUMN IF EXISTS leverage_g,
+    DROP COLUMN IF EXISTS retained_earnings_ratio_g,
+    DROP COLUMN IF EXISTS net_income_growth_normalized_g;
+
+ALTER TABLE company_fundamentals
+    ADD COLUMN roa_g DOUBLE PRECISION
+        GENERATED ALWAYS AS (CASE WHEN jsonb_typeof(fundamentals::jsonb->'roa') = 'number' THEN (fundamentals->>'roa')::double precision END) STORED,
+    ADD COLUMN leverage_g DOUBLE PRECISION
+        GENERATED ALWAYS AS (CASE WHEN jsonb_typeof(fundamentals::jsonb->'leverage') = 'number' THEN (fundamentals->>'leverage')::double precision END) STORED,
+    ADD COLUMN retained_earnings_ratio_g DOUBLE PRECISION
+        GENERATED ALWAYS AS (CASE WHEN jsonb_typeof(fundamentals::jsonb->'retained_earnings_ratio') = 'number' THEN (fundamentals->>'retained_earnings_ratio')::double precision END) STORED,
+    ADD COLUMN net_income_growth_normalized_g DOUBLE PRECISION
+        GENERATED ALWAYS AS (CASE WHEN jsonb_typeof(fundamentals::jsonb->'net_income_growth_normalized') = 'number' THEN (fundamentals->>'net_income_growth_normalized')::double precision END) STORED;
+
+COMMIT;
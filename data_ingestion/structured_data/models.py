@@ -1,11 +1,62 @@
-from sqlalchemy import Column, String, Integer, Float, DateTime, JSON
+from sqlalchemy import Column, String, Integer, BigInteger, Float, DateTime, JSON, UniqueConstraint, Index, Computed, DDL, event, func
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import deferred
+from sqlalchemy.sql.expression import FunctionElement
 
 Base = declarative_base()
 
+# Time-ordered UUIDv7: a 48-bit millisecond timestamp followed by random bits, so new keys land at the
+# right edge of the primary-key B-tree instead of on random pages. Same definition as init.sql.
+UUID_V7_FUNCTION = """
+CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid LANGUAGE sql VOLATILE AS $$
+    SELECT encode(set_bit(set_bit(overlay(uuid_send(gen_random_uuid())
+        PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+        FROM 1 FOR 6), 52, 1), 53, 1), 'hex')::uuid
+$$
+"""
+event.listen(Base.metadata, "before_create", DDL(UUID_V7_FUNCTION).execute_if(dialect="postgresql"))
+
+class new_uuid(FunctionElement):
+    """UUID string generated by the database, used as the primary key default"""
+    type = String()
+    inherit_cache = True
+
+@compiles(new_uuid)
+def _new_uuid_postgresql(element, compiler, **kw):
+    return "uuid_generate_v7()::text"
+
+@compiles(new_uuid, "sqlite")
+def _new_uuid_sqlite(element, compiler, **kw):
+    return "(lower(hex(randomblob(16))))"
+
+class json_number(FunctionElement):
+    """Numeric member of a JSON document, NULL when it is missing or not a number (never a cast error)"""
+    type = Float()
+    inherit_cache = False  # the key is rendered inline; only used in generated-column DDL
+
+    def __init__(self, document, key):
+        self.key = key
+        super().__init__(document)
+
+@compiles(json_number)
+def _json_number_postgresql(element, compiler, **kw):
+    document = compiler.process(list(element.clauses)[0], **kw)
+    member = f"CAST({document} AS json) -> '{element.key}'"
+    return (f"CASE WHEN json_typeof({member}) = 'number' "
+            f"THEN CAST({document} ->> '{element.key}' AS double precision) END")
+
+@compiles(json_number, "sqlite")
+def _json_number_sqlite(element, compiler, **kw):
+    document = compiler.process(list(element.clauses)[0], **kw)
+    path = f"'$.{element.key}'"
+    return f"CASE WHEN json_type({document}, {path}) IN ('integer', 'real') THEN json_extract({document}, {path}) END"
+
 class FinancialStatement(Base):
     __tablename__ = "financial_statements"
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    __table_args__ = (UniqueConstraint("company", "fiscal_year", "fiscal_quarter", "statement_type",
+                                       name="uq_financial_statements_period"),)
+    id = Column(String, primary_key=True, server_default=new_uuid())
     company = Column(String)
     symbol = Column(String)
     fiscal_year = Column(Integer)
@@ -13,11 +64,12 @@ class FinancialStatement(Base):
     statement_type = Column(String)  # e.g., balance_sheet, income_statement
     data = Column(JSON)
     source = Column(String)
-    ingested_at = Column(DateTime)
+    ingested_at = Column(DateTime(timezone=True), server_default=func.now())
 
 class StockPrice(Base):
     __tablename__ = "stock_prices"
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    __table_args__ = (UniqueConstraint("symbol", "date", "source", name="uq_stock_prices_symbol_date_source"),)
+    id = Column(String, primary_key=True, server_default=new_uuid())
     symbol = Column(String)
     date = Column(DateTime)
     open = Column(Float)
@@ -26,18 +78,18 @@ class StockPrice(Base):
     low = Column(Float)
     volume = Column(Float)
     source = Column(String)
-    ingested_at = Column(DateTime)
+    ingested_at = Column(DateTime(timezone=True), server_default=func.now())
 
 class CompanyFundamentals(Base):
     __tablename__ = "company_fundamentals"
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(String, primary_key=True, server_default=new_uuid())
     company = Column(String)
     symbol = Column(String)
     fiscal_year = Column(Integer)
     fiscal_quarter = Column(String)
     fundamentals = Column(JSON)
     source = Column(String)
-    ingested_at = Column(DateTime)
+    ingested_at = Column(DateTime(timezone=True), server_default=func.now())
     # Explicit risk-related fields (nullable for backward compatibility)
     total_revenue = Column(Float)
     net_income = Column(Float)
@@ -65,20 +117,34 @@ class CompanyFundamentals(Base):
     # leverage_assets = Column(Float)  # This column doesn't exist in actual database
     # retained_earnings_ratio = Column(Float)  # This column doesn't exist in actual database
     # net_income_growth_normalized = Column(Float)  # This column doesn't exist in actual database
+    # Hot academic metrics promoted out of the fundamentals JSON; the database fills them on every write,
+    # so reads get plain floats without shipping the document (see ALTER TABLE in init.sql).
+    # Deferred so whole-entity queries never select them; only metric_columns() in api.py does.
+    roa_g = deferred(Column(Float, Computed(json_number(fundamentals, "roa"), persisted=True)))
+    leverage_g = deferred(Column(Float, Computed(json_number(fundamentals, "leverage"), persisted=True)))
+    retained_earnings_ratio_g = deferred(Column(Float, Computed(json_number(fundamentals, "retained_earnings_ratio"), persisted=True)))
+    net_income_growth_normalized_g = deferred(Column(Float, Computed(json_number(fundamentals, "net_income_growth_normalized"), persisted=True)))
+
+# Newest row per symbol (latest_per_symbol in api.py) is a walk of this index instead of a sort of the table;
+# on PostgreSQL it also carries the /risk_scores columns so that listing is an index-only scan
+Index("idx_company_fundamentals_symbol_latest_covering", CompanyFundamentals.symbol, CompanyFundamentals.ingested_at.desc(),
+      postgresql_include=["company", "risk_score", "total_revenue", "net_income", "free_cash_flow"])
 
 class EconomicIndicator(Base):
     __tablename__ = "economic_indicators"
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    __table_args__ = (UniqueConstraint("indicator_name", "date", "country", "source",
+                                       name="uq_economic_indicators_series_date"),)
+    id = Column(String, primary_key=True, server_default=new_uuid())
     indicator_name = Column(String)
     value = Column(Float)
     date = Column(DateTime)
     country = Column(String)
     source = Column(String)
-    ingested_at = Column(DateTime)
+    ingested_at = Column(DateTime(timezone=True), server_default=func.now())
 
 class CreditRating(Base):
     __tablename__ = "credit_ratings"
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(String, primary_key=True, server_default=new_uuid())
     entity = Column(String)
     symbol = Column(String)
     rating = Column(String)
@@ -86,15 +152,27 @@ class CreditRating(Base):
     rating_date = Column(DateTime)
     outlook = Column(String)
     source = Column(String)
-    ingested_at = Column(DateTime)
+    ingested_at = Column(DateTime(timezone=True), server_default=func.now())
 
 class RegulatoryFiling(Base):
     __tablename__ = "regulatory_filings"
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    # EDGAR's accession id is the filing's identity; several filings can share a type and timestamp
+    __table_args__ = (UniqueConstraint("source", "accession", name="uq_regulatory_filings_source_accession"),)
+    id = Column(String, primary_key=True, server_default=new_uuid())
     company = Column(String)
     symbol = Column(String)
     filing_type = Column(String)
     filing_date = Column(DateTime)
+    accession = Column(String)
     data = Column(JSON)
     source = Column(String)
-    ingested_at = Column(DateTime)
+    ingested_at = Column(DateTime(timezone=True), server_default=func.now())
+
+# A ticker's filings newest first; the unique constraint is keyed on the accession id, so it cannot serve this order
+Index("idx_regulatory_filings_symbol_date", RegulatoryFiling.symbol, RegulatoryFiling.filing_date.desc())
+
+class TableCount(Base):
+    """Row count per table, kept current by the statement-level triggers in init.sql (PostgreSQL only)"""
+    __tablename__ = "table_counts"
+    name = Column(String, primary_key=True)
+    n = Column(BigInteger, nullable=False, default=0)
@@ -79,7 +79,7 @@ class NewsDataService:
             return news_articles
             
         except Exception as e:
-            logger.error(f"Error fetching news: {e}")
+            logger.error("Error fetching news: %s", e)
             return self._get_mock_news(limit, category)
     
     def get_company_news(self, symbol: str, limit: int = 20) -> List[Dict]:
@@ -134,7 +134,7 @@ class NewsDataService:
             return news_articles
             
         except Exception as e:
-            logger.error(f"Error searching news: {e}")
+            logger.error("Error searching news: %s", e)
             return []
     
     def get_trending_symbols(self) -> List[Dict]:
@@ -166,7 +166,7 @@ class NewsDataService:
             return trending
             
         except Exception as e:
-            logger.error(f"Error getting trending symbols: {e}")
+            logger.error("Error getting trending symbols: %s", e)
             return []
     
     def _format_timestamp(self, timestamp):
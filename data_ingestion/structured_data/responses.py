@@ -0,0 +1,25 @@
+"""
+Default JSON response class for the FastAPI apps in this package
+"""
+from typing import Any
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    class DefaultJSONResponse(JSONResponse):
+        """orjson rendering: datetimes, UUIDs and numpy scalars/arrays natively, anything else (Decimal, pandas types) as str"""
+        def render(self, content: Any) -> bytes:
+            return orjson.dumps(content, default=str, option=ORJSON_OPTIONS)
+else:
+    class DefaultJSONResponse(JSONResponse):
+        """Stdlib fallback; routes hand over datetimes directly, which orjson handles natively"""
+        def render(self, content: Any) -> bytes:
+            return super().render(jsonable_encoder(content))
@@ -1,10 +1,63 @@
+import asyncio
+import contextlib
 import requests
+import aiohttp
 import feedparser
 import os
+from aiolimiter import AsyncLimiter
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 SEC_USER_AGENT = os.getenv("SEC_USER_AGENT", "CredTech/1.0 (contact@credtech.com)")
+SEC_HEADERS = {
+    # SEC requirement: must identify yourself with a descriptive User-Agent including email
+    "User-Agent": SEC_USER_AGENT,
+    "Accept-Encoding": "gzip, deflate",
+    "Host": "www.sec.gov",
+}
+SEC_MAX_RETRIES = 4
+# EDGAR fair-access policy allows 10 requests/second per client. The bucket is per process, so the budget is
+# split across the API workers (API_WORKERS, as in config.py): each gets SEC_PROCESS_BURST requests per period.
+SEC_REQUESTS_PER_SECOND = 10
+SEC_PROCESSES = max(1, int(os.getenv("API_WORKERS", os.cpu_count() or 1)))
+SEC_PROCESS_BURST = max(1, SEC_REQUESTS_PER_SECOND // SEC_PROCESSES)
+SEC_RATE_LIMIT = AsyncLimiter(SEC_PROCESS_BURST, SEC_PROCESS_BURST * SEC_PROCESSES / SEC_REQUESTS_PER_SECOND)
+
+def retry_delay(error: aiohttp.ClientResponseError, attempt: int) -> float:
+    """Honor a numeric Retry-After header, otherwise back off exponentially."""
+    retry_after = error.headers.get("Retry-After") if error.headers else None
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    return float(2 ** attempt)
+
+def sec_rss_url(symbol: str) -> str:
+    """SEC EDGAR atom feed URL for a ticker symbol."""
+    return (
+        f"https://www.sec.gov/cgi-bin/browse-edgar"
+        f"?action=getcompany&CIK={symbol}&type=&dateb=&owner=exclude&count=10&output=atom"
+    )
+
+def parse_sec_feed(content: bytes, symbol: str) -> List[Dict[str, Any]]:
+    """Parse an EDGAR atom feed into filing dictionaries with standardized structure."""
+    feed = feedparser.parse(content)
+
+    filings = []
+    for entry in feed.entries:
+        filing_data = {
+            "title": entry.get("title", ""),
+            "summary": entry.get("summary", ""),
+            "link": entry.get("link", ""),
+            "filing_date": entry.get("published", ""),
+            "company": symbol,
+            "filing_type": extract_filing_type(entry.get("title", "")),
+            "raw_entry": {
+                "id": entry.get("id", ""),
+                "updated": entry.get("updated", ""),
+                "category": getattr(entry, 'category', ''),
+            }
+        }
+        filings.append(filing_data)
+    return filings
 
 def fetch_sec_filings(symbol: str) -> List[Dict[str, Any]]:
     """
@@ -19,41 +72,11 @@ def fetch_sec_filings(symbol: str) -> List[Dict[str, Any]]:
     try:
         print(f"Fetching SEC filings for symbol: {symbol}")
 
-        # SEC EDGAR RSS feed URL
-        rss_url = (
-            f"https://www.sec.gov/cgi-bin/browse-edgar"
-            f"?action=getcompany&CIK={symbol}&type=&dateb=&owner=exclude&count=10&output=atom"
-        )
-
-        headers = {
-            # SEC requirement: must identify yourself with a descriptive User-Agent including email
-            "User-Agent": SEC_USER_AGENT,
-            "Accept-Encoding": "gzip, deflate",
-            "Host": "www.sec.gov",
-        }
-
-        response = requests.get(rss_url, headers=headers, timeout=30)
+        response = requests.get(sec_rss_url(symbol), headers=SEC_HEADERS, timeout=30)
         response.raise_for_status()
 
         # Parse the RSS feed
-        feed = feedparser.parse(response.content)
-
-        filings = []
-        for entry in feed.entries:
-            filing_data = {
-                "title": entry.get("title", ""),
-                "summary": entry.get("summary", ""),
-                "link": entry.get("link", ""),
-                "filing_date": entry.get("published", ""),
-                "company": symbol,
-                "filing_type": extract_filing_type(entry.get("title", "")),
-                "raw_entry": {
-                    "id": entry.get("id", ""),
-                    "updated": entry.get("updated", ""),
-                    "category": getattr(entry, 'category', ''),
-                }
-            }
-            filings.append(filing_data)
+        filings = parse_sec_feed(response.content, symbol)
 
         print(f"Successfully fetched {len(filings)} SEC filings for {symbol}")
         return filings
@@ -65,6 +88,42 @@ def fetch_sec_filings(symbol: str) -> List[Dict[str, Any]]:
         print(f"Unexpected error fetching SEC filings for {symbol}: {e}")
         return []
 
+async def fetch_sec_filings_async(
+    symbol: str,
+    session: aiohttp.ClientSession,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    max_retries: int = SEC_MAX_RETRIES,
+) -> List[Dict[str, Any]]:
+    """
+    Async variant of fetch_sec_filings for fanning out over many tickers.
+
+    Requests are paced by SEC_RATE_LIMIT. Retries 429 and 5xx responses with
+    exponential backoff (or the server's Retry-After); other failures return an
+    empty list like the sync version.
+    """
+    limiter = semaphore or contextlib.nullcontext()
+    for attempt in range(max_retries):
+        delay = float(2 ** attempt)
+        try:
+            async with limiter, SEC_RATE_LIMIT:
+                async with session.get(sec_rss_url(symbol), headers=SEC_HEADERS,
+                                       timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    response.raise_for_status()
+                    content = await response.read()
+            return parse_sec_feed(content, symbol)
+        except aiohttp.ClientResponseError as e:
+            if e.status != 429 and e.status < 500:
+                print(f"Error fetching SEC filings for {symbol}: {e}")
+                return []
+            delay = retry_delay(e, attempt)
+            print(f"SEC returned {e.status} for {symbol}, retrying in {delay:.0f}s (attempt {attempt + 1}/{max_retries})")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error fetching SEC filings for {symbol}: {e}, retrying (attempt {attempt + 1}/{max_retries})")
+        await asyncio.sleep(delay)
+
+    print(f"Giving up on SEC filings for {symbol} after {max_retries} attempts")
+    return []
+
 def extract_filing_type(title: str) -> str:
     """Extract filing type from the title string."""
     if not title:
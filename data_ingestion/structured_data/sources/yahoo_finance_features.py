@@ -26,7 +26,7 @@ def fetch_stock_price_data(ticker_symbol: str, period: str = "5y") -> Dict:
         hist = ticker.history(period=period, interval="1d", auto_adjust=True)
         
         if hist.empty:
-            logger.warning(f"No price data found for {ticker_symbol}")
+            logger.warning("No price data found for %s", ticker_symbol)
             return {"error": f"No price data for {ticker_symbol}"}
         
         # Convert to list of dictionaries for frontend consumption
@@ -57,7 +57,7 @@ def fetch_stock_price_data(ticker_symbol: str, period: str = "5y") -> Dict:
         }
         
     except Exception as e:
-        logger.error(f"Error fetching price data for {ticker_symbol}: {e}")
+        logger.error("Error fetching price data for %s: %s", ticker_symbol, e)
         return {"error": str(e)}
 
 
@@ -143,10 +143,10 @@ def fetch_credit_features(ticker_symbol: str) -> Dict:
         if fundamentals["current_assets"] and fundamentals["current_ratio"] and not fundamentals["current_liabilities"]:
             fundamentals["current_liabilities"] = fundamentals["current_assets"] / fundamentals["current_ratio"]
             
-        logger.info(f"Enhanced {ticker_symbol} data: assets={fundamentals.get('total_assets')}, equity={fundamentals.get('equity')}")
+        logger.info("Enhanced %s data: assets=%s, equity=%s", ticker_symbol, fundamentals.get('total_assets'), fundamentals.get('equity'))
         
     except Exception as e:
-        logger.warning(f"Error calculating derived metrics for {ticker_symbol}: {e}")
+        logger.warning("Error calculating derived metrics for %s: %s", ticker_symbol, e)
         pass
 
     market_data = []
@@ -176,7 +176,7 @@ def fetch_historical_fundamentals(ticker_symbol: str, years: int = 5) -> Dict:
     Returns:
         Dictionary with quarterly panel data structure
     """
-    logger.info(f"Fetching {years} years of historical data for {ticker_symbol}")
+    logger.info("Fetching %s years of historical data for %s", years, ticker_symbol)
     
     try:
         ticker = yf.Ticker(ticker_symbol)
@@ -193,6 +193,7 @@ def fetch_historical_fundamentals(ticker_symbol: str, years: int = 5) -> Dict:
         info = ticker.info
         
         quarterly_data = []
+        updated_at = datetime.utcnow().isoformat()  # one fetch, one timestamp for all of its quarters
         
         # Process each quarter's data
         for quarter_date in quarterly_financials.index:
@@ -301,7 +302,7 @@ def fetch_historical_fundamentals(ticker_symbol: str, years: int = 5) -> Dict:
                 "industry": info.get("industry"),
                 "region": info.get("country"),
                 
-                "updated_at": datetime.utcnow().isoformat()
+                "updated_at": updated_at
             }
             
             quarterly_data.append(fundamentals)
@@ -316,7 +317,7 @@ def fetch_historical_fundamentals(ticker_symbol: str, years: int = 5) -> Dict:
             # Convert back to list of dicts
             quarterly_data = quarterly_data_df.to_dict('records')
         
-        logger.info(f"Successfully fetched {len(quarterly_data)} quarters of data for {ticker_symbol}")
+        logger.info("Successfully fetched %s quarters of data for %s", len(quarterly_data), ticker_symbol)
         
         return {
             "ticker": ticker_symbol,
@@ -332,7 +333,7 @@ def fetch_historical_fundamentals(ticker_symbol: str, years: int = 5) -> Dict:
         }
         
     except Exception as e:
-        logger.error(f"Error fetching historical data for {ticker_symbol}: {e}")
+        logger.error("Error fetching historical data for %s: %s", ticker_symbol, e)
         return {
             "ticker": ticker_symbol,
             "error": str(e),
@@ -352,13 +353,13 @@ def build_panel_dataset(symbols: List[str], years: int = 5) -> pd.DataFrame:
     Returns:
         Panel DataFrame suitable for academic regression models
     """
-    logger.info(f"Building panel dataset for {len(symbols)} companies over {years} years")
+    logger.info("Building panel dataset for %s companies over %s years", len(symbols), years)
     
     panel_data = []
     successful_fetches = 0
     
     for i, symbol in enumerate(symbols):
-        logger.info(f"Processing {i+1}/{len(symbols)}: {symbol}")
+        logger.info("Processing %s/%s: %s", i+1, len(symbols), symbol)
         
         try:
             hist_data = fetch_historical_fundamentals(symbol, years)
@@ -366,10 +367,10 @@ def build_panel_dataset(symbols: List[str], years: int = 5) -> pd.DataFrame:
                 panel_data.extend(hist_data['quarterly_data'])
                 successful_fetches += 1
             else:
-                logger.warning(f"No quarterly data found for {symbol}")
+                logger.warning("No quarterly data found for %s", symbol)
                 
         except Exception as e:
-            logger.error(f"Failed to fetch {symbol}: {e}")
+            logger.error("Failed to fetch %s: %s", symbol, e)
     
     if not panel_data:
         logger.error("No data successfully fetched for any symbol")
@@ -385,8 +386,8 @@ def build_panel_dataset(symbols: List[str], years: int = 5) -> pd.DataFrame:
     panel_df['year'] = panel_df['date'].dt.year
     panel_df['quarter_num'] = panel_df['date'].dt.quarter
     
-    logger.info(f"Panel dataset created: {len(panel_df)} observations from {successful_fetches} companies")
-    logger.info(f"Date range: {panel_df['date'].min()} to {panel_df['date'].max()}")
+    logger.info("Panel dataset created: %s observations from %s companies", len(panel_df), successful_fetches)
+    logger.info("Date range: %s to %s", panel_df['date'].min(), panel_df['date'].max())
     
     return panel_df
 
@@ -402,7 +403,7 @@ def fetch_multiple_companies_historical(symbols: List[str], years: int = 5) -> D
     Returns:
         Dictionary with aggregated results
     """
-    logger.info(f"Fetching historical data for {len(symbols)} companies")
+    logger.info("Fetching historical data for %s companies", len(symbols))
     
     results = {
         "companies": {},
@@ -1,18 +1,82 @@
-from sqlalchemy import create_engine
+import json
+from sqlalchemy import create_engine, insert, UniqueConstraint
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 from config import Config
 from models import Base
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Async drivers used by the FastAPI endpoints; the sync engine stays for scripts and jobs
+ASYNC_DRIVERS = {"postgresql": "postgresql+asyncpg", "sqlite": "sqlite+aiosqlite"}
+
+def async_db_url(url: str):
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    return parsed.set(drivername=driver) if driver else parsed
+
+# One long-lived pool per engine; LIFO reuse keeps a small set of connections warm
+POOL_OPTIONS = {
+    "pool_size": Config.DB_POOL_SIZE,
+    "max_overflow": Config.DB_MAX_OVERFLOW,
+    "pool_pre_ping": Config.DB_POOL_PRE_PING,
+    "pool_recycle": Config.DB_POOL_RECYCLE,
+    "pool_timeout": Config.DB_POOL_TIMEOUT,
+    "pool_use_lifo": True,
+}
+
+# JSON/JSONB columns (fundamentals, filing data) go through orjson on both engines;
+# the asyncpg dialect installs these as its json/jsonb type codecs
+def dump_json_column(value) -> str:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
+
+JSON_OPTIONS = {
+    "json_serializer": dump_json_column,
+    "json_deserializer": orjson.loads,
+} if ORJSON_AVAILABLE else {}
+
+# Statements are built per request but compile to a few hundred distinct shapes; a cache large enough to hold
+# them all means every query after warm-up skips SQL compilation
+ENGINE_OPTIONS = {"query_cache_size": Config.DB_QUERY_CACHE_SIZE, **JSON_OPTIONS}
 
 if Config.DB_URL.startswith("sqlite"):  # thread safety for test runs
-    engine = create_engine(Config.DB_URL, connect_args={"check_same_thread": False})
+    engine = create_engine(Config.DB_URL, connect_args={"check_same_thread": False}, **ENGINE_OPTIONS)
+    async_engine = create_async_engine(async_db_url(Config.DB_URL), **ENGINE_OPTIONS)
 else:
-    engine = create_engine(Config.DB_URL)
-SessionLocal = sessionmaker(bind=engine)
+    engine = create_engine(Config.DB_URL, **POOL_OPTIONS, **ENGINE_OPTIONS)
+    async_engine = create_async_engine(async_db_url(Config.DB_URL), **POOL_OPTIONS, **ENGINE_OPTIONS)
+SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
 
 # Create tables if not exist
 def init_db():
     Base.metadata.create_all(bind=engine)
 
+DIALECT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+def natural_key(model):
+    """Column names of the model's natural-key unique constraint, if it has one"""
+    for constraint in model.__table__.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            return [column.name for column in constraint.columns]
+    return None
+
+def insert_ignoring_duplicates(model, dialect_name: str):
+    """Core INSERT into the model's table that skips rows already stored under its natural key"""
+    key = natural_key(model)
+    dialect_insert = DIALECT_INSERTS.get(dialect_name)
+    if key and dialect_insert:
+        return dialect_insert(model.__table__).on_conflict_do_nothing(index_elements=key)
+    return insert(model.__table__)
+
 # Example save function
 def save_financial_statement(session, statement):
     session.add(statement)
@@ -227,7 +227,7 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent | ImageCo
             else:
                 raise ValueError(f"Metric {metric} not found")
         except Exception as e:
-            logger.error(f"Stock API error: {str(e)}")
+            logger.error("Stock API error: %s", str(e))
             raise RuntimeError(f"Stock API error: {str(e)}")
             
     elif name == "get_historical_data":
@@ -260,7 +260,7 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent | ImageCo
                 )
             ]
         except Exception as e:
-            logger.error(f"Stock API error: {str(e)}")
+            logger.error("Stock API error: %s", str(e))
             raise RuntimeError(f"Stock API error: {str(e)}")
 
 async def main():
@@ -32,7 +32,7 @@ async def fetch_stock_info(symbol: str) -> dict[str, Any]:
         info = stock.info
         return info
     except Exception as e:
-        logger.error(f"Error fetching stock info for {symbol}: {e}")
+        logger.error("Error fetching stock info for %s: %s", symbol, e)
         return {}
 
 async def fetch_historical_data(symbol: str, period: str = "1mo") -> dict:
@@ -49,7 +49,7 @@ async def fetch_historical_data(symbol: str, period: str = "1mo") -> dict:
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
-        logger.error(f"Error fetching historical data for {symbol}: {e}")
+        logger.error("Error fetching historical data for %s: %s", symbol, e)
         return {}
 
 @app.list_resources()
@@ -79,7 +79,7 @@ async def read_resource(uri: AnyUrl) -> str:
         info = await fetch_stock_info(symbol)
         return json.dumps(info, indent=2)
     except Exception as e:
-        logger.error(f"Error reading resource for {symbol}: {e}")
+        logger.error("Error reading resource for %s: %s", symbol, e)
         return json.dumps({"error": str(e)})
 
 @app.list_tools()
@@ -187,7 +187,7 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent | ImageCo
             return [TextContent(type="text", text=f"Unknown tool: {name}")]
             
     except Exception as e:
-        logger.error(f"Error in tool call {name}: {e}")
+        logger.error("Error in tool call %s: %s", name, e)
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 async def main():
@@ -6,12 +6,43 @@ from datetime import datetime, timedelta
 from scipy import stats
 from sklearn.preprocessing import StandardScaler, RobustScaler
 import logging
+import math
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 warnings.filterwarnings("ignore")
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+if NUMBA_AVAILABLE:
+    # Compiled per-firm loop for the batch DTD: no temporary arrays and one pass over the inputs.
+    # No fastmath, since missing inputs arrive as NaN and must propagate as NaN.
+    @njit(cache=True)
+    def _naive_dtd_kernel(E: float, F: float, sigma_E: float, r: float, T: float) -> Tuple[float, float]:
+        V = E + F
+        if not (F > 0.0 and V > 0.0):
+            return np.nan, np.nan
+        sigma_v = (E / V) * sigma_E + (F / V) * (0.05 + 0.25 * sigma_E)
+        if not sigma_v > 0.0:
+            return sigma_v, np.nan
+        return sigma_v, (math.log(V / F) + r - 0.5 * sigma_v * sigma_v * T) / (sigma_v * math.sqrt(T))
+
+    @njit(cache=True)
+    def _naive_dtd_loop(E: np.ndarray, F: np.ndarray, sigma_E: np.ndarray, r: np.ndarray, T: float) -> Tuple[np.ndarray, np.ndarray]:
+        n = E.shape[0]
+        sigma_v = np.empty(n)
+        dtd = np.empty(n)
+        for i in range(n):
+            sigma_v[i], dtd[i] = _naive_dtd_kernel(E[i], F[i], sigma_E[i], r[i], T)
+        return sigma_v, dtd
+
+    _warmup = np.ones(1)
+    _naive_dtd_loop(_warmup, _warmup, _warmup, _warmup, 1.0)  # compile (or load from cache) at import
+
 
 class AcademicFeatureEngineer:
     """
@@ -87,24 +118,41 @@ class AcademicFeatureEngineer:
             df_dtd['naive_sigma_v'] = np.nan
             return df_dtd
         
-        # Calculate total firm volatility (naive σv) - Equation (1)
-        E = df_dtd['equity_value']
-        F = df_dtd['debt_value'] 
-        sigma_E = df_dtd['equity_volatility']
-        
-        df_dtd['naive_sigma_v'] = (
-            (E / (E + F)) * sigma_E + 
-            (F / (E + F)) * (0.05 + 0.25 * sigma_E)
+        # One pass over the raw float arrays instead of index-aligned Series arithmetic
+        df_dtd['naive_sigma_v'], df_dtd['naive_dtd'] = self.calculate_naive_distance_to_default_batch(
+            *(df_dtd[field].to_numpy(dtype=float) for field in required_fields)
         )
-        T = 1.0  
-        r = df_dtd['stock_return']
-        
-        df_dtd['naive_dtd'] = (
-            np.log((E + F) / F) + r - 0.5 * (df_dtd['naive_sigma_v'] ** 2) * T
-        ) / (df_dtd['naive_sigma_v'] * np.sqrt(T))
         
         return df_dtd
     
+    @staticmethod
+    def calculate_naive_distance_to_default_batch(E: np.ndarray, F: np.ndarray, sigma_E: np.ndarray,
+                                                  r: np.ndarray, T: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Naive σv and distance to default for whole arrays of firms at once
+        
+        Args:
+            E: Equity values
+            F: Debt face values
+            sigma_E: Equity volatilities
+            r: Stock returns over the previous year
+            T: Horizon in years
+            
+        Returns:
+            (naive_sigma_v, naive_dtd); NaN where F <= 0, E + F <= 0 or σv <= 0
+        """
+        if NUMBA_AVAILABLE:
+            return _naive_dtd_loop(*(np.asarray(x, dtype=np.float64) for x in (E, F, sigma_E, r)), float(T))
+        V = E + F
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Equation (1)
+            naive_sigma_v = (E / V) * sigma_E + (F / V) * (0.05 + 0.25 * sigma_E)
+            naive_dtd = (np.log(V / F) + r - 0.5 * naive_sigma_v ** 2 * T) / (naive_sigma_v * np.sqrt(T))
+        valid = (F > 0) & (V > 0)
+        naive_sigma_v = np.where(valid, naive_sigma_v, np.nan)
+        naive_dtd = np.where(valid & (naive_sigma_v > 0), naive_dtd, np.nan)
+        return naive_sigma_v, naive_dtd
+    
     def winsorize_variables(self, df: pd.DataFrame, exclude_cols: List[str] = None) -> pd.DataFrame:
         """
         Winsorize quantitative variables at specified level